@@ -0,0 +1,108 @@
+import argparse
+from backend.neo4j_backend import Neo4jBackend
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: Version 2 drops the unused ping epoch_ms property and its index
+# @Description: Schema bootstrap/migration, run after neo4j-admin import (and again after every further import).
+#   - uniqueness constraints on id for every Entity.* label
+#   - range indexes on DeliveryReport.date, TransponderPing.time and HarborReport.date
+#   - native date properties (day), with their indexes
+#   - a `Schema.Bootstrap` marker node; neo4j_backend.py uses the day keys once it exists
+# Every statement is idempotent, properties are only set where missing.
+# Usage: python -m backend.ETL_data.bootstrap_schema [--batch-size 10000]
+
+# ***************************************************************************************
+
+SCHEMA_VERSION = 2
+
+INDEXES = [
+    "CREATE INDEX delivery_report_date IF NOT EXISTS FOR (d:`Entity.Document.DeliveryReport`) ON (d.date)",
+    "CREATE INDEX delivery_report_day IF NOT EXISTS FOR (d:`Entity.Document.DeliveryReport`) ON (d.day)",
+    "CREATE INDEX transponder_ping_time IF NOT EXISTS FOR ()-[r:`Event.TransportEvent.TransponderPing`]-() ON (r.time)",
+    "CREATE INDEX transponder_ping_day IF NOT EXISTS FOR ()-[r:`Event.TransportEvent.TransponderPing`]-() ON (r.day)",
+    # epoch_ms of schema version 1 was never queried (ranges are on time, days on day)
+    "DROP INDEX transponder_ping_epoch IF EXISTS",
+    "CREATE INDEX harbor_report_date IF NOT EXISTS FOR ()-[r:`Event.HarborReport`]-() ON (r.date)",
+    "CREATE INDEX harbor_report_day IF NOT EXISTS FOR ()-[r:`Event.HarborReport`]-() ON (r.day)",
+    "CREATE INDEX rollup_daily_date IF NOT EXISTS FOR (r:`Rollup.Daily`) ON (r.date)",
+    "CREATE INDEX rollup_daily_city_date IF NOT EXISTS FOR (r:`Rollup.DailyCity`) ON (r.date)",
+    "CREATE INDEX rollup_daily_species_date IF NOT EXISTS FOR (r:`Rollup.DailySpecies`) ON (r.date)",
+]
+
+# Native date properties, only for well-formed values that are not converted yet
+# (toString() makes the same statements work on string and on typed date / time properties)
+DAY_KEYS = [
+    """
+    MATCH (d:`Entity.Document.DeliveryReport`)
+    WHERE d.day IS NULL AND toString(d.date) =~ '[0-9]{4}-[0-9]{2}-[0-9]{2}.*'
+    CALL { WITH d SET d.day = date(left(toString(d.date), 10)) } IN TRANSACTIONS OF $batch_size ROWS
+    """,
+    """
+    MATCH ()-[r:`Event.TransportEvent.TransponderPing`]->()
+    WHERE r.day IS NULL AND toString(r.time) =~ '[0-9]{4}-[0-9]{2}-[0-9]{2}T.*'
+    CALL { WITH r SET r.day = date(left(toString(r.time), 10)) } IN TRANSACTIONS OF $batch_size ROWS
+    """,
+    """
+    MATCH ()-[r:`Event.HarborReport`]->()
+    WHERE r.day IS NULL AND toString(r.date) =~ '[0-9]{4}-[0-9]{2}-[0-9]{2}.*'
+    CALL { WITH r SET r.day = date(left(toString(r.date), 10)) } IN TRANSACTIONS OF $batch_size ROWS
+    """,
+]
+
+# Removes the epoch_ms property written by schema version 1
+DROP_EPOCH_MS = """
+MATCH ()-[r:`Event.TransportEvent.TransponderPing`]->()
+WHERE r.epoch_ms IS NOT NULL
+CALL { WITH r REMOVE r.epoch_ms } IN TRANSACTIONS OF $batch_size ROWS
+"""
+
+MARK_BOOTSTRAPPED = """
+MERGE (m:`Schema.Bootstrap` {name: 'schema'})
+SET m.version = $version
+"""
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Uniqueness constraint on id per entity label (labels read from the database)
+
+def create_constraints(session):
+    labels = [record["label"] for record in session.run("CALL db.labels() YIELD label RETURN label")]
+    for label in labels:
+        if not label.startswith("Entity."):
+            continue
+        name = "unique_id_" + label.replace(".", "_").lower()
+        try:
+            session.run(f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:`{label}`) REQUIRE n.id IS UNIQUE").consume()
+        except Exception as e:
+            # Duplicate ids in the import leave the label without constraint, the rest still runs
+            print(f"Error creating constraint on {label}:", e)
+
+def bootstrap_schema(driver, batch_size=10000):
+    with driver.session() as session:
+        create_constraints(session)
+        for query in INDEXES:
+            session.run(query).consume()
+        session.run("CALL db.awaitIndexes(300)").consume()
+        # CALL {} IN TRANSACTIONS needs an auto-commit transaction, session.run is one
+        for query in DAY_KEYS:
+            session.run(query, batch_size=batch_size).consume()
+        session.run(DROP_EPOCH_MS, batch_size=batch_size).consume()
+        session.run(MARK_BOOTSTRAPPED, version=SCHEMA_VERSION).consume()
+    print(f"Schema bootstrap version {SCHEMA_VERSION} done")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create Neo4j constraints, indexes and native date keys after an import")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Rows per transaction when adding date keys")
+    args = parser.parse_args()
+    backend = Neo4jBackend()
+    try:
+        bootstrap_schema(backend.driver, batch_size=args.batch_size)
+    finally:
+        backend.close()
@@ -1,45 +1,284 @@
 # Create CSV files from json file, and import to neo4j using ne4j-admin
 # neo4j-admin database import full neo4j --nodes=import/nodes.csv --relationships=import/ relationships.csv --overwrite-destination
 
+import argparse
+import csv
 import json
-import pandas as pd
+import math
+import os
+import re
+from collections import Counter
+from backend.normalize import record_rejected
 
-# Load JSON-file
-with open(r'C:\RepositoryData\mc2.json', "r") as file:
-    data = json.load(file)
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-# Extract nodes
-nodes = pd.DataFrame(data["nodes"])
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Streaming conversion of a graph dump ({"nodes": [...], "links": [...]}) to nodes.csv and relationships.csv.
+# Nodes and links are parsed one at a time (ijson when installed, otherwise the incremental reader below) and written
+# in chunks, so memory stays flat as the dump grows. Each section is read twice: once for the union of its columns
+# (the CSV header), once to write the rows.
+# With --typed there is one file per node label and relationship type (neo4j-admin imports them in parallel) and
+# qty_tons, dwell, date and time get typed headers, so they are stored as float / date / localdatetime instead of strings.
+# Values that do not parse as their type are written as empty cells and reported per column (backend/normalize.py).
+# Usage: python -m backend.ETL_data.convert_json_to_csv mc2.json --output-dir import [--chunk-size 10000] [--typed]
 
-# Add :LABEL column if not existing
-if ':LABEL' not in nodes.columns:
-    nodes[':LABEL'] = nodes['type']  # Use 'type' column as :LABEL
+# ***************************************************************************************
 
-# Add :ID from id-column (if not already existing)
-if ':ID' not in nodes.columns:
-    nodes[':ID'] = nodes['id']  # :ID to id-column
+READ_SIZE = 1 << 20
+WHITESPACE = " \t\n\r"
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+LOCALDATETIME_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(:\d{2}(\.\d{1,9})?)?)(Z|[+-]\d{2}(:?\d{2})?)?")
 
-# Prepare columns in correct order
-nodes = nodes[[":ID", ":LABEL"] + [col for col in nodes.columns if col not in [":ID", ":LABEL"]]]
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Incremental reader of the top-level object, used when ijson is not installed.
+# Keeps a bounded text buffer and decodes one array element at a time with json.JSONDecoder.raw_decode;
+# top-level arrays that are not requested are streamed past the same way.
 
-# print out CSV
-nodes.to_csv("nodes.csv", index=False)
+class JsonArrayReader:
+    def __init__(self, file):
+        self.file = file
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
 
-# Extract relationes
-links = pd.DataFrame(data["links"])
+    def read_more(self):
+        chunk = self.file.read(READ_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
 
-# Add :TYPE column
-if ':TYPE' not in links.columns:
-    links[':TYPE'] = links['type']  # Use 'type' column as :TYPE
+    def peek(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read_more():
+                raise ValueError("Unexpected end of JSON input")
 
-# Create :START_ID och :END_ID (if not already existing)
-links[':START_ID'] = links['source']
-links[':END_ID'] = links['target']
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos} of the buffer, got '{self.buffer[self.pos]}'")
+        self.pos += 1
 
-# Prepare columns in correct order
-links = links[[":START_ID", ":END_ID", ":TYPE"] + [col for col in links.columns if col not in [":START_ID", ":END_ID", ":TYPE"]]]
+    def decode(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.read_more()
 
-# Print out CSV
-links.to_csv("relationships.csv", index=False)
+    def items(self):
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.decode()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
 
-print("JSON-converting to CSV done!")
+    def section(self, key):
+        self.expect("{")
+        if self.peek() == "}":
+            return
+        while True:
+            name = self.decode()
+            self.expect(":")
+            if self.peek() == "[":
+                for item in self.items():
+                    if name == key:
+                        yield item
+            else:
+                self.decode()
+            if name == key:
+                return
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("}")
+            return
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Records of one top-level array ("nodes" or "links") of the dump, one at a time
+
+def iter_section(path, key):
+    if ijson is not None:
+        with open(path, "rb") as file:
+            yield from ijson.items(file, key + ".item", use_float=True)
+    else:
+        with open(path, "r", encoding="utf-8") as file:
+            yield from JsonArrayReader(file).section(key)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Row mapping for neo4j-admin: nodes get :ID / :LABEL from id / type and links :START_ID / :END_ID / :TYPE
+# from source / target / type, unless the record already has them. Missing values are written as empty cells,
+# nested values as their Python text (as DataFrame.to_csv did).
+
+def node_row(record):
+    row = {":ID": record.get(":ID", record.get("id")), ":LABEL": record.get(":LABEL", record.get("type"))}
+    row.update(record)
+    return row
+
+def link_row(record):
+    row = {":START_ID": record.get("source"), ":END_ID": record.get("target"), ":TYPE": record.get(":TYPE", record.get("type"))}
+    row.update((key, value) for key, value in record.items() if key not in (":START_ID", ":END_ID"))
+    return row
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Typed columns of the --typed output. Values neo4j-admin cannot parse as the type raise ValueError;
+# cell() writes them as empty cells (no property), which the dashboard reads as a missing value just like the
+# untyped import, and counts them. Times with a UTC offset ("Z", "+02:00") keep their wall-clock time and drop
+# the offset, so they fall on the same day as in the untyped import (which compares the time text).
+
+def typed_float(value):
+    number = float(str(value).strip().replace(",", "."))
+    if not math.isfinite(number):
+        raise ValueError(f"not a finite number: {value}")
+    return str(number)
+
+def typed_date(value):
+    value = str(value).strip()
+    if not DATE_PATTERN.match(value):
+        raise ValueError(f"not a date: {value}")
+    return value[:10]
+
+def typed_localdatetime(value):
+    match = LOCALDATETIME_PATTERN.fullmatch(str(value).strip())
+    if match is None:
+        raise ValueError(f"not a local datetime: {value}")
+    return match.group(1)
+
+TYPED_COLUMNS = {
+    "qty_tons": ("float", typed_float),
+    "dwell": ("double", typed_float),
+    "date": ("date", typed_date),
+    "time": ("localdatetime", typed_localdatetime),
+}
+
+def header(column, typed):
+    return f"{column}:{TYPED_COLUMNS[column][0]}" if typed and column in TYPED_COLUMNS else column
+
+# rejected counts the typed values written as empty cells per column
+def cell(column, value, typed, rejected=None):
+    if value is None:
+        return ""
+    if typed and column in TYPED_COLUMNS:
+        try:
+            return TYPED_COLUMNS[column][1](value)
+        except ValueError:
+            if rejected is not None:
+                rejected[column] += 1
+            return ""
+    return str(value)
+
+def file_name(prefix, label):
+    return prefix + "_" + re.sub(r"[^\w.-]", "_", str(label)) + ".csv"
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Write one section to CSV: output_path(row) gives the file of a row, the header of each file is the
+# union of its rows' columns (first pass) and rows are written in chunks of chunk_size (second pass).
+# Returns the number of rows written per file; typed values that did not parse are reported with record_rejected.
+
+def convert_section(path, key, to_row, output_path, chunk_size=10000, typed=False):
+    columns = {}
+    for record in iter_section(path, key):
+        row = to_row(record)
+        columns.setdefault(output_path(row), {}).update(dict.fromkeys(row))
+    columns = {file_path: list(file_columns) for file_path, file_columns in columns.items()}
+
+    files, writers, chunks, counts = {}, {}, {}, {}
+    rejected = Counter()
+    try:
+        for file_path, file_columns in columns.items():
+            files[file_path] = open(file_path, "w", newline="", encoding="utf-8")
+            writers[file_path] = csv.writer(files[file_path], lineterminator="\n")
+            writers[file_path].writerow([header(column, typed) for column in file_columns])
+            chunks[file_path] = []
+            counts[file_path] = 0
+        for record in iter_section(path, key):
+            row = to_row(record)
+            file_path = output_path(row)
+            chunk = chunks[file_path]
+            chunk.append([cell(column, row.get(column), typed, rejected) for column in columns[file_path]])
+            if len(chunk) >= chunk_size:
+                writers[file_path].writerows(chunk)
+                counts[file_path] += len(chunk)
+                chunks[file_path] = []
+        for file_path, chunk in chunks.items():
+            writers[file_path].writerows(chunk)
+            counts[file_path] += len(chunk)
+    finally:
+        for file in files.values():
+            file.close()
+    for column, count in rejected.items():
+        record_rejected(f"{key}.{column}", {"invalid": count})
+    return counts
+
+def convert_json_to_csv(input_path, output_dir=".", chunk_size=10000, typed=False):
+    os.makedirs(output_dir, exist_ok=True)
+    if typed:
+        # One file per label / type, e.g. nodes_Entity.Vessel.FishingVessel.csv
+        node_path = lambda row: os.path.join(output_dir, file_name("nodes", row[":LABEL"]))
+        link_path = lambda row: os.path.join(output_dir, file_name("relationships", row[":TYPE"]))
+    else:
+        node_path = lambda row: os.path.join(output_dir, "nodes.csv")
+        link_path = lambda row: os.path.join(output_dir, "relationships.csv")
+    nodes = convert_section(input_path, "nodes", node_row, node_path, chunk_size, typed)
+    links = convert_section(input_path, "links", link_row, link_path, chunk_size, typed)
+    print(f"JSON-converting to CSV done! {sum(nodes.values())} nodes, {sum(links.values())} relationships in {output_dir}")
+    if typed:
+        print("neo4j-admin database import full neo4j "
+              + " ".join(f"--nodes={path}" for path in nodes) + " "
+              + " ".join(f"--relationships={path}" for path in links) + " --overwrite-destination")
+    return nodes, links
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a graph JSON dump to neo4j-admin import CSV files")
+    parser.add_argument("input", help="Graph JSON file, e.g. mc2.json")
+    parser.add_argument("--output-dir", default=".", help="Directory for nodes.csv and relationships.csv")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Rows written per chunk")
+    parser.add_argument("--typed", action="store_true", help="One file per label / type with typed qty_tons, dwell, date and time")
+    args = parser.parse_args()
+    convert_json_to_csv(args.input, args.output_dir, args.chunk_size, args.typed)
@@ -0,0 +1,170 @@
+import argparse
+from backend.neo4j_backend import Neo4jBackend
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: ETL stage materializing daily rollup nodes in Neo4j after an import.
+#   `Rollup.Daily`        {date, qty_tons, report_count, num_vessels, ping_count}
+#   `Rollup.DailyCity`    {date, city, qty_tons, report_count, num_vessels}
+#   `Rollup.DailySpecies` {date, fish, qty_tons, report_count}
+#   `Rollup.Coverage`     {name: 'daily', version, first_day, last_day}
+# qty_tons is normalized like backend/normalize.py (comma decimals, invalid and negative values count as 0),
+# num_vessels counts distinct vessels pinged from a location on that day.
+# Dates are read through toString(), so string and typed (convert_json_to_csv.py --typed) imports both work.
+# The refresh is incremental: only days from --since are rebuilt. By default that is the first day whose source
+# reports, quantities or pings differ from its rollup, so late and corrected rows are picked up on any day.
+# Coverage records the data version the rollups match (dataset_store.py falls back to the raw rows otherwise);
+# it is only stamped when no day differs after the rebuild.
+# Usage: python -m backend.ETL_data.daily_rollups [--since 2035-03-01 | --full]
+# (the local backend computes the same rollups when it loads the CSV snapshot)
+
+# ***************************************************************************************
+
+# First day whose report count, quantity or ping count in the source differs from its Rollup.Daily node,
+# including rollup days that no longer have source rows (None when every day matches)
+FIRST_CHANGED_DAY = """
+CALL {
+    MATCH (d:`Entity.Document.DeliveryReport`)
+    WHERE d.date IS NOT NULL
+    WITH left(toString(d.date), 10) AS day, toFloat(replace(toString(d.qty_tons), ',', '.')) AS qty
+    RETURN day, count(*) AS report_count, sum(CASE WHEN qty IS NULL OR qty < 0 THEN 0.0 ELSE qty END) AS qty_tons, 0 AS ping_count
+    UNION ALL
+    MATCH (start)-[p:`Event.TransportEvent.TransponderPing`]->(end)
+    WHERE p.time IS NOT NULL
+    AND (start:`Entity.Location.City` OR start:`Entity.Location.Point` OR start:`Entity.Location.Region`)
+    AND (end:`Entity.Vessel.FishingVessel` OR end:`Entity.Vessel.CargoVessel`)
+    RETURN left(toString(p.time), 10) AS day, 0 AS report_count, 0.0 AS qty_tons, count(*) AS ping_count
+    UNION ALL
+    MATCH (r:`Rollup.Daily`)
+    RETURN r.date AS day, 0 AS report_count, 0.0 AS qty_tons, 0 AS ping_count
+}
+WITH day, sum(report_count) AS report_count, sum(qty_tons) AS qty_tons, sum(ping_count) AS ping_count
+OPTIONAL MATCH (r:`Rollup.Daily` {date: day})
+WITH day, r, report_count, qty_tons, ping_count
+WHERE r IS NULL OR r.ping_count IS NULL OR r.report_count <> report_count OR r.ping_count <> ping_count
+OR abs(r.qty_tons - qty_tons) > 1e-6
+RETURN min(day) AS day
+"""
+
+MERGE_COVERAGE = """
+MERGE (c:`Rollup.Coverage` {name: 'daily'})
+"""
+
+# Stamped after every write, the version counts the rollup and coverage nodes
+STAMP_COVERAGE = """
+MATCH (r:`Rollup.Daily`)
+WITH min(r.date) AS first_day, max(r.date) AS last_day
+MATCH (c:`Rollup.Coverage` {name: 'daily'})
+SET c.version = $version, c.first_day = first_day, c.last_day = last_day
+"""
+
+DELETE_ROLLUPS = """
+MATCH (r)
+WHERE (r:`Rollup.Daily` OR r:`Rollup.DailyCity` OR r:`Rollup.DailySpecies`)
+AND ($since IS NULL OR r.date >= $since)
+DETACH DELETE r
+"""
+
+# Delivered quantity and report count per day
+DAILY_DELIVERIES = """
+MATCH (d:`Entity.Document.DeliveryReport`)
+WHERE d.date IS NOT NULL AND ($since IS NULL OR toString(d.date) >= $since)
+WITH left(toString(d.date), 10) AS day, toFloat(replace(toString(d.qty_tons), ',', '.')) AS qty
+WITH day, count(*) AS report_count, sum(CASE WHEN qty IS NULL OR qty < 0 THEN 0.0 ELSE qty END) AS qty_tons
+MERGE (r:`Rollup.Daily` {date: day})
+SET r.qty_tons = qty_tons, r.report_count = report_count, r.num_vessels = coalesce(r.num_vessels, 0),
+    r.ping_count = coalesce(r.ping_count, 0)
+"""
+
+# Distinct vessels pinged from a location per day, and the pings they were counted from
+DAILY_VESSELS = """
+MATCH (start)-[p:`Event.TransportEvent.TransponderPing`]->(end)
+WHERE p.time IS NOT NULL AND ($since IS NULL OR toString(p.time) >= $since)
+AND (start:`Entity.Location.City` OR start:`Entity.Location.Point` OR start:`Entity.Location.Region`)
+AND (end:`Entity.Vessel.FishingVessel` OR end:`Entity.Vessel.CargoVessel`)
+WITH left(toString(p.time), 10) AS day, count(DISTINCT end) AS num_vessels, count(*) AS ping_count
+MERGE (r:`Rollup.Daily` {date: day})
+SET r.num_vessels = num_vessels, r.ping_count = ping_count, r.qty_tons = coalesce(r.qty_tons, 0.0), r.report_count = coalesce(r.report_count, 0)
+"""
+
+# Delivered quantity and report count per day and city of arrival
+DAILY_CITY_DELIVERIES = """
+MATCH (d:`Entity.Document.DeliveryReport`)-[:`Event.Transaction`]->(c:`Entity.Location.City`)
+WHERE d.date IS NOT NULL AND ($since IS NULL OR toString(d.date) >= $since)
+WITH d, COLLECT(c.id)[0] AS city
+WITH left(toString(d.date), 10) AS day, city, toFloat(replace(toString(d.qty_tons), ',', '.')) AS qty
+WITH day, city, count(*) AS report_count, sum(CASE WHEN qty IS NULL OR qty < 0 THEN 0.0 ELSE qty END) AS qty_tons
+MERGE (r:`Rollup.DailyCity` {date: day, city: city})
+SET r.qty_tons = qty_tons, r.report_count = report_count, r.num_vessels = coalesce(r.num_vessels, 0)
+"""
+
+# Distinct vessels pinged from a city per day
+DAILY_CITY_VESSELS = """
+MATCH (c:`Entity.Location.City`)-[p:`Event.TransportEvent.TransponderPing`]->(end)
+WHERE p.time IS NOT NULL AND ($since IS NULL OR toString(p.time) >= $since)
+AND (end:`Entity.Vessel.FishingVessel` OR end:`Entity.Vessel.CargoVessel`)
+WITH left(toString(p.time), 10) AS day, c.id AS city, count(DISTINCT end) AS num_vessels
+MERGE (r:`Rollup.DailyCity` {date: day, city: city})
+SET r.num_vessels = num_vessels, r.qty_tons = coalesce(r.qty_tons, 0.0), r.report_count = coalesce(r.report_count, 0)
+"""
+
+# Delivered quantity and report count per day and fish
+DAILY_SPECIES_DELIVERIES = """
+MATCH (d:`Entity.Document.DeliveryReport`)-[:`Event.Transaction`]->(f:`Entity.Commodity.Fish`)
+WHERE d.date IS NOT NULL AND ($since IS NULL OR toString(d.date) >= $since)
+WITH d, COLLECT(f.id)[0] AS fish
+WITH left(toString(d.date), 10) AS day, fish, toFloat(replace(toString(d.qty_tons), ',', '.')) AS qty
+WITH day, fish, count(*) AS report_count, sum(CASE WHEN qty IS NULL OR qty < 0 THEN 0.0 ELSE qty END) AS qty_tons
+MERGE (r:`Rollup.DailySpecies` {date: day, fish: fish})
+SET r.qty_tons = qty_tons, r.report_count = report_count
+"""
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: Default since is the first changed day instead of the last rolled up day; stamps the coverage
+# @Description: Rebuild the rollups of every day from since on (all days when full), then stamp the coverage with
+# the data version of the backend if every day matches its source. Returns the number of days rebuilt.
+
+def refresh_daily_rollups(backend, since=None, full=False):
+    with backend.driver.session() as session:
+        session.run(MERGE_COVERAGE).consume()
+        if full:
+            since = None
+        elif since is None:
+            since = session.run(FIRST_CHANGED_DAY).single()["day"]
+            if since is None:
+                print("Daily rollups are up to date")
+
+        days = 0
+        if full or since is not None:
+            session.run(DELETE_ROLLUPS, since=since).consume()
+            for query in (DAILY_DELIVERIES, DAILY_VESSELS, DAILY_CITY_DELIVERIES, DAILY_CITY_VESSELS, DAILY_SPECIES_DELIVERIES):
+                session.run(query, since=since).consume()
+            days = session.run(
+                "MATCH (r:`Rollup.Daily`) WHERE $since IS NULL OR r.date >= $since RETURN count(r) AS days", since=since
+            ).single()["days"]
+            print(f"Daily rollups refreshed from {since or 'the first day'}: {days} days")
+
+        # An explicit --since after a changed day leaves that day stale: the coverage is cleared instead
+        stale = session.run(FIRST_CHANGED_DAY).single()["day"]
+        if stale is not None:
+            print(f"Daily rollups still differ from {stale}, run with --since {stale} or --full")
+        session.run(STAMP_COVERAGE, version=None if stale else backend.get_data_version()).consume()
+    return days
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Materialize daily rollup nodes in Neo4j")
+    parser.add_argument("--since", help="First day to rebuild (YYYY-MM-DD), default: the first day that changed")
+    parser.add_argument("--full", action="store_true", help="Rebuild every day")
+    args = parser.parse_args()
+    backend = Neo4jBackend()
+    try:
+        refresh_daily_rollups(backend, since=args.since, full=args.full)
+    finally:
+        backend.close()
@@ -0,0 +1,62 @@
+import argparse
+import time
+from backend.data_backend import TRANSACTION_TYPE, HARBOR_REPORT_TYPE
+from backend.event_snapshot import write_snapshot
+from backend.local_backend import LocalGraphBackend
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Export stage writing the columnar event snapshot (backend/event_snapshot.py) from the import CSV files:
+# DeliveryReports (with their city and fish), TransponderPings, HarborReports and Transactions partitioned by day,
+# plus the node table and the daily rollups. The dashboard reads it with DATA_BACKEND=snapshot.
+# Usage: python -m backend.ETL_data.export_snapshot --data-dir import --output-dir snapshot
+
+# ***************************************************************************************
+
+RELATIONSHIP_COLUMNS = [":START_ID", ":END_ID", "source", "target", "start_label", "end_label"]
+
+def _columns(df, columns):
+    return df[[column for column in columns if column in df.columns]]
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Write the snapshot of a loaded LocalGraphBackend, returns the manifest
+
+def export_snapshot(backend, output_dir):
+    reports = _columns(backend.delivery_reports, [":ID", "id", "date", "qty_tons"]).copy()
+    deliveries = backend.deliveries.set_index(":ID")
+    reports["city_of_arrival"] = reports[":ID"].map(deliveries["city_of_arrival"])
+    reports["fish_name"] = reports[":ID"].map(deliveries["fish_name"])
+    reports = reports.astype(object).where(reports.notna(), None)
+
+    empty = backend.pings.iloc[0:0]
+    events = {
+        "delivery_reports": (reports, "date"),
+        "transponder_pings": (_columns(backend.pings, RELATIONSHIP_COLUMNS + ["time", "dwell"]), "time"),
+        "harbor_reports": (_columns(backend.rels_by_type.get(HARBOR_REPORT_TYPE, empty), RELATIONSHIP_COLUMNS + ["date"]), "date"),
+        "transactions": (_columns(backend.rels_by_type.get(TRANSACTION_TYPE, empty), RELATIONSHIP_COLUMNS + ["date"]), "date"),
+    }
+    tables = {
+        "nodes": backend.nodes.drop(columns=["labels", "label"]).reset_index(drop=True),
+        "daily_rollups": backend.daily_rollups,
+        "daily_city_rollups": backend.daily_city_rollups,
+        "daily_species_rollups": backend.daily_species_rollups,
+    }
+    return write_snapshot(output_dir, events, tables)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the event tables to a day-partitioned Arrow snapshot")
+    parser.add_argument("--data-dir", help="Folder with the import CSV files (default: config.local_data_dir)")
+    parser.add_argument("--output-dir", required=True, help="Snapshot folder (config.snapshot_dir for the dashboard)")
+    args = parser.parse_args()
+    started = time.perf_counter()
+    manifest = export_snapshot(LocalGraphBackend(args.data_dir), args.output_dir)
+    for name, info in manifest["events"].items():
+        print(f"{name}: {info['rows']} rows in {len(info['days'])} day partitions")
+    print(f"Snapshot written to {args.output_dir} in {time.perf_counter() - started:.1f} s")
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import config
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Delivery-to-vessel attribution for get_fish_deliveries.
+# HarborReports (vessel -> city) and city TransponderPings (city -> vessel) are indexed once as (city, day) keys in a
+# sorted int64 array (city code * 2^32 + day number) with the vessels aligned. Each delivery is a hash lookup of its
+# city code plus two searchsorted calls for its day window, done for all deliveries at once.
+# Windows are day offsets [first, last] around the delivery day, by default the behaviour of the Cypher query:
+# harbor reports of the delivery day or the day after, pings of the delivery day.
+
+# ***************************************************************************************
+
+CITY_SHIFT = 2**32
+
+def day_numbers(values):
+    # 'YYYY-MM-DD...' -> days since 1970-01-01 (int64) and a mask of the values that parse (the others get day 0)
+    days = pd.to_datetime(pd.Series(values, dtype=object).str[:10], format="%Y-%m-%d", errors="coerce")
+    valid = days.notna().to_numpy()
+    return np.where(valid, days.to_numpy(dtype="datetime64[D]").astype(np.int64), 0), valid
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Vessels per (city, day) of one event kind, sorted by (city, day) and stable within a day,
+# so a window lists its vessels day by day in the order of the events
+
+class CityDayIndex:
+    def __init__(self, cities, days, vessels):
+        days, valid = day_numbers(days)
+        cities = pd.Series(cities, dtype=object).to_numpy()
+        valid &= pd.notna(cities)
+        codes, uniques = pd.factorize(cities[valid])
+        self.city_codes = {city: code for code, city in enumerate(uniques)}
+        keys = codes.astype(np.int64) * CITY_SHIFT + days[valid]
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.vessels = pd.Series(vessels, dtype=object).to_numpy()[valid][order]
+
+    # Vessel lists of the windows [day + first, day + last] of each (city, day)
+    def lookup(self, cities, days, valid, window):
+        codes = np.array([self.city_codes.get(city, -1) for city in cities], dtype=np.int64)
+        found = valid & (codes >= 0)
+        keys = codes * CITY_SHIFT + days
+        lo = np.where(found, np.searchsorted(self.keys, keys + window[0], side="left"), 0)
+        hi = np.where(found, np.searchsorted(self.keys, keys + window[1], side="right"), 0)
+        return [self.vessels[start:end].tolist() for start, end in zip(lo, hi)]
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Attribution index of harbor reports (columns source, target, date) and city pings
+# (columns source, target, time), as the relationships carry them
+
+class AttributionIndex:
+    def __init__(self, harbor, pings, harbor_window=None, ping_window=None):
+        self.harbor = CityDayIndex(harbor["target"], harbor["date"], harbor["source"])
+        self.pings = CityDayIndex(pings["source"], pings["time"], pings["target"])
+        self.harbor_window = harbor_window or config.attribution_harbor_window_days
+        self.ping_window = ping_window or config.attribution_ping_window_days
+
+    # harbor_vessels and ping_vessels lists for deliveries given by city of arrival and date
+    def attribute(self, cities, dates):
+        cities = pd.Series(cities, dtype=object).to_numpy()
+        days, valid = day_numbers(dates)
+        return self.harbor.lookup(cities, days, valid, self.harbor_window), self.pings.lookup(cities, days, valid, self.ping_window)
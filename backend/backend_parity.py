@@ -0,0 +1,93 @@
+import argparse
+import math
+import pandas as pd
+from backend.data_backend import create_backend, normalize_date_range
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Parity check between the Neo4j backend and the local in-memory backend.
+# Runs every DataBackend query against both and reports differences.
+# Usage: python -m backend.backend_parity --start 2035-01-01 --end 2035-02-28
+# tests/test_backends.py runs the same cases under pytest (Neo4j only when it is reachable, skipped otherwise).
+
+# ***************************************************************************************
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Bring results into a comparable form (row order and collected list order are not defined in Cypher)
+
+def canonical(value):
+    if isinstance(value, pd.DataFrame):
+        return canonical(value.to_dict("records"))
+    if isinstance(value, tuple):
+        return tuple(canonical(v) for v in value)
+    if isinstance(value, dict):
+        return {key: canonical(v) for key, v in value.items()}
+    if isinstance(value, list):
+        items = [canonical(v) for v in value]
+        return sorted(items, key=repr)
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: The queries compared by compare_backends, as (name, method, args)
+
+def parity_cases(start_date, end_date):
+    start_date, end_date = normalize_date_range(start_date, end_date)
+    return [
+        ("get_vessels", "get_vessels", {}),
+        ("get_cities", "get_cities", {}),
+        ("get_points", "get_points", {}),
+        ("get_species", "get_species", {}),
+        ("get_regions", "get_regions", {}),
+        ("get_companies", "get_companies", {}),
+        ("get_city_mapping", "get_city_mapping", {}),
+        ("get_fish_distribution_data", "get_fish_distribution_data", {}),
+        ("get_vessel_facet_pairs", "get_vessel_facet_pairs", {}),
+        ("get_vessel_species_pairs", "get_vessel_species_pairs", {}),
+        ("get_fish_deliveries", "get_fish_deliveries", {"start_date": start_date, "end_date": end_date}),
+        ("fetch_delivery_qty_data", "fetch_delivery_qty_data", {"start_date": start_date, "end_date": end_date}),
+        ("fetch_vessel_cargo_data", "fetch_vessel_cargo_data", {"start_date": start_date, "end_date": end_date}),
+        ("get_transport_movements", "get_transport_movements", {"start_date": start_date, "end_date": end_date}),
+        ("get_vessel_counts", "get_vessel_counts", {"start_date": start_date, "end_date": end_date}),
+    ]
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Run every query on both backends and return the names of the ones that differ
+
+def compare_backends(start_date, end_date, reference=None, candidate=None):
+    reference = reference or create_backend("neo4j")
+    candidate = candidate or create_backend("local")
+    mismatches = []
+    for name, method, kwargs in parity_cases(start_date, end_date):
+        expected = canonical(getattr(reference, method)(**kwargs))
+        actual = canonical(getattr(candidate, method)(**kwargs))
+        if expected == actual:
+            print(f"OK       {name}")
+        else:
+            print(f"MISMATCH {name}")
+            mismatches.append(name)
+    return mismatches
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the Neo4j and local data backends")
+    parser.add_argument("--start", default="2035-01-01")
+    parser.add_argument("--end", default="2035-02-28")
+    args = parser.parse_args()
+    failed = compare_backends(args.start, args.end)
+    raise SystemExit(1 if failed else 0)
@@ -0,0 +1,118 @@
+import argparse
+import time
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+from backend.dataserver import process_transport_movements
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Benchmark of the vectorized process_transport_movements against the previous row loop.
+# Checks that both give identical output, then times them on synthetic TransponderPing rows.
+# Usage: python -m backend.benchmark_transport_movements --rows 260000
+
+# ***************************************************************************************
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2024-12-10
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Previous implementation of process_transport_movements, kept as reference for the benchmark
+# @Description: Process data for heatmap visualizing dwell time per vessel at specific location at selected calendar_date intervall.
+
+def process_transport_movements_loop(df):
+    transport_movements = []
+    if not df.empty:
+        df['start_time'] = pd.to_datetime(df['start_time'], errors='coerce')
+
+        # Convert 'dwell' to numeric
+        df['dwell'] = pd.to_numeric(df['dwell'], errors='coerce')
+
+        # Calculate end_time
+        df['end_time'] = df['start_time'] + pd.to_timedelta(df['dwell'], unit='s')
+
+        for _, row in df.iterrows():
+            if pd.isna(row['start_time']) or pd.isna(row['end_time']):
+                continue
+            location_id = row['source_location']
+            vessel_id = row['vessel_id']
+            start_time = row['start_time']
+            end_time = row['end_time']
+
+            current_date = start_time
+            while current_date.date() <= end_time.date():
+                if current_date.date() == start_time.date():
+                    if current_date.date() == end_time.date():
+                        dwell = (end_time - start_time).total_seconds()
+                    else:
+                        dwell = (datetime.combine(current_date.date(), datetime.max.time()) - start_time).total_seconds()
+                elif current_date.date() == end_time.date():
+                    dwell = (end_time - datetime.combine(current_date.date(), datetime.min.time())).total_seconds()
+                else:
+                    dwell = 24 * 3600  # Full day in seconds
+
+                transport_movements.append({
+                    'date': current_date.strftime("%Y-%m-%d"),
+                    'location_id': location_id,
+                    'vessel_id': vessel_id,
+                    'type': 'transport',
+                    'dwell': dwell
+                })
+                current_date += timedelta(days=1)
+
+    return pd.DataFrame(transport_movements)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Synthetic rows shaped like get_transport_movements (string times and dwell as imported),
+# including edge cases: missing/invalid values, negative dwell, multi-day dwell and an end exactly at midnight
+
+def make_transport_rows(rows, seed=42):
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2035-01-01T00:00:00") + rng.integers(0, 120 * 86400 * 10**6, rows).astype("timedelta64[us]")
+    dwell = rng.exponential(20000, rows).round(6)
+    dwell[rng.random(rows) < 0.02] *= 20  # Some pings dwell several days
+    df = pd.DataFrame({
+        "source_location": rng.choice([f"City of {c}" for c in "ABCDE"] + ["Point1", "Cod Table"], rows),
+        "source_location_name": "",
+        "vessel_id": rng.choice([f"vessel{i:03d}" for i in range(200)], rows),
+        "vessel_name": "",
+        "vessel_type": "",
+        "start_time": np.datetime_as_string(start, unit="us").astype(object),
+        "dwell": dwell.astype(str).astype(object),
+    })
+    df.loc[df.index[:7], ["start_time", "dwell"]] = [
+        [None, "100"], ["2035-01-05T10:00:00.000000", None], ["not a time", "100"],
+        ["2035-01-05T10:00:00.000000", "-50000"], ["2035-01-05T23:00:00.000000", "3600"],
+        ["2035-01-05T10:00:00.000000", "abc"], ["2035-01-05T10:00:00.000000", "-0.0000015"],
+    ]
+    return df
+
+def run_benchmark(rows):
+    df = make_transport_rows(rows)
+
+    started = time.perf_counter()
+    expected = process_transport_movements_loop(df.copy())
+    loop_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = process_transport_movements(df.copy())
+    vectorized_seconds = time.perf_counter() - started
+
+    pd.testing.assert_frame_equal(result, expected, check_exact=True)
+    print(f"{rows} pings -> {len(result)} day rows, output identical")
+    print(f"row loop:   {loop_seconds:.3f} s")
+    print(f"vectorized: {vectorized_seconds:.3f} s ({loop_seconds / vectorized_seconds:.0f}x faster)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark process_transport_movements against the row loop")
+    parser.add_argument("--rows", type=int, default=260000)
+    args = parser.parse_args()
+    run_benchmark(args.rows)
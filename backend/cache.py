@@ -0,0 +1,171 @@
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+import pandas as pd
+from backend.data_backend import note_fetch_error, reset_fetch_error, fetch_error_noted
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: TTL + size bounded LRU result cache for the read functions in backend/dataserver.py
+
+# ***************************************************************************************
+
+# Every cache created by @cached, so they can be invalidated together after a data import
+_registry = {}
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Normalize an argument for the cache key.
+# Empty filters are the same as no filter and the order of selected values does not change the result.
+
+def normalize_arg(value):
+    if value is None or value == "" or (isinstance(value, (list, tuple, set)) and len(value) == 0):
+        return None
+    if isinstance(value, (list, tuple, set)):
+        return tuple(sorted((normalize_arg(v) for v in value), key=repr))
+    if isinstance(value, dict):
+        return tuple(sorted((k, normalize_arg(v)) for k, v in value.items()))
+    return value
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Hand out a copy so callers that add columns or items do not change the cached value
+
+def copy_result(value):
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(copy_result(v) for v in value)
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: One cache: ordered by recency, entries expire after ttl seconds, at most maxsize entries
+
+class ResultCache:
+    def __init__(self, name, ttl, maxsize):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.errors = 0  # Results not cached because their fetch failed
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires is None or expires > time.monotonic():
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self.entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        with self.lock:
+            expires = time.monotonic() + self.ttl if self.ttl else None
+            self.entries[key] = (expires, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "size": len(self.entries),
+                "maxsize": self.maxsize,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "errors": self.errors,
+            }
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Decorator caching a read function on its normalized arguments.
+# A result returned after a failed backend query (note_fetch_error) is handed out but not cached, so the next call
+# queries again; the flag is kept set for an enclosing cached function.
+
+def cached(ttl, maxsize):
+    def decorator(function):
+        signature = inspect.signature(function)
+        cache = ResultCache(function.__name__, ttl, maxsize)
+        _registry[function.__name__] = cache
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple((name, normalize_arg(value)) for name, value in bound.arguments.items())
+            found, value = cache.get(key)
+            if not found:
+                failed_before = fetch_error_noted()
+                reset_fetch_error()
+                value = function(*args, **kwargs)
+                if fetch_error_noted():
+                    cache.errors += 1
+                else:
+                    cache.put(key, value)
+                if failed_before:
+                    note_fetch_error()
+            return copy_result(value)
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Invalidation hook (call after a data import) and hit/miss statistics for all caches
+
+def register_cache(name, cache):
+    # Any object with clear() and stats() (backend/segment_cache.py)
+    _registry[name] = cache
+
+def invalidate_caches():
+    for cache in _registry.values():
+        cache.clear()
+
+def get_cache_stats():
+    return {name: cache.stats() for name, cache in _registry.items()}
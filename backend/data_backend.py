@@ -0,0 +1,201 @@
+import threading
+from datetime import datetime, timedelta
+import config
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Pluggable data backend behind backend/dataserver.py (live Neo4j or local in-memory graph snapshot)
+
+# ***************************************************************************************
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Labels and relationship types shared by every backend
+
+VESSEL_LABELS = ("Entity.Vessel.CargoVessel", "Entity.Vessel.FishingVessel")
+LOCATION_LABELS = ("Entity.Location.City", "Entity.Location.Point", "Entity.Location.Region")
+CITY_LABEL = "Entity.Location.City"
+POINT_LABEL = "Entity.Location.Point"
+REGION_LABEL = "Entity.Location.Region"
+FISH_LABEL = "Entity.Commodity.Fish"
+DELIVERY_REPORT_LABEL = "Entity.Document.DeliveryReport"
+TRANSACTION_TYPE = "Event.Transaction"
+HARBOR_REPORT_TYPE = "Event.HarborReport"
+TRANSPONDER_PING_TYPE = "Event.TransportEvent.TransponderPing"
+
+# Materialized daily rollups (backend/ETL_data/daily_rollups.py)
+DAILY_ROLLUP_LABEL = "Rollup.Daily"
+DAILY_CITY_ROLLUP_LABEL = "Rollup.DailyCity"
+DAILY_SPECIES_ROLLUP_LABEL = "Rollup.DailySpecies"
+ROLLUP_COVERAGE_LABEL = "Rollup.Coverage"
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Normalize a calendar-store date range to 'YYYY-MM-DD' with an exclusive upper bound
+
+def normalize_date_range(start_date, end_date):
+    # Ensure date-only format for start_date
+    if start_date:
+        start_date = datetime.strptime(start_date.split(" ")[0], '%Y-%m-%d').strftime('%Y-%m-%d')
+    if end_date:
+        # Add one day to make the range inclusive for the upper bound
+        end_date = datetime.strptime(end_date.split(" ")[0], '%Y-%m-%d') + timedelta(days=1)
+        end_date = end_date.strftime('%Y-%m-%d')
+    return start_date, end_date
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Per-thread flag set when a backend query fails and returns its empty fallback,
+# so callers that keep results (segment cache) can tell a failed fetch from a range without data
+
+_fetch_state = threading.local()
+
+def note_fetch_error():
+    _fetch_state.failed = True
+
+def reset_fetch_error():
+    _fetch_state.failed = False
+
+def fetch_error_noted():
+    return getattr(_fetch_state, "failed", False)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Interface implemented by every data backend.
+# Date arguments are already normalized by normalize_date_range (end date is exclusive).
+
+class DataBackend:
+    name = "base"
+
+    def get_vessels(self, company=None, city=None, port=None, region=None, species=None):
+        raise NotImplementedError
+
+    def get_cities(self, company=None, vessel=None, port=None, region=None, species=None):
+        raise NotImplementedError
+
+    def get_city_mapping(self):
+        raise NotImplementedError
+
+    def get_points(self, company=None, city=None, vessel=None, region=None, species=None):
+        raise NotImplementedError
+
+    def get_species(self, company=None, city=None, port=None, region=None, vessel=None):
+        raise NotImplementedError
+
+    def get_regions(self, company=None, city=None, port=None, vessel=None, species=None):
+        raise NotImplementedError
+
+    def get_companies(self, vessel=None, city=None, port=None, region=None, species=None):
+        raise NotImplementedError
+
+    def get_fish_distribution_data(self):
+        raise NotImplementedError
+
+    def get_fish_deliveries(self, start_date, end_date):
+        raise NotImplementedError
+
+    def fetch_delivery_qty_data(self, start_date, end_date):
+        # One row per day with reports: date, qty_tons (normalized and summed)
+        raise NotImplementedError
+
+    def fetch_vessel_cargo_data(self, start_date, end_date):
+        raise NotImplementedError
+
+    def get_transport_movements(self, start_date, end_date):
+        raise NotImplementedError
+
+    def get_vessel_counts(self, start_date, end_date):
+        # One row per day with pings: date, num_vessels (distinct vessels pinged from a location)
+        raise NotImplementedError
+
+    def iter_transport_movements(self, start_date, end_date, batch_size):
+        # get_transport_movements as DataFrames of at most batch_size rows, backends override it to stream
+        movements = self.get_transport_movements(start_date, end_date)
+        for i in range(0, len(movements), batch_size):
+            yield movements.iloc[i:i + batch_size]
+
+    def get_daily_rollups(self, start_date, end_date):
+        # One row per day: date, qty_tons, report_count, num_vessels
+        raise NotImplementedError
+
+    def get_daily_city_rollups(self, start_date, end_date):
+        # One row per (day, city): date, city, qty_tons, report_count, num_vessels
+        raise NotImplementedError
+
+    def get_daily_species_rollups(self, start_date, end_date):
+        # One row per (day, fish): date, fish, qty_tons, report_count
+        raise NotImplementedError
+
+    def get_rollup_coverage(self):
+        # {version, first_day, last_day}: data version the daily rollups were built from and the days they span,
+        # None when no rollups are materialized
+        raise NotImplementedError
+
+    def get_vessel_facet_pairs(self):
+        # Distinct (facet, vessel_id, value) rows linking vessels to companies, cities, ports and regions
+        raise NotImplementedError
+
+    def get_vessel_species_pairs(self):
+        # Distinct (vessel_id, fish) rows: vessels attributed to a delivery of the fish (as in get_fish_deliveries)
+        raise NotImplementedError
+
+    def get_data_version(self):
+        # Short string that changes whenever the underlying data is re-imported
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Create and hold the process-wide backend selected in config.data_backend
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def create_backend(kind=None, **kwargs):
+    kind = kind or config.data_backend
+    # Imported lazily so the local backend runs without the neo4j package or a database
+    if kind == "neo4j":
+        from backend.neo4j_backend import Neo4jBackend
+        return Neo4jBackend(**kwargs)
+    if kind == "local":
+        from backend.local_backend import LocalGraphBackend
+        return LocalGraphBackend(**kwargs)
+    if kind == "snapshot":
+        from backend.snapshot_backend import SnapshotBackend
+        return SnapshotBackend(**kwargs)
+    raise ValueError(f"Unknown data backend: {kind}")
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = create_backend()
+    return _backend
+
+def set_backend(backend):
+    # Swap the active backend (benchmarks, parity checks) and return the previous one
+    global _backend
+    with _backend_lock:
+        previous, _backend = _backend, backend
+    return previous
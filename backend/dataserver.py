@@ -1,6 +1,5 @@
 import os
 import json # used to get geo data
-from neo4j import GraphDatabase
 import networkx as nx
 import dash
 from dash import html, dcc
@@ -10,7 +9,6 @@ import geopandas as gpd
 from dash.dependencies import Input, Output
 import plotly.express as px
 import plotly.graph_objects as go
-from neo4j import GraphDatabase
 import pandas as pd
 from sklearn.cluster import KMeans
 from sklearn.preprocessing import LabelEncoder, StandardScaler
@@ -18,6 +16,12 @@ from sklearn.ensemble import IsolationForest
 import numpy as np
 import dash_cytoscape as cyto
 import logging 
+from backend.data_backend import get_backend, normalize_date_range
+from backend.query_builder import get_query_text_stats # re-exported for monitoring distinct vs repeated query texts
+from backend.cache import cached, invalidate_caches, get_cache_stats # invalidate_caches() after a data import
+from backend.segment_cache import SegmentCache
+from backend.normalize import normalize_qty_tons, normalize_dates, canonical_dates, get_rejected_counts # get_rejected_counts() for monitoring
+import config
 from shapely.geometry import Point, Polygon, MultiPolygon, shape
 from datetime import datetime, timedelta
 
@@ -35,6 +39,10 @@ from datetime import datetime, timedelta
 # @Date: 2024-11-08
 # @Last Modified by:   undefined
 # @Last Modified time: 2024-12-19
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Queries moved behind the pluggable backend (neo4j_backend.py / local_backend.py)
+# @Last Modified: Read functions cached with TTL/LRU eviction (cache.py)
 # @Description: Connection to Neo4j database, file paths and data fetching
 
 # Get project root map
@@ -45,11 +53,7 @@ file_path_geojson = os.path.join(base_dir,"backend", "ETL_data", "Oceanus Geogra
 # create filepath to Nodes json
 file_path_nodesjson = os.path.join(base_dir,"backend", "ETL_data", "Oceanus Geography Nodes.json")
 
-# Neo4j connection details
-uri = "bolt://localhost:7687"
-username = "neo4j"
-password = "asdf1234"
-driver = GraphDatabase.driver(uri, auth=(username, password))
+# Queries go through the backend selected in config.data_backend (see backend/data_backend.py)
 
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
@@ -59,43 +63,9 @@ driver = GraphDatabase.driver(uri, auth=(username, password))
 # @Description: get vessels for dropdown filter
 # 2024-01-05 Each dropdown dynamically updates based on selected values in other dropdowns. 
 
+@cached(ttl=config.dimension_cache_ttl_seconds, maxsize=config.dimension_cache_size)
 def get_vessels(company=None, city=None, port=None, region=None, species=None):
-    filters = []
-    if company:
-        if isinstance(company, list):
-            company_filter = ", ".join(f"'{c}'" for c in company)
-            filters.append(f"n.company IN [{company_filter}]")
-        else:
-            filters.append(f"n.company = '{company}'")
-    if city:
-        filters.append(f"n.city = '{city}'")
-    filter_query = " AND ".join(filters)
-    if port:
-        filters.append(f"n.port = '{port}'")
-    filter_query = " AND ".join(filters)
-    if region:
-        filters.append(f"n.region = '{region}'")
-    filter_query = " AND ".join(filters)
-    if species:
-        filters.append(f"n.species = '{species}'")
-    filter_query = " AND ".join(filters)
-    
-    
-    query = f"""
-    MATCH (n)
-    WHERE (n:`Entity.Vessel.CargoVessel` OR n:`Entity.Vessel.FishingVessel`)
-    {f'AND {filter_query}' if filters else ''}
-    RETURN n.id AS id
-    ORDER BY id
-    """
-    with driver.session() as session:
-        try:    
-            result = session.run(query)
-            ids = [record["id"] for record in result]  # extract id:n
-            return ids
-        except Exception as e:
-            print("Error fetching vessels:", e)
-            return []  # Return empty list in case of error
+    return get_backend().get_vessels(company=company, city=city, port=port, region=region, species=species)
 
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
@@ -105,38 +75,9 @@ def get_vessels(company=None, city=None, port=None, region=None, species=None):
 # @Description: get cities for dropdown filter
 # 2024-01-05 Each dropdown dynamically updates based on selected values in other dropdowns.
 
+@cached(ttl=config.dimension_cache_ttl_seconds, maxsize=config.dimension_cache_size)
 def get_cities(company=None, vessel=None, port=None, region=None, species=None):
-    filters = []
-    if company:
-        filters.append(f"n.company = '{company}'")
-    if vessel:
-        filters.append(f"n.vessel = '{vessel}'")
-    filter_query = " AND ".join(filters)
-    if port:
-        filters.append(f"n.port = '{port}'")
-    filter_query = " AND ".join(filters)
-    if region:
-        filters.append(f"n.region = '{region}'")
-    filter_query = " AND ".join(filters)
-    if species:
-        filters.append(f"n.species = '{species}'")
-    filter_query = " AND ".join(filters)
-    
-    query = f"""
-    MATCH (n)
-    WHERE n:`Entity.Location.City`
-    {f'AND {filter_query}' if filters else ''}    
-    RETURN n.id AS id
-    ORDER BY id
-    """
-    with driver.session() as session:
-        try: 
-            result = session.run(query)
-            ids = [record["id"] for record in result]  # Extract id:n
-            return ids
-        except Exception as e:
-            print("Error fetching cities:", e)
-            return []  # Return empty list in case of error
+    return get_backend().get_cities(company=company, vessel=vessel, port=port, region=region, species=species)
         
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
@@ -145,19 +86,9 @@ def get_cities(company=None, vessel=None, port=None, region=None, species=None):
 # @Last Modified time: 
 # @Description: create mapping between {name: id} for geojson and nodes json
         
+@cached(ttl=config.dimension_cache_ttl_seconds, maxsize=config.dimension_cache_size)
 def get_city_mapping():
-    query = """
-    MATCH (n:`Entity.Location.City`)
-    RETURN n.id AS id, n.Name AS name
-    """
-    with driver.session() as session:
-        try:
-            result = session.run(query)
-            mapping = {record["name"]: record["id"] for record in result}
-            return mapping
-        except Exception as e:
-            print("Error fetching city mapping:", e)
-            return {}  # Return empty dict on error
+    return get_backend().get_city_mapping()
         
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
@@ -167,38 +98,9 @@ def get_city_mapping():
 # @Description: get ports for dropdown filter
 # 2024-01-05 Each dropdown dynamically updates based on selected values in other dropdowns.
 
+@cached(ttl=config.dimension_cache_ttl_seconds, maxsize=config.dimension_cache_size)
 def get_points(company=None, city=None, vessel=None, region=None, species=None):
-    filters = []
-    if company:
-        filters.append(f"n.company = '{company}'")
-    if city:
-        filters.append(f"n.city = '{city}'")
-    filter_query = " AND ".join(filters)
-    if vessel:
-        filters.append(f"n.vessel = '{vessel}'")
-    filter_query = " AND ".join(filters)
-    if region:
-        filters.append(f"n.region = '{region}'")
-    filter_query = " AND ".join(filters)
-    if species:
-        filters.append(f"n.species = '{species}'")
-    filter_query = " AND ".join(filters)
-    
-    query = f"""
-    MATCH (n)
-    WHERE n:`Entity.Location.Point` 
-    {f'AND {filter_query}' if filters else ''}   
-    RETURN n.id AS id
-    ORDER BY id
-    """
-    with driver.session() as session:
-        try:
-            result = session.run(query)
-            ids = [record["id"] for record in result]  # Extract id:n
-            return ids
-        except Exception as e:
-            print("Error fetching ports:", e)
-            return []  # Return empty list in case of error
+    return get_backend().get_points(company=company, city=city, vessel=vessel, region=region, species=species)
         
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
@@ -208,38 +110,9 @@ def get_points(company=None, city=None, vessel=None, region=None, species=None):
 # @Description: get species for dropdown filter
 # 2024-01-05 Each dropdown dynamically updates based on selected values in other dropdowns.
 
+@cached(ttl=config.dimension_cache_ttl_seconds, maxsize=config.dimension_cache_size)
 def get_species(company=None, city=None, port=None, region=None, vessel=None):
-    filters = []
-    if company:
-        filters.append(f"n.company = '{company}'")
-    if city:
-        filters.append(f"n.city = '{city}'")
-    filter_query = " AND ".join(filters)
-    if port:
-        filters.append(f"n.port = '{port}'")
-    filter_query = " AND ".join(filters)
-    if region:
-        filters.append(f"n.region = '{region}'")
-    filter_query = " AND ".join(filters)
-    if vessel:
-        filters.append(f"n.vessel = '{vessel}'")
-    filter_query = " AND ".join(filters)
-    
-    query = f"""
-    MATCH (n)
-    WHERE n:`Entity.Commodity.Fish` 
-    {f'AND {filter_query}' if filters else ''}   
-    RETURN n.id AS id
-    ORDER BY id
-    """
-    with driver.session() as session:
-        try:
-            result = session.run(query)
-            ids = [record["id"] for record in result]  # Extract id:n
-            return ids
-        except Exception as e:
-            print("Error fetching species:", e)
-            return []  # Return empty list in case of error
+    return get_backend().get_species(company=company, city=city, port=port, region=region, vessel=vessel)
         
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
@@ -249,38 +122,9 @@ def get_species(company=None, city=None, port=None, region=None, vessel=None):
 # @Description: get regions for dropdown filter
 # 2024-01-05 Each dropdown dynamically updates based on selected values in other dropdowns.
          
+@cached(ttl=config.dimension_cache_ttl_seconds, maxsize=config.dimension_cache_size)
 def get_regions(company=None, city=None, port=None, vessel=None, species=None):
-    filters = []
-    if company:
-        filters.append(f"n.company = '{company}'")
-    if city:
-        filters.append(f"n.city = '{city}'")
-    filter_query = " AND ".join(filters)
-    if port:
-        filters.append(f"n.port = '{port}'")
-    filter_query = " AND ".join(filters)
-    if vessel:
-        filters.append(f"n.vessel = '{vessel}'")
-    filter_query = " AND ".join(filters)
-    if species:
-        filters.append(f"n.species = '{species}'")
-    filter_query = " AND ".join(filters)
-    
-    query = f"""
-    MATCH (n)
-    WHERE n:`Entity.Location.Region` 
-    {f'AND {filter_query}' if filters else ''}   
-    RETURN n.id AS id
-    ORDER BY id
-    """
-    with driver.session() as session:
-        try:
-            result = session.run(query)
-            ids = [record["id"] for record in result]  # Extract ID:n
-            return ids
-        except Exception as e:
-            print("Error fetching regions:", e)
-            return []  # Return empty list in case of error
+    return get_backend().get_regions(company=company, city=city, port=port, vessel=vessel, species=species)
         
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
@@ -290,43 +134,9 @@ def get_regions(company=None, city=None, port=None, vessel=None, species=None):
 # @Description: get companies for dropdown filter
 # 2024-01-05 Each dropdown dynamically updates based on selected values in other dropdowns.
          
+@cached(ttl=config.dimension_cache_ttl_seconds, maxsize=config.dimension_cache_size)
 def get_companies(vessel=None, city=None, port=None, region=None, species=None):
-    filters = []
-    if vessel:
-        if isinstance(vessel, list):
-            vessel_filter = ", ".join(f"'{v}'" for v in vessel)
-            filters.append(f"n.id IN [{vessel_filter}]")
-        else:
-            filters.append(f"n.id = '{vessel}'")
-    filter_query = " AND ".join(filters)
-    if city:
-        filters.append(f"n.city = '{city}'")
-    filter_query = " AND ".join(filters)
-    if port:
-        filters.append(f"n.port = '{port}'")
-    filter_query = " AND ".join(filters)
-    if region:
-        filters.append(f"n.region = '{region}'")
-    filter_query = " AND ".join(filters)
-    if species:
-        filters.append(f"n.species = '{species}'")
-    filter_query = " AND ".join(filters)
-    
-    query = f"""
-    MATCH (n)
-    WHERE (n:`Entity.Vessel.CargoVessel` OR n:`Entity.Vessel.FishingVessel`)
-    {f'AND {filter_query}' if filters else ''}
-    RETURN DISTINCT n.company AS company
-    ORDER BY company
-    """
-    with driver.session() as session:
-        try:
-            result = session.run(query)
-            ids = [record["company"] for record in result]  # Extract company as id:n
-            return ids
-        except Exception as e:
-            print("Error fetching regions:", e)
-            return []  # Return empty list in case of error
+    return get_backend().get_companies(vessel=vessel, city=city, port=port, region=region, species=species)
         
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
@@ -335,93 +145,48 @@ def get_companies(vessel=None, city=None, port=None, region=None, species=None):
 # @Last Modified time: 2025-03-04
 # @Description: Fetches the data for the treemap visualization
 
+@cached(ttl=config.dimension_cache_ttl_seconds, maxsize=config.dimension_cache_size)
 def get_fish_distribution_data():
-    with driver.session() as session:
-        try:
-            query = """
-            MATCH (l:`Entity.Location.Region`)
-            WITH l, 
-                [f IN split(replace(replace(l.fish_species_present, "[", ""), "]", ""), ",") | trim(replace(f, "'", ""))] AS fish_list
-            RETURN l.id AS location, l.kind AS type, fish_list AS fish_species_present
-            """
-            result = session.run(query)
-            data = [record.data() for record in result]
-            
-            # Ensure fish_species_present is always a list
-            for location in data:
-                if isinstance(location["fish_species_present"], str):
-                    location["fish_species_present"] = [
-                        fish.strip().replace("'", "") 
-                        for fish in location["fish_species_present"].strip("[]").split(",")
-                    ]
-            
-            return data
-        except Exception as e:
-            print("Error fetching fish distribution data:", e)
-            return []
+    return get_backend().get_fish_distribution_data()
     
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Version of the loaded data, part of the key of the processed dataset store
+
+@cached(ttl=config.dimension_cache_ttl_seconds, maxsize=1)
+def get_data_version():
+    return get_backend().get_data_version()
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Day segment caches of the date range queries (backend/segment_cache.py),
+# keyed on the date property each query filters on
+
+fish_delivery_segments = SegmentCache("get_fish_deliveries", "date_of_arrival", frame=False)
+delivery_qty_segments = SegmentCache("fetch_delivery_qty_data", "date", frame=False)
+transport_segments = SegmentCache("get_transport_movements", "start_time", frame=True)
+vessel_count_segments = SegmentCache("get_vessel_counts", "date", frame=True)
+
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
 # @Date: 2025-01-18
 # @Last Modified by:   undefined
 # @Last Modified time: 2025-01-18
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Only the days missing from its segment cache are queried (backend/segment_cache.py)
 # @Description: Fetch fish deliveries from the database for Network-Link graph (pyvis)
 
+@cached(ttl=config.range_cache_ttl_seconds, maxsize=config.range_cache_size)
 def get_fish_deliveries(start_date, end_date):
-
-    # Ensure date-only format for start_date
-    if start_date:
-        start_date = datetime.strptime(start_date.split(" ")[0], '%Y-%m-%d').strftime('%Y-%m-%d')
-    if end_date:
-        # Add one day to make the range inclusive for the upper bound
-        end_date = datetime.strptime(end_date.split(" ")[0], '%Y-%m-%d') + timedelta(days=1)
-        end_date = end_date.strftime('%Y-%m-%d')
-   
-    with driver.session() as session:
-        try:
-            query = """
-            MATCH 
-            (cargo:`Entity.Document.DeliveryReport`)-[:`Event.Transaction`]->(targetEntity)
-            WHERE 
-            ((cargo.date >= $start_date OR $start_date IS NULL) AND (cargo.date < $end_date OR $end_date IS NULL)) AND
-            (targetEntity:`Entity.Commodity.Fish` OR targetEntity:`Entity.Location.City`)
-            WITH 
-            cargo, 
-            cargo.id AS deliveryreport_name,
-            COLLECT(CASE WHEN targetEntity:`Entity.Location.City` THEN targetEntity.id ELSE null END)[0] AS city_of_arrival,
-            COLLECT(CASE WHEN targetEntity:`Entity.Commodity.Fish` THEN targetEntity.id ELSE null END)[0] AS fish_name,
-            cargo.date AS date_of_arrival,
-            cargo.qty_tons AS qty_tons
-            OPTIONAL MATCH 
-            (vessel)-[harbor:`Event.HarborReport`]->(city:`Entity.Location.City`)
-            WHERE
-            (vessel:`Entity.Vessel.FishingVessel` OR vessel:`Entity.Vessel.CargoVessel`) AND
-            harbor.target = city_of_arrival AND
-            (date(cargo.date) = date(harbor.date) OR date(cargo.date) + duration('P1D') = date(harbor.date))
-            WITH
-            cargo, deliveryreport_name, date_of_arrival, city_of_arrival, fish_name, qty_tons,
-            COLLECT(harbor.source) AS harbor_vessels
-            OPTIONAL MATCH 
-                (city:`Entity.Location.City`)-[ping:`Event.TransportEvent.TransponderPing`]->(vessel)
-            WHERE
-                (vessel:`Entity.Vessel.FishingVessel` OR vessel:`Entity.Vessel.CargoVessel`) AND
-                ping.source = city_of_arrival AND
-                (date(cargo.date) = date(substring(ping.time, 0, 10)))
-            WITH
-            cargo, deliveryreport_name, date_of_arrival, city_of_arrival, fish_name, qty_tons, harbor_vessels,
-            COLLECT(ping.target) AS ping_vessels
-            RETURN 
-            deliveryreport_name, date_of_arrival, city_of_arrival, fish_name, qty_tons,
-            harbor_vessels, ping_vessels
-        
-        """
-            result = session.run(query, start_date=start_date, end_date=end_date)
-            data = [record.data() for record in result]
-            # print("Fetched fish delivery data:", data)  # Add for testing output
-            return data
-        except Exception as e:
-            print("Error fetching delivery data:", e)
-            return []  # Return empty list in case of error
+    start_date, end_date = normalize_date_range(start_date, end_date)
+    return fish_delivery_segments.fetch(get_backend().get_fish_deliveries, start_date, end_date, get_data_version())
         
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
@@ -439,35 +204,25 @@ def ensure_list(item):
 # @Date: 2025-01-18
 # @Last Modified by:   undefined
 # @Last Modified time: 2025-01-18
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: qty_tons and date_of_arrival normalized on whole columns (backend/normalize.py)
 # @Description: Process fish deliveries from the database for Network-Link graph (pyvis)
 
 def process_fish_deliveries(raw_data):
+    # Normalize qty_tons and dates column-wise (backend/normalize.py)
+    quantities = normalize_qty_tons([record.get("qty_tons", "0") for record in raw_data]).tolist()
+    dates = canonical_dates([record.get("date_of_arrival") for record in raw_data], field="date_of_arrival").tolist()
+
     processed_data = []
-    for record in raw_data:
-        qty_tons = record.get("qty_tons", "0")  # Default to "0" if missing
-        
-        # Normalize the qty_tons value
-        try:
-            # Replace comma with a dot for decimal parsing
-            qty_tons = qty_tons.replace(",", ".") if isinstance(qty_tons, str) else qty_tons
-            # Convert to float
-            qty_tons = float(qty_tons)
-        except (ValueError, AttributeError):
-            # Handle any unexpected format
-            qty_tons = 0.0
-            
-        # Ensure no negative weights
-        if qty_tons < 0:
-            print(f"Warning: Negative qty_tons value encountered ({qty_tons}). Setting to 0.")
-            qty_tons = 0.0
-            
+    for record, qty_tons, date_of_arrival in zip(raw_data, quantities, dates):
         # Use ensure_list to avoid double-wrapping
         harbor_vessels = ensure_list(record.get("harbor_vessels", "Unknown"))
         ping_vessels = ensure_list(record.get("ping_vessels", "Unknown"))
         
-        processed_record = {
+        processed_data.append({
             "delivery_report_name": record.get("deliveryreport_name", "Unknown"),
-            "date_of_arrival": record.get("date_of_arrival"),
+            "date_of_arrival": date_of_arrival,
             "city_of_arrival": record.get("city_of_arrival", "Unknown"),
             "fish_name": record.get("fish_name", "Unknown"),
             "quantity_tons": qty_tons, # Normalized value
@@ -475,15 +230,7 @@ def process_fish_deliveries(raw_data):
             # Wrap these in lists for multiple values later on.
             "harbor_vessels": harbor_vessels,
             "ping_vessels": ping_vessels,
-        }
-        # Ensure date format consistency if needed
-        if processed_record["date_of_arrival"]:
-            processed_record["date_of_arrival"] = datetime.strptime(
-                processed_record["date_of_arrival"], "%Y-%m-%d"
-            ).strftime("%Y-%m-%d")
-        processed_data.append(processed_record)
-        
-        #print("processed fish delivery data:", processed_data)  # Add for testing output
+        })
     return processed_data
         
 # @Author: Nupur Mittal
@@ -495,33 +242,15 @@ def process_fish_deliveries(raw_data):
 # @Last Modified by:   Asta Omarsdottir
 # @Last Modified time: 2025-03-01
 # @Last Modified: Added dates
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Only the days missing from its segment cache are queried (backend/segment_cache.py)
 # @Description: Get data from DeliveryReport to analyse fish quantity and seasonal trends in temporal and seasonal graph
         
+@cached(ttl=config.range_cache_ttl_seconds, maxsize=config.range_cache_size)
 def fetch_delivery_qty_data(start_date, end_date):
-
-    # Ensure date-only format for start_date
-    if start_date:
-        start_date = datetime.strptime(start_date.split(" ")[0], '%Y-%m-%d').strftime('%Y-%m-%d')
-    if end_date:
-        # Add one day to make the range inclusive for the upper bound
-        end_date = datetime.strptime(end_date.split(" ")[0], '%Y-%m-%d') + timedelta(days=1)
-        end_date = end_date.strftime('%Y-%m-%d')
-
-    with driver.session() as session:
-        try:
-            query = """
-            MATCH (d:`Entity.Document.DeliveryReport`)
-            WHERE (d.date >= $start_date OR $start_date IS NULL)
-            AND (d.date < $end_date OR $end_date IS NULL)
-            RETURN d.date AS date, d.qty_tons AS qty_tons
-            """
-            result = session.run(query, start_date=start_date, end_date=end_date)
-            data = [record.data() for record in result]
-            
-            return data
-        except Exception as e:
-            print("Error fetching delivery qty data:", e)
-            return []  # Return empty list in case of error
+    start_date, end_date = normalize_date_range(start_date, end_date)
+    return delivery_qty_segments.fetch(get_backend().fetch_delivery_qty_data, start_date, end_date, get_data_version())
         
 # @Author: Nupur Mittal
 # @Email: nupurmittal5@gmail.com
@@ -531,36 +260,10 @@ def fetch_delivery_qty_data(start_date, end_date):
 # @Last Modified: Moved from matching vessel cargo.py with some changes
 # @Description: Get data from DeliveryReport and TransponderPing to analyse vessel, cargo data in for cluster-plot graph
 
+@cached(ttl=config.range_cache_ttl_seconds, maxsize=config.range_cache_size)
 def fetch_vessel_cargo_data(start_date, end_date):
-         # Ensure date-only format for start_date
-    if start_date:
-        start_date = datetime.strptime(start_date.split(" ")[0], '%Y-%m-%d').strftime('%Y-%m-%d')
-    if end_date:
-        # Add one day to make the range inclusive for the upper bound
-        end_date = datetime.strptime(end_date.split(" ")[0], '%Y-%m-%d') + timedelta(days=1)
-        end_date = end_date.strftime('%Y-%m-%d')
-    
-    with driver.session() as session:
-        try:
-            delivery_result = session.run("""
-            MATCH (d:`Entity.Document.DeliveryReport`)
-            WHERE d.date >= $start_date AND d.date < $end_date
-            RETURN d.date AS delivery_date, d.qty_tons AS qty_tons
-            """, start_date=start_date, end_date=end_date)
-            
-            exit_result = session.run("""
-            MATCH p=()-[e:`Event.TransportEvent.TransponderPing`]->()
-            WHERE e.time >= $start_date AND e.time < $end_date
-            RETURN e.time AS exit_date, e.target AS vessel_id
-            """, start_date=start_date, end_date=end_date)
-            
-            deliveries = pd.DataFrame(delivery_result.data())
-            exits = pd.DataFrame(exit_result.data())
-            # print("Fetched vessel cargo data:", deliveries, exits)  # Debug
-            return deliveries, exits
-        except Exception as e:
-            print("Error fetching vessel cargo data:", e)
-            return []  # Return empty list in case of error
+    start_date, end_date = normalize_date_range(start_date, end_date)
+    return get_backend().fetch_vessel_cargo_data(start_date, end_date)
         
 # @Author: Nupur Mittal
 # @Email: nupurmittal5@gmail.com
@@ -635,6 +338,34 @@ def preprocess_vessel_cargo_data(deliveries, exits, threshold_hours=24):
         return []  # Return empty list in case of error
     
         
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Materialized daily rollups (backend/ETL_data/daily_rollups.py): a few hundred rows per range
+# instead of every DeliveryReport and ping timestamp
+
+@cached(ttl=config.range_cache_ttl_seconds, maxsize=config.range_cache_size)
+def get_daily_rollups(start_date, end_date):
+    start_date, end_date = normalize_date_range(start_date, end_date)
+    return get_backend().get_daily_rollups(start_date, end_date)
+
+@cached(ttl=config.range_cache_ttl_seconds, maxsize=config.range_cache_size)
+def get_daily_city_rollups(start_date, end_date):
+    start_date, end_date = normalize_date_range(start_date, end_date)
+    return get_backend().get_daily_city_rollups(start_date, end_date)
+
+@cached(ttl=config.range_cache_ttl_seconds, maxsize=config.range_cache_size)
+def get_daily_species_rollups(start_date, end_date):
+    start_date, end_date = normalize_date_range(start_date, end_date)
+    return get_backend().get_daily_species_rollups(start_date, end_date)
+
+# Data version and days of the last rollup refresh, checked against get_data_version before the rollups are used
+@cached(ttl=config.dimension_cache_ttl_seconds, maxsize=1)
+def get_rollup_coverage():
+    return get_backend().get_rollup_coverage()
+
 # @Author: Nupur Mittal
 # @Email: nupurmittal5@gmail.com
 # @Date: 2024-11-15
@@ -644,6 +375,9 @@ def preprocess_vessel_cargo_data(deliveries, exits, threshold_hours=24):
 # @Last Modified by:   Asta Omarsdottir 
 # @Last Modified time: 2025-03-02
 # @Last Modified: prepares the temporal data by combining the delivery_qty_data and vessel_count_data
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: qty_tons and dates normalized column-wise instead of the iterrows loop (backend/normalize.py)
 # @Description: Prepares temporal data for analysing fish quantity and seasonal trends
 
 def prepare_temporal_dataframe(delivery_qty_data, vessel_count_data):
@@ -654,41 +388,17 @@ def prepare_temporal_dataframe(delivery_qty_data, vessel_count_data):
 
         # Convert 'date' in delivery data
         if 'date' in delivery_df.columns:
-            delivery_df['date'] = pd.to_datetime(delivery_df['date'], format="mixed", errors="coerce")
+            delivery_df['date'] = normalize_dates(delivery_df['date'])
             delivery_df = delivery_df.dropna(subset=['date'])
             
         # Ensure 'qty_tons' exists in delivery_df and handle it
         if 'qty_tons' in delivery_df.columns:
-            # Normalize qty_tons (check and process each row)
-            for index, row in delivery_df.iterrows():
-                qty_tons = row['qty_tons']
-                
-                # Handle missing or incorrect 'qty_tons'
-                if pd.isna(qty_tons):  # If missing, set to 0
-                    qty_tons = 0.0
-                
-                try:
-                    # If it's a string, replace comma with a dot for decimal parsing
-                    if isinstance(qty_tons, str):
-                        qty_tons = qty_tons.replace(",", ".")
-                    
-                    # Convert to float
-                    qty_tons = float(qty_tons)
-                except (ValueError, AttributeError):
-                    # Handle any unexpected format, set to 0
-                    qty_tons = 0.0
-                    
-                # Ensure no negative values
-                if qty_tons < 0:
-                    print(f"Warning: Negative qty_tons value encountered ({qty_tons}). Setting to 0.")
-                    qty_tons = 0.0
-
-                # Update the DataFrame with the processed qty_tons value
-                delivery_df.at[index, 'qty_tons'] = qty_tons
+            # Comma decimals parsed, missing/invalid/negative values set to 0 (backend/normalize.py)
+            delivery_df['qty_tons'] = normalize_qty_tons(delivery_df['qty_tons'])
             
         # Convert 'date/timestamp' in vessel data
         if 'date' in vessel_df.columns:
-            vessel_df['date'] = pd.to_datetime(vessel_df['date'], format="mixed", errors="coerce")
+            vessel_df['date'] = normalize_dates(vessel_df['date'], field="vessel_count_date")
             vessel_df = vessel_df.dropna(subset=['date'])
             
          # Drop rows with missing values in the 'num_vessels' column
@@ -820,44 +530,15 @@ def get_geo_data():
 # @Date: 2024-12-10
 # @Last Modified by:   undefined
 # @Last Modified time: 2024-12-19
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Only the days missing from its segment cache are queried (backend/segment_cache.py)
 # @Description: Fetch data for heatmap visualizing dwell time in locations over time
 
+@cached(ttl=config.range_cache_ttl_seconds, maxsize=config.range_cache_size)
 def get_transport_movements(start_date, end_date):
-     # Ensure date-only format for start_date
-    if start_date:
-        start_date = datetime.strptime(start_date.split(" ")[0], '%Y-%m-%d').strftime('%Y-%m-%d')
-    if end_date:
-        # Add one day to make the range inclusive for the upper bound
-        end_date = datetime.strptime(end_date.split(" ")[0], '%Y-%m-%d') + timedelta(days=1)
-        end_date = end_date.strftime('%Y-%m-%d')
-    
-    query = """
-    MATCH (start)-[r:`Event.TransportEvent.TransponderPing`]->(end)
-    WHERE 
-        ((r.time >= $start_date OR $start_date IS NULL) AND (r.time < $end_date OR $end_date IS NULL))
-        AND (start:`Entity.Location.City` OR 
-        start:`Entity.Location.Point` OR 
-        start:`Entity.Location.Region`) AND 
-        (end:`Entity.Vessel.FishingVessel` OR end:`Entity.Vessel.CargoVessel`)
-    RETURN 
-        start.id AS source_location, 
-        start.Name AS source_location_name,
-        end.id AS vessel_id, 
-        end.Name AS vessel_name,
-        labels(end) AS vessel_type,
-        r.time AS start_time, 
-        r.dwell AS dwell
-    """
-    with driver.session() as session:
-        try:
-            result = session.run(query, start_date=start_date, end_date=end_date)
-            transport_events = [record.data() for record in result]
-            df = pd.DataFrame(transport_events) if transport_events else pd.DataFrame()
-            return df
-        except Exception as e:
-            # Handle errors gracefully and return an empty DataFrame
-            print("Error fetching transport data:", e)
-            return pd.DataFrame()
+    start_date, end_date = normalize_date_range(start_date, end_date)
+    return transport_segments.fetch(get_backend().get_transport_movements, start_date, end_date, get_data_version())
                 
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
@@ -865,87 +546,109 @@ def get_transport_movements(start_date, end_date):
 # @Last Modified by:   undefined
 # @Last Modified time: 2024-12-19
 # @Last Modified time: 2025-02-28
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Day splitting vectorized (repeat counts and day offsets) instead of iterrows, same output
+# (python -m backend.benchmark_transport_movements compares it with the row loop)
 # @Description: Process data for heatmap visualizing dwell time per vessel at specific location at selected calendar_date intervall.
 
 def process_transport_movements(df):
-    transport_movements = []
-    if not df.empty:
-        df['start_time'] = pd.to_datetime(df['start_time'], errors='coerce')
-        
-        # Convert 'dwell' to numeric
-        df['dwell'] = pd.to_numeric(df['dwell'], errors='coerce')
-        
-        # Calculate end_time
-        df['end_time'] = df['start_time'] + pd.to_timedelta(df['dwell'], unit='s')
+    if df.empty:
+        return pd.DataFrame()
 
-        for _, row in df.iterrows():
-            if pd.isna(row['start_time']) or pd.isna(row['end_time']):
+    df['start_time'] = pd.to_datetime(df['start_time'], errors='coerce')
+    
+    # Convert 'dwell' to numeric
+    df['dwell'] = pd.to_numeric(df['dwell'], errors='coerce')
+    
+    # Calculate end_time
+    df['end_time'] = df['start_time'] + pd.to_timedelta(df['dwell'], unit='s')
+
+    # Skip pings without a valid start or end time
+    rows = df[df['start_time'].notna() & df['end_time'].notna()]
+    start_time = rows['start_time'].to_numpy(dtype='datetime64[ns]')
+    end_time = rows['end_time'].to_numpy(dtype='datetime64[ns]')
+    start_day = start_time.astype('datetime64[D]')
+    end_day = end_time.astype('datetime64[D]')
+
+    # One output row per calendar day touched by [start_time, end_time]
+    day_counts = np.maximum((end_day - start_day).astype(np.int64) + 1, 0)
+    total = int(day_counts.sum())
+    if total == 0:
+        return pd.DataFrame()
+    row_index = np.repeat(np.arange(len(rows)), day_counts)
+    day_offset = np.arange(total) - np.repeat(np.cumsum(day_counts) - day_counts, day_counts)
+    day = start_day[row_index] + day_offset.astype('timedelta64[D]')
+    day_start = day.astype('datetime64[ns]')
+    start_time = start_time[row_index]
+    end_time = end_time[row_index]
+    is_first = day == start_day[row_index]
+    is_last = day == end_day[row_index]
+
+    # First day runs until 23:59:59.999999, last day from midnight, days in between are full days
+    end_of_day = day_start + np.timedelta64(86400 * 10**6 - 1, 'us')
+    dwell = np.where(
+        is_first & is_last, end_time - start_time,
+        np.where(is_first, end_of_day - start_time,
+                 np.where(is_last, end_time - day_start, np.timedelta64(86400, 's')))
+    )
+    # Seconds the way Timedelta.total_seconds() gives them per row (whole microseconds, floored)
+    whole_seconds, microseconds = np.divmod(dwell.astype('timedelta64[ns]').astype(np.int64) // 1000, 10**6)
+
+    return pd.DataFrame({
+        'date': np.datetime_as_string(day, unit='D').astype(object),
+        'location_id': rows['source_location'].to_numpy()[row_index],
+        'vessel_id': rows['vessel_id'].to_numpy()[row_index],
+        'type': 'transport',
+        'dwell': whole_seconds + microseconds / 10**6
+    })
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Bounded memory variant of process_transport_movements(get_transport_movements(...)) for wide ranges.
+# Pings are consumed in batches of batch_size, each batch is split into days and folded into a running
+# dwell sum per (date, location_id, vessel_id), so memory depends on that aggregate, not on the number of pings.
+# The heatmap sums dwell per date and location, so it is the same as with the per-ping rows.
+
+def stream_transport_movements(start_date, end_date, batch_size=None):
+    start_date, end_date = normalize_date_range(start_date, end_date)
+    batch_size = batch_size or config.transport_stream_batch_size
+    keys = ['date', 'location_id', 'vessel_id']
+    aggregate = None
+    try:
+        for batch in get_backend().iter_transport_movements(start_date, end_date, batch_size):
+            movements = process_transport_movements(batch)
+            if movements.empty:
                 continue
-            location_id = row['source_location']
-            vessel_id = row['vessel_id']
-            start_time = row['start_time']
-            end_time = row['end_time']
-
-            current_date = start_time
-            while current_date.date() <= end_time.date():
-                if current_date.date() == start_time.date():
-                    if current_date.date() == end_time.date():
-                        dwell = (end_time - start_time).total_seconds()
-                    else:
-                        dwell = (datetime.combine(current_date.date(), datetime.max.time()) - start_time).total_seconds()
-                elif current_date.date() == end_time.date():
-                    dwell = (end_time - datetime.combine(current_date.date(), datetime.min.time())).total_seconds()
-                else:
-                    dwell = 24 * 3600  # Full day in seconds
-
-                transport_movements.append({
-                    'date': current_date.strftime("%Y-%m-%d"),
-                    'location_id': location_id,
-                    'vessel_id': vessel_id,
-                    'type': 'transport',
-                    'dwell': dwell
-                })
-                current_date += timedelta(days=1)
-
-    return pd.DataFrame(transport_movements)
+            dwell = movements.groupby(keys, sort=False)['dwell'].sum()
+            aggregate = dwell if aggregate is None else aggregate.add(dwell, fill_value=0)
+    except Exception as e:
+        print("Error streaming transport data:", e)
+        return pd.DataFrame()
+
+    if aggregate is None:
+        return pd.DataFrame()
+    aggregate = aggregate.sort_index().reset_index()
+    aggregate.insert(3, 'type', 'transport')
+    return aggregate
 
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
 # @Date: 2025-03-01
 # @Last Modified by:   undefined
 # @Last Modified time: 2025-03-01
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Only the days missing from its segment cache are queried (backend/segment_cache.py)
 # @Description: Fetch vessel data for temporal and seasonal graph
 
+@cached(ttl=config.range_cache_ttl_seconds, maxsize=config.range_cache_size)
 def get_vessel_counts(start_date, end_date):
-    # Ensure date-only format for start_date
-    if start_date:
-        start_date = datetime.strptime(start_date.split(" ")[0], '%Y-%m-%d').strftime('%Y-%m-%d')
-    if end_date:
-        # Add one day to make the range inclusive for the upper bound
-        end_date = datetime.strptime(end_date.split(" ")[0], '%Y-%m-%d') + timedelta(days=1)
-        end_date = end_date.strftime('%Y-%m-%d')
-        
-    query = """
-    MATCH (start)-[r:`Event.TransportEvent.TransponderPing`]->(end)
-    WHERE 
-        ((r.time >= $start_date OR $start_date IS NULL) AND (r.time < $end_date OR $end_date IS NULL))
-        AND (start:`Entity.Location.City` OR 
-        start:`Entity.Location.Point` OR 
-        start:`Entity.Location.Region`) AND 
-        (end:`Entity.Vessel.FishingVessel` OR end:`Entity.Vessel.CargoVessel`)
-    RETURN 
-        r.time AS date,
-        COUNT(DISTINCT end) AS num_vessels
-    """
-    with driver.session() as session:
-        try:
-            result = session.run(query, start_date=start_date, end_date=end_date)
-            vessel_counts = [record.data() for record in result]
-            df = pd.DataFrame(vessel_counts) if vessel_counts else pd.DataFrame()
-            return df
-        except Exception as e:
-            print("Error fetching vessel count data:", e)
-            return pd.DataFrame()
+    start_date, end_date = normalize_date_range(start_date, end_date)
+    return vessel_count_segments.fetch(get_backend().get_vessel_counts, start_date, end_date, get_data_version())
                 
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
@@ -0,0 +1,205 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+import pandas as pd
+import config
+from backend.dataserver import (get_data_version, fetch_delivery_qty_data, get_transport_movements,
+    process_transport_movements, get_fish_deliveries, process_fish_deliveries, get_vessel_counts,
+    prepare_temporal_dataframe, detect_anomalies, get_fish_distribution_data, fetch_vessel_cargo_data,
+    preprocess_vessel_cargo_data, stream_transport_movements, get_daily_rollups, get_rollup_coverage)
+from backend.data_backend import normalize_date_range
+from backend.fanout import run_concurrently
+from backend.disk_cache import EntryLock, load_datasets, save_datasets
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Server-side store of the processed datasets.
+# processed-data-store in the browser only holds a small key (date range + data version),
+# the DataFrames stay in this process and callbacks read them directly.
+
+# ***************************************************************************************
+
+# Dataset names held per key
+DATASETS = ("transport_movements", "fish_deliveries", "temporal_data", "fish_distribution", "matched_data")
+
+_store = OrderedDict()
+_store_lock = threading.Lock()
+_key_locks = {}
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Fetch and process every dataset for a date range (moved from load_and_process_data)
+
+def compute_processed_datasets(start_date, end_date):
+    # Fetch (and where possible process) every dataset concurrently,
+    # a failed or timed out fetch leaves its dataset empty instead of failing the callback
+    results, failed = run_concurrently({
+        # Transport movement data for heatmap
+        "transport_movements": (lambda: transport_movements_for_range(start_date, end_date), pd.DataFrame()),
+        # Fish delivery data for Network-Link graph (pyvis)
+        "fish_deliveries": (lambda: process_fish_deliveries(get_fish_deliveries(start_date, end_date)), []),
+        # Daily delivery qty and vessel counts for temporal and seasonal graph
+        "temporal_inputs": (lambda: temporal_inputs_for_range(start_date, end_date), ([], pd.DataFrame())),
+        # Fish distribution data for treemap
+        "fish_distribution": (get_fish_distribution_data, []),
+        # Data for cluster-plot
+        "matched_data": (lambda: preprocess_vessel_cargo_data(*fetch_vessel_cargo_data(start_date, end_date)), []),
+    })
+
+    # Prepare temporal data (combined delivery_qty_data and vessel_count_data)
+    temporal_df = prepare_temporal_dataframe(*results["temporal_inputs"])
+
+    # Detect anomalies in temporal data (combined fish deliveries and vessel counts)
+    temporal_df = detect_anomalies(temporal_df)
+
+    matched_data = results["matched_data"]
+    transport_movements = results["transport_movements"]
+    return {
+        "transport_movements": transport_movements if isinstance(transport_movements, pd.DataFrame) else pd.DataFrame(),
+        "fish_deliveries": pd.DataFrame(results["fish_deliveries"]),
+        "temporal_data": temporal_df if isinstance(temporal_df, pd.DataFrame) else pd.DataFrame(),
+        "fish_distribution": pd.DataFrame(results["fish_distribution"]),
+        "matched_data": matched_data if isinstance(matched_data, pd.DataFrame) else pd.DataFrame(matched_data),
+        "partial": failed,  # Datasets left empty because their fetch failed or timed out
+    }
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Transport movements for the heatmap, wide ranges (full year) are streamed in batches
+# into a per (date, location, vessel) aggregate to keep peak memory bounded
+
+def transport_movements_for_range(start_date, end_date):
+    start, end = normalize_date_range(start_date, end_date)
+    if start and end:
+        days = (datetime.strptime(end, '%Y-%m-%d') - datetime.strptime(start, '%Y-%m-%d')).days
+        if days > config.transport_stream_min_days:
+            return stream_transport_movements(start_date, end_date)
+    return process_transport_movements(get_transport_movements(start_date, end_date))
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: Rollups are used only when their coverage was stamped with the current data version
+# @Description: Delivery qty and vessel counts for prepare_temporal_dataframe, one row per day from the daily rollups.
+# Falls back to the raw rows when the rollups are missing (daily_rollups.py not run yet) or stale (data imported
+# or corrected since the last refresh). A current refresh rolled up every day with source rows, so it covers any range.
+
+def temporal_inputs_for_range(start_date, end_date):
+    coverage = get_rollup_coverage()
+    if coverage and coverage["version"] == get_data_version():
+        rollups = get_daily_rollups(start_date, end_date)
+        if not rollups.empty:
+            return rollups[["date", "qty_tons"]].to_dict("records"), rollups[["date", "num_vessels"]]
+    return fetch_delivery_qty_data(start_date, end_date), get_vessel_counts(start_date, end_date)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Key stored in processed-data-store for a calendar-store date range
+
+def dataset_key(start_date, end_date):
+    return {"start_datetime": start_date, "end_datetime": end_date, "version": get_data_version()}
+
+def _key_tuple(store_key):
+    return (store_key.get("start_datetime"), store_key.get("end_datetime"), store_key.get("version"))
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Datasets for a store key, computed on a miss (evicted, other worker, restart).
+# One lock per key so simultaneous callbacks for the same range compute it once.
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: A miss is looked up in the disk cache shared by all workers before computing (backend/disk_cache.py)
+# @Last Modified: Partial results are not kept in the store, like in the disk cache
+
+def get_processed_datasets(store_key):
+    key = _key_tuple(store_key)
+    with _store_lock:
+        if key in _store:
+            _store.move_to_end(key)
+            return _store[key]
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        with _store_lock:
+            if key in _store:
+                return _store[key]
+        datasets = load_or_compute_datasets(store_key)
+        with _store_lock:
+            # Partial results (a fetch failed or timed out) are handed out but not kept, the next call recomputes
+            if not datasets["partial"]:
+                _store[key] = datasets
+                while len(_store) > config.dataset_store_size:
+                    _store.popitem(last=False)
+            _key_locks.pop(key, None)
+        return datasets
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Read the datasets from the disk cache or compute and write them.
+# The entry lock makes other workers wait for the one computing the range instead of computing it again.
+# Partial results (a fetch failed, timed out or its backend noted a query error) are not written, the next load retries them.
+
+def load_or_compute_datasets(store_key):
+    if not config.disk_cache_enabled:
+        return compute_processed_datasets(store_key.get("start_datetime"), store_key.get("end_datetime"))
+
+    datasets = load_datasets(store_key)
+    if datasets is not None:
+        return datasets
+    with EntryLock(store_key):
+        datasets = load_datasets(store_key)
+        if datasets is not None:
+            return datasets
+        datasets = compute_processed_datasets(store_key.get("start_datetime"), store_key.get("end_datetime"))
+        if not datasets["partial"]:
+            save_datasets(store_key, datasets)
+        return datasets
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Compute (or reuse) the datasets for a date range and return the key for processed-data-store
+
+def load_processed_datasets(start_date, end_date):
+    store_key = dataset_key(start_date, end_date)
+    get_processed_datasets(store_key)
+    return store_key
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: One dataset as a DataFrame for a callback (a copy, callbacks add columns to it)
+
+def get_dataset(store_key, name):
+    if not store_key or not store_key.get("start_datetime"):
+        return pd.DataFrame()
+    dataset = get_processed_datasets(store_key).get(name)
+    return dataset.copy() if isinstance(dataset, pd.DataFrame) else pd.DataFrame()
+
+def clear_dataset_store():
+    with _store_lock:
+        _store.clear()
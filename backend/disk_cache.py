@@ -0,0 +1,192 @@
+import hashlib
+import json
+import os
+import time
+import uuid
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import config
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Disk cache of the processed datasets shared by every worker process and kept across restarts.
+# One entry per (date range, data version): a Parquet file per dataset plus a small JSON manifest.
+# The manifest is written last, so an entry only exists once all of its files are complete.
+
+# ***************************************************************************************
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: File names for a store key {start_datetime, end_datetime, version}
+
+def entry_name(store_key):
+    key = "|".join(str(store_key.get(name)) for name in ("start_datetime", "end_datetime", "version"))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+def _manifest_path(name):
+    return os.path.join(config.disk_cache_dir, name + ".json")
+
+def _dataset_path(name, dataset):
+    return os.path.join(config.disk_cache_dir, f"{name}-{dataset}.parquet")
+
+def _lock_path(name):
+    return os.path.join(config.disk_cache_dir, name + ".lock")
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Write a file atomically: write to a unique temp file in the same folder, then os.replace
+
+def _atomic_write(path, write):
+    tmp_path = f"{path}.{os.getpid()}-{uuid.uuid4().hex}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Read the datasets of an entry, None if it is not (completely) on disk
+
+def load_datasets(store_key):
+    name = entry_name(store_key)
+    try:
+        with open(_manifest_path(name), encoding="utf-8") as f:
+            manifest = json.load(f)
+        datasets = {}
+        for dataset in manifest["datasets"]:
+            table = pq.read_table(_dataset_path(name, dataset))
+            df = table.to_pandas()
+            # List columns (harbor_vessels, ping_vessels) come back as arrays, callbacks expect lists
+            for field in table.schema:
+                if pa.types.is_list(field.type):
+                    df[field.name] = table.column(field.name).to_pylist()
+            datasets[dataset] = df
+        datasets["partial"] = manifest.get("partial", [])
+        # Last use time for the eviction order
+        os.utime(_manifest_path(name))
+        return datasets
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print("Error reading disk cache entry:", e)
+        return None
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Write the datasets of an entry, then evict the least recently used entries above the size limit
+
+def save_datasets(store_key, datasets):
+    name = entry_name(store_key)
+    try:
+        os.makedirs(config.disk_cache_dir, exist_ok=True)
+        names = [dataset for dataset, df in datasets.items() if isinstance(df, pd.DataFrame)]
+        for dataset in names:
+            df = datasets[dataset]
+            _atomic_write(_dataset_path(name, dataset), lambda path: df.to_parquet(path, index=False))
+        manifest = {"key": store_key, "datasets": names, "partial": datasets.get("partial", [])}
+        _atomic_write(_manifest_path(name), lambda path: _write_json(path, manifest))
+        evict(config.disk_cache_max_bytes)
+    except Exception as e:
+        print("Error writing disk cache entry:", e)
+
+def _write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Size based eviction, oldest manifest (least recently used entry) first
+
+def evict(max_bytes):
+    if not os.path.isdir(config.disk_cache_dir):
+        return
+    entries = {}
+    for file_name in os.listdir(config.disk_cache_dir):
+        path = os.path.join(config.disk_cache_dir, file_name)
+        name = file_name.split("-")[0].split(".")[0]
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            continue
+        entry = entries.setdefault(name, {"size": 0, "used": None})
+        entry["size"] += size
+        if file_name == name + ".json":
+            entry["used"] = os.path.getmtime(path)
+
+    total = sum(entry["size"] for entry in entries.values())
+    # Entries without a manifest are being written (or were abandoned), they are left to their writer
+    complete = sorted((entry["used"], name) for name, entry in entries.items() if entry["used"] is not None)
+    for _, name in complete:
+        if total <= max_bytes:
+            break
+        total -= entries[name]["size"]
+        remove_entry(name)
+
+def remove_entry(name):
+    # Manifest first, so readers never see an entry with missing files
+    for path in [_manifest_path(name)] + [
+        os.path.join(config.disk_cache_dir, file_name)
+        for file_name in os.listdir(config.disk_cache_dir) if file_name.startswith(name + "-")
+    ]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Cross-process lock per entry (exclusive create of a lock file, works on Windows and Linux)
+# so a popular range is computed by one worker while the others wait for its entry.
+# A lock older than disk_cache_lock_timeout_seconds is treated as left behind by a crashed worker.
+
+class EntryLock:
+    def __init__(self, store_key):
+        self.path = _lock_path(entry_name(store_key))
+
+    def __enter__(self):
+        os.makedirs(config.disk_cache_dir, exist_ok=True)
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode("utf-8"))
+                os.close(fd)
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > config.disk_cache_lock_timeout_seconds:
+                        os.remove(self.path)
+                        continue
+                except OSError:
+                    continue
+                time.sleep(0.1)
+
+    def __exit__(self, *exc):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+        return False
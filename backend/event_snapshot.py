@@ -0,0 +1,161 @@
+import bisect
+import json
+import os
+import shutil
+import time
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Columnar snapshot of the event tables (DeliveryReports, TransponderPings, HarborReports, Transactions).
+# Event tables are partitioned by day into uncompressed Arrow IPC files (<table>/day=YYYY-MM-DD.arrow), sorted by
+# their date/time column, with dictionary-encoded ids; rows without a date go to <table>/undated.arrow.
+# Small tables (nodes, daily rollups) are single files. manifest.json is written last and lists the partitions.
+# Reads memory-map the files (zero copy) and only open the partitions of the requested date range.
+
+# ***************************************************************************************
+
+MANIFEST_FILE = "manifest.json"
+UNDATED = "undated"
+# Id and label columns stored dictionary-encoded
+DICTIONARY_COLUMNS = [":ID", "id", ":START_ID", ":END_ID", "source", "target", "start_label", "end_label",
+                      "city_of_arrival", "fish_name"]
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: DataFrame -> Arrow table with the id columns dictionary-encoded, and one IPC file per table.
+# The schema is taken from the whole table (all-null columns as strings) so every partition has the same one.
+
+def arrow_schema(df):
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    return pa.schema([pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field for field in schema])
+
+def to_arrow(df, schema=None):
+    table = pa.Table.from_pandas(df, schema=schema or arrow_schema(df), preserve_index=False).replace_schema_metadata(None)
+    for i, name in enumerate(table.column_names):
+        if name in DICTIONARY_COLUMNS and pa.types.is_string(table.schema.field(name).type):
+            table = table.set_column(i, name, pc.dictionary_encode(table.column(name)))
+    return table
+
+def write_ipc(path, table):
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+def read_ipc(path):
+    # The table keeps the memory map alive after the file object is closed
+    with pa.memory_map(path, "r") as source:
+        return pa.ipc.open_file(source).read_all()
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Arrow table -> DataFrame the way the backends use it: string and id columns as objects with None
+# for missing values, numeric columns unchanged
+
+def to_frame(table):
+    df = table.to_pandas()
+    for field in table.schema:
+        if pa.types.is_string(field.type) or pa.types.is_dictionary(field.type) or pa.types.is_null(field.type):
+            column = df[field.name].astype(object)
+            df[field.name] = column.where(column.notna(), None)
+    return df
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Write a snapshot. events maps a table name to (DataFrame, date/time column), tables maps a name
+# to a DataFrame written as a single file. Values are kept as the import has them (strings), missing values as nulls.
+
+def write_snapshot(output_dir, events, tables):
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    # Readers of a previous snapshot in the folder stop seeing it before files are replaced
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+    manifest = {"version": str(time.time_ns()), "events": {}, "tables": {}}
+
+    for name, (df, column) in events.items():
+        table_dir = os.path.join(output_dir, name)
+        shutil.rmtree(table_dir, ignore_errors=True)
+        os.makedirs(table_dir)
+        df = df.sort_values(column, kind="stable", na_position="last").reset_index(drop=True)
+        schema = arrow_schema(df)
+        days = df[column].str[:10]
+        dated = days.notna()
+        partitions = []
+        for day, part in df[dated].groupby(days[dated], sort=True):
+            write_ipc(os.path.join(table_dir, f"day={day}.arrow"), to_arrow(part, schema))
+            partitions.append(day)
+        if not dated.all():
+            write_ipc(os.path.join(table_dir, UNDATED + ".arrow"), to_arrow(df[~dated], schema))
+        manifest["events"][name] = {"column": column, "days": partitions, "undated": not dated.all(), "rows": len(df)}
+
+    for name, df in tables.items():
+        write_ipc(os.path.join(output_dir, name + ".arrow"), to_arrow(df.reset_index(drop=True)))
+        manifest["tables"][name] = {"rows": len(df)}
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    return manifest
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Reader of a snapshot folder. read(name, start, end) memory-maps the day partitions overlapping
+# [start, end) and trims the boundary days on the date/time column; an open range (both bounds None)
+# also includes the undated rows. read_frame gives the same as a DataFrame.
+
+class EventSnapshot:
+    def __init__(self, snapshot_dir):
+        self.snapshot_dir = snapshot_dir
+        with open(os.path.join(snapshot_dir, MANIFEST_FILE), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.version = self.manifest["version"]
+
+    def read(self, name, start=None, end=None):
+        if name in self.manifest["tables"]:
+            return read_ipc(os.path.join(self.snapshot_dir, name + ".arrow"))
+
+        info = self.manifest["events"][name]
+        days, column = info["days"], info["column"]
+        lo = bisect.bisect_left(days, start[:10]) if start else 0
+        # end is exclusive: its own day is only needed when end is later than midnight
+        hi = (bisect.bisect_left(days, end) if len(end) <= 10 else bisect.bisect_right(days, end[:10])) if end else len(days)
+        table_dir = os.path.join(self.snapshot_dir, name)
+        parts = []
+        for i in range(lo, hi):
+            part = read_ipc(os.path.join(table_dir, f"day={days[i]}.arrow"))
+            if i == lo and start and len(start) > 10:
+                part = part.filter(pc.greater_equal(part.column(column), start))
+            if i == hi - 1 and end and len(end) > 10:
+                part = part.filter(pc.less(part.column(column), end))
+            parts.append(part)
+        if info["undated"] and not start and not end:
+            parts.append(read_ipc(os.path.join(table_dir, UNDATED + ".arrow")))
+        if not parts:
+            return self.read_empty(name)
+        return pa.concat_tables(parts) if len(parts) > 1 else parts[0]
+
+    def read_empty(self, name):
+        info = self.manifest["events"][name]
+        path = os.path.join(self.snapshot_dir, name, (f"day={info['days'][0]}" if info["days"] else UNDATED) + ".arrow")
+        if not os.path.exists(path):
+            return pa.table({info["column"]: pa.array([], type=pa.string())})
+        return read_ipc(path).slice(0, 0)
+
+    def read_frame(self, name, start=None, end=None):
+        return to_frame(self.read(name, start, end))
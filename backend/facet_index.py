@@ -0,0 +1,141 @@
+import config
+from backend.cache import cached
+from backend.data_backend import get_backend
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Faceted co-occurrence index for the cascading dropdown filters.
+# Vessels and facet values are integer coded; every value keeps the set of its vessels
+# as a bitset (a Python int), so any combination of selections is answered by AND/OR of bitsets.
+
+# ***************************************************************************************
+
+# Dropdown order used by populate_dynamic_dropdowns
+DROPDOWNS = ("companies", "cities", "ports", "regions", "vessels", "species")
+FACETS = ("companies", "cities", "ports", "regions", "species")
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Selected dropdown value(s) as a list
+
+def selected_list(value):
+    if value is None or value == "":
+        return []
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Vessel <-> company/city/port/region/species adjacency as integer coded bitsets
+
+class FacetIndex:
+    def __init__(self, vessels, values, pairs):
+        self.vessels = sorted(vessels)
+        self.vessel_code = {vessel: i for i, vessel in enumerate(self.vessels)}
+        self.all_vessels = (1 << len(self.vessels)) - 1
+
+        self.values = {}
+        self.value_code = {}
+        self.value_vessels = {}
+        for facet in FACETS:
+            self.values[facet] = sorted(set(values.get(facet, [])))
+            self.value_code[facet] = {value: i for i, value in enumerate(self.values[facet])}
+            self.value_vessels[facet] = [0] * len(self.values[facet])
+
+        for facet, vessel, value in pairs:
+            vessel_code = self.vessel_code.get(vessel)
+            if vessel_code is None or value is None or facet not in self.value_code:
+                continue
+            codes = self.value_code[facet]
+            if value not in codes:
+                codes[value] = len(self.values[facet])
+                self.values[facet].append(value)
+                self.value_vessels[facet].append(0)
+            self.value_vessels[facet][codes[value]] |= 1 << vessel_code
+
+    # Bitset of vessels matching every selection except the one in skip (union within a facet)
+    def vessels_matching(self, selections, skip=None):
+        mask = self.all_vessels
+        for dropdown in DROPDOWNS:
+            selected = selected_list(selections.get(dropdown))
+            if dropdown == skip or not selected:
+                continue
+            facet_mask = 0
+            if dropdown == "vessels":
+                for vessel in selected:
+                    code = self.vessel_code.get(vessel)
+                    if code is not None:
+                        facet_mask |= 1 << code
+            else:
+                codes = self.value_code[dropdown]
+                for value in selected:
+                    code = codes.get(value)
+                    if code is not None:
+                        facet_mask |= self.value_vessels[dropdown][code]
+            mask &= facet_mask
+        return mask
+
+    # Options per dropdown: the values that co-occur with the selections in all other dropdowns
+    def options(self, selections):
+        options = {}
+        for dropdown in DROPDOWNS:
+            mask = self.vessels_matching(selections, skip=dropdown)
+            if dropdown == "vessels":
+                if mask == self.all_vessels:
+                    options[dropdown] = list(self.vessels)
+                else:
+                    bits = bin(mask)[:1:-1]  # Lowest bit first
+                    options[dropdown] = [self.vessels[i] for i, bit in enumerate(bits) if bit == "1"]
+            elif mask == self.all_vessels:
+                options[dropdown] = sorted(self.values[dropdown])
+            else:
+                options[dropdown] = sorted(
+                    value for value, vessels in zip(self.values[dropdown], self.value_vessels[dropdown]) if vessels & mask
+                )
+        return options
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: Species pairs from get_vessel_species_pairs instead of every delivery of get_fish_deliveries;
+# a build during which a query failed is not cached (see cached)
+# @Description: Build the index from the active backend.
+# Species are linked through the vessels attributed to each delivery (harbor and ping vessels).
+
+def build_facet_index(backend=None):
+    backend = backend or get_backend()
+    values = {
+        "companies": [company for company in backend.get_companies() if company is not None],
+        "cities": backend.get_cities(),
+        "ports": backend.get_points(),
+        "regions": backend.get_regions(),
+        "species": backend.get_species(),
+    }
+    pairs = list(backend.get_vessel_facet_pairs())
+    pairs.extend(("species", vessel, fish) for vessel, fish in backend.get_vessel_species_pairs())
+    return FacetIndex(backend.get_vessels(), values, pairs)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Process-wide index and dropdown options for the current selections {dropdown: value(s)}.
+# Built once and kept for the dimension cache ttl, invalidate_caches() rebuilds it after a data import.
+
+@cached(ttl=config.dimension_cache_ttl_seconds, maxsize=1)
+def get_facet_index():
+    return build_facet_index()
+
+def get_dropdown_options(selections):
+    return get_facet_index().options(selections)
@@ -0,0 +1,64 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import config
+from backend.data_backend import reset_fetch_error, fetch_error_noted
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Run independent data fetches concurrently on a bounded thread pool
+
+# ***************************************************************************************
+
+# Shared by every callback so concurrent users cannot open an unbounded number of sessions
+_executor = ThreadPoolExecutor(max_workers=config.query_max_workers, thread_name_prefix="dataserver-fetch")
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: A task whose backend query failed (note_fetch_error on the pool thread) also yields its default
+# @Description: Run {name: (function, default)} tasks concurrently.
+# Each task gets timeout seconds from submission; a task that fails or times out yields its default.
+# Backends catch their query errors and return empty data with note_fetch_error(), a per-thread flag, so each task
+# resets and reads the flag on the pool thread it runs on.
+# Returns the results by name and the list of names that fell back to their default (partial result).
+
+def _tracked(function):
+    def run():
+        reset_fetch_error()
+        try:
+            return function(), fetch_error_noted()
+        finally:
+            reset_fetch_error()  # The pool thread is reused by the next task
+    return run
+
+def run_concurrently(tasks, timeout=None):
+    timeout = config.query_timeout_seconds if timeout is None else timeout
+    deadline = time.monotonic() + timeout
+    futures = {name: _executor.submit(_tracked(function)) for name, (function, default) in tasks.items()}
+
+    results = {}
+    failed = []
+    for name, future in futures.items():
+        default = tasks[name][1]
+        try:
+            result, fetch_failed = future.result(timeout=max(0, deadline - time.monotonic()))
+            if fetch_failed:
+                print(f"Fetching {name} failed in the backend, continuing without it")
+                result = default
+                failed.append(name)
+            results[name] = result
+        except FutureTimeoutError:
+            future.cancel()  # Drops it if still queued, a running query finishes in the background
+            print(f"Fetching {name} timed out after {timeout} s, continuing without it")
+            results[name] = default
+            failed.append(name)
+        except Exception as e:
+            print(f"Error fetching {name}:", e)
+            results[name] = default
+            failed.append(name)
+    return results, failed
@@ -1,8 +1,16 @@
-from pyvis.network import Network
+import hashlib
+import json
+import math
+import zlib
+from dash import Patch
 import networkx as nx
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import config
+from backend.cache import ResultCache, normalize_arg, register_cache
+from backend.normalize import normalize_qty_tons
 
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
@@ -13,28 +21,47 @@ import plotly.graph_objects as go
 
 # ***************************************************************************************
 
+# Node positions of the Network-link graph per layout key (cleared with the other caches after a data import)
+_layout_cache = ResultCache("graph_layout", None, config.graph_layout_cache_size)
+register_cache("graph_layout", _layout_cache)
+# Last position of every node that has been laid out, node id -> (x, y)
+_position_memory = ResultCache("graph_positions", None, config.graph_position_memory_size)
+register_cache("graph_positions", _position_memory)
+# [id, digest] of the elements of every drawn network graph per state key, the key is all the browser keeps
+# (network-graph-state); a key this worker does not know gets the full element list
+_graph_states = ResultCache("graph_states", None, config.graph_state_cache_size)
+register_cache("graph_states", _graph_states)
+# Tooltip index (GraphDetails) per (dataset key, filters), built on the first hover of a drawn graph
+_graph_details = ResultCache("graph_details", None, config.graph_layout_cache_size)
+register_cache("graph_details", _graph_details)
+
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
 # @Date: 2024-12-10
 # @Last Modified by:   undefined
 # @Last Modified time: 2024-12-19
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Dwell summed into a location x date matrix on the server (heatmap_matrix) and drawn with go.Heatmap,
+# so the figure holds one value per cell instead of every transport movement row
 # @Description: Fetch data for heatmap visualizing dwell time in locations over time
 
 def create_heatmap(data, filter_data):
     """
-    Create a heatmap showing dwell time by vessel and date, with locations as annotations.
+    Create a heatmap showing dwell time by location and date (sum of dwell per day and location).
     """
+    z, dates, locations = heatmap_matrix(data)
+
     # Create heatmap
-    fig = px.density_heatmap(
-        data,
-        x='date',
-        y='location_id',
-        z='dwell',
-        title='Vessel Dwell Time by location and Date',
-        labels={'dwell': 'Dwell Time (s)', 'date': 'Date', 'location_id': 'Location'},
-        color_continuous_scale='Viridis'
-    )
-    fig.update_layout(xaxis_title="Date", yaxis_title="Location", coloraxis_colorbar_title="Dwell Time (s)",
+    fig = go.Figure(go.Heatmap(
+        z=z,
+        x=dates,
+        y=locations,
+        colorscale='Viridis',
+        colorbar=dict(title="Dwell Time (s)"),
+        hovertemplate="Date: %{x}<br>Location: %{y}<br>Dwell Time (s): %{z}<extra></extra>",
+    ))
+    fig.update_layout(title='Vessel Dwell Time by location and Date', xaxis_title="Date", yaxis_title="Location",
     font=dict(size=8, variant="small-caps"),
     title_font=dict(size=12, variant="small-caps"),
     legend_font=dict(size=8, variant="small-caps")
@@ -42,6 +69,31 @@ def create_heatmap(data, filter_data):
 
     return fig
 
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Dwell of the transport movement rows (date, location_id, dwell) summed per (location, day) with np.add.at
+# on integer-coded axes. Days run from the first to the last date, so days without movements are zero cells
+# like empty histogram bins; rows without a valid date are left out.
+
+def heatmap_matrix(data):
+    days = pd.to_datetime(data["date"].astype(str).str[:10], format="%Y-%m-%d", errors="coerce")
+    valid = days.notna().to_numpy()
+    if not valid.any():
+        return np.zeros((0, 0)), [], []
+    days = days[valid].to_numpy(dtype="datetime64[D]")
+    first = days.min()
+    date_codes = (days - first).astype(np.int64)
+    location_codes, locations = pd.factorize(data["location_id"][valid].astype(str), sort=True)
+    dwell = pd.to_numeric(data["dwell"][valid], errors="coerce").fillna(0.0).to_numpy(dtype=float)
+
+    z = np.zeros((len(locations), date_codes.max() + 1))
+    np.add.at(z, (location_codes, date_codes), dwell)
+    dates = np.datetime_as_string(first + np.arange(z.shape[1]), unit="D").tolist()
+    return z, dates, locations.tolist()
+
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
 # @Date: 2024-12-26
@@ -74,105 +126,475 @@ def create_treemap(treemap_data):
     )
     return fig
 
-# @Author: Asta Omarsdottir
-# @Email: asta.omarsdottir@gmail.com
-# @Date: 2025-02-26
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
 # @Last Modified by:   undefined
-# @Last Modified time: 2025-02-26
-# @Description: Create Network-link graph (pyvis)
+# @Last Modified time: 2026-10-18
+# @Last Modified: No tooltips, they are built on hover for one element (graph_element_details)
+# @Description: Nodes and edges of the Network-link graph (color, shape, size and edge value) with their layout
+# positions, turned into cytoscape elements by create_cytoscape_elements.
+# Returns nodes by id, edges by (from, to) and the delivery groups of a summarized graph (None otherwise).
 
-def create_interactive_graph(fish_delivery_data):
-    G = nx.MultiDiGraph()  # Directed multigraph
-    net = Network(notebook=False, directed = True) # Pyvis interactive network 
-    net.repulsion()
-    
-    net.set_options("""
-    {
-        "layout": {
-            "hierarchical": {
-                "enabled": false
-            }
-        },
-        "physics": {
-            "enabled": true,
-            "solver": "forceAtlas2Based",
-            "stabilization": {
-                "enabled": true,
-                "iterations": 300
-            }
-        },
-        "manipulation": {
-            "enabled": false
-        }
-    }
-    """)
-    
-   # net.toggle_physics(False)
-   
-    for record in fish_delivery_data:
-        # Basic info from the cargo report
-        delivery_id = record.get("delivery_report_name", "Unknown")
-        date_of_arrival = record.get("date_of_arrival", "Unknown")
-        city_of_arrival = record.get("city_of_arrival", "Unknown")
-        fish = record.get("fish_name", "Unknown")
-        qty_tons = float(record.get("quantity_tons", 0.0))  
-        
-        # Get lists (if no list provided, default to empty list)
-        harbor_vessels = record.get("harbor_vessels", [])
-        ping_vessels = record.get("ping_vessels", [])
-
-        # Add primary nodes
-        net.add_node(
-            delivery_id,
-            label=delivery_id, 
-            title= f"Cargo: {delivery_id}\nArrival: {date_of_arrival}\nCity: {city_of_arrival}\nFish Type: {fish}\nFish qty: {qty_tons}",
-            size=30, 
-            color="black"
-            )
-        net.add_node(city_of_arrival, size=30, label=city_of_arrival, color="darkred", title=f"City:{city_of_arrival}")
-        net.add_node(fish, label=fish, size=30, color="green", title=f"Fish Type: {fish}")
-        
-        # Edge between DeliveryReport and City of Arrival
-        net.add_edge(
-            delivery_id, city_of_arrival, 
-            title=f"Delivery: {delivery_id}\nArrival: {date_of_arrival}\nCity: {city_of_arrival}",
-            value=3,  # This controls edge thickness in Pyvis
-            color="orange"
+def graph_elements(fish_delivery_data, layout_key=None, summarize=None):
+    deliveries = delivery_frame(fish_delivery_data)
+    nodes = {}  # id -> node, the first definition of an id wins
+    edges = {}  # (from, to) -> edge, one edge per pair
+
+    def add_node(n_id, shape="dot", label=None, **options):
+        if n_id not in nodes:
+            nodes[n_id] = {**options, "id": n_id, "label": n_id if label is None else label, "shape": shape}
+
+    def add_edge(source, to, **options):
+        if (source, to) not in edges:
+            edges[(source, to)] = {**options, "from": source, "to": to}
+
+    vessel_kinds = [
+        (aggregate_vessels(deliveries, column), shape, node_color, edge_color, extra_value)
+        for column, shape, node_color, edge_color, extra_value in (
+            ("harbor_vessels", "star", "blue", "purple", 3), ("ping_vessels", "dot", "cyan", "yellow", 0))
+    ]
+
+    # Level of detail: above the node budget delivery reports are drawn as (city, fish, week) groups
+    vessel_nodes = sum(len(vessel_kind[0][1]) for vessel_kind in vessel_kinds)
+    other_nodes = deliveries["city"].nunique() + deliveries["fish"].nunique() + vessel_nodes
+    if summarize is None:
+        summarize = deliveries["delivery"].nunique() + other_nodes > config.graph_node_budget
+    groups = delivery_groups(deliveries, config.graph_node_budget - other_nodes) if summarize else None
+
+    if groups is None:
+        for delivery_id, city_of_arrival, fish in zip(
+                deliveries["delivery"].tolist(), deliveries["city"].tolist(), deliveries["fish"].tolist()):
+            # Add primary nodes
+            add_node(delivery_id, size=30, color="black")
+            add_node(city_of_arrival, size=30, color="darkred")
+            add_node(fish, size=30, color="green")
+            # Edges between DeliveryReport and City of Arrival / Commodity (Fish)
+            add_edge(delivery_id, city_of_arrival, value=3, color="orange")
+            add_edge(delivery_id, fish, value=3, color="gray")
+    else:
+        for group_id, city_of_arrival, fish, count in zip(
+                groups["group"].tolist(), groups["city"].tolist(), groups["fish"].tolist(), groups["deliveries"].tolist()):
+            # One square node per group, expanded into its delivery reports on tap (see expand_group_elements)
+            add_node(group_id, shape="square", label=f"{count} deliveries", size=30, color="black")
+            add_node(city_of_arrival, size=30, color="darkred")
+            add_node(fish, size=30, color="green")
+            add_edge(group_id, city_of_arrival, value=3, color="orange")
+            add_edge(group_id, fish, value=3, color="gray")
+
+    # One node per harbor / ping vessel and one edge per (fish, vessel), summed over the deliveries
+    for (vessel_edges, vessels), shape, node_color, edge_color, extra_value in vessel_kinds:
+        for vessel in vessels["vessel"].tolist():
+            add_node(vessel, shape=shape, size=30, color=node_color)
+        for fish, vessel, qty in zip(vessel_edges["fish"].tolist(), vessel_edges["vessel"].tolist(), vessel_edges["qty"].tolist()):
+            add_edge(fish, vessel, value=qty + extra_value, color=edge_color)
+
+    # Fixed positions from the server-side layout
+    positions = cached_layout(layout_key, list(nodes), list(edges))
+    for n_id, node in nodes.items():
+        node["x"], node["y"] = positions[n_id]
+
+    return nodes, edges, groups
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Fish delivery records as plain columns (missing ids as "Unknown", quantities normalized),
+# and the (fish, vessel) edges and vessel totals of one vessel list column. A vessel listed several times
+# for one delivery counts once.
+
+def delivery_frame(fish_delivery_data):
+    df = pd.DataFrame.from_records(fish_delivery_data) if fish_delivery_data else pd.DataFrame()
+
+    def column(name, default=None):
+        return df[name] if name in df.columns else pd.Series(default, index=df.index, dtype=object)
+
+    def ids(name):
+        values = column(name)
+        return values.astype(object).where(values.notna(), "Unknown").astype(str)
+
+    return pd.DataFrame({
+        "delivery": ids("delivery_report_name"),
+        "date": column("date_of_arrival", "Unknown"),
+        "city": ids("city_of_arrival"),
+        "fish": ids("fish_name"),
+        # Quantities normalized in one pass (backend/normalize.py)
+        "qty": normalize_qty_tons(column("quantity_tons", 0.0), field="quantity_tons").to_numpy(),
+        "harbor_vessels": column("harbor_vessels").map(lambda vessels: vessels if isinstance(vessels, list) else []),
+        "ping_vessels": column("ping_vessels").map(lambda vessels: vessels if isinstance(vessels, list) else []),
+    })
+
+def aggregate_vessels(deliveries, column):
+    pairs = deliveries[["delivery", "fish", "qty", column]].explode(column).rename(columns={column: "vessel"})
+    pairs = pairs[pairs["vessel"].notna()].astype({"vessel": str}).drop_duplicates(["delivery", "fish", "vessel"])
+    edges = pairs.groupby(["fish", "vessel"], sort=False).agg(deliveries=("delivery", "size"), qty=("qty", "sum")).reset_index()
+    vessels = pairs.drop_duplicates(["delivery", "vessel"]).groupby("vessel", sort=False).agg(
+        deliveries=("delivery", "size"), qty=("qty", "sum")).reset_index()
+    return edges, vessels
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Delivery reports grouped by (city, fish, week of arrival) for the summarized graph. When even the weekly
+# groups do not fit in budget nodes the period is the whole date range, one group per (city, fish).
+# Each group keeps its delivery reports (at most config.graph_group_expand_limit) for expanding it in the browser.
+
+def delivery_weeks(deliveries):
+    days = pd.to_datetime(deliveries["date"].astype(str).str[:10], format="%Y-%m-%d", errors="coerce")
+    return days.dt.to_period("W").dt.start_time.dt.strftime("week of %Y-%m-%d").fillna("undated")
+
+def delivery_groups(deliveries, budget):
+    weeks = delivery_weeks(deliveries)
+    periods = weeks if deliveries.groupby(["city", "fish", weeks]).ngroups <= budget else pd.Series("all dates", index=deliveries.index)
+    deliveries = deliveries.assign(period=periods.to_numpy()).drop_duplicates(["delivery", "city", "fish"])
+    groups = deliveries.groupby(["city", "fish", "period"], sort=True).agg(
+        deliveries=("delivery", "size"), qty=("qty", "sum"),
+        members=("delivery", lambda ids: ids.tolist()[:config.graph_group_expand_limit])).reset_index()
+    # Node id of the group: its (city, fish, period) as JSON, distinct even when names contain separators
+    groups["group"] = [json.dumps(key) for key in zip(groups["city"].tolist(), groups["fish"].tolist(), groups["period"].tolist())]
+    return groups
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: Elements carry only ids, a style class and the edge width; tooltips are looked up on hover
+# (graph_element_details) and colors and shapes come from CYTOSCAPE_STYLESHEET
+# @Last Modified: Tooltips are no longer collected per render, graph_element_details builds the one under the mouse
+# @Description: Network-link graph as dash_cytoscape elements (the network-graph component), with the preset positions
+# of graph_layout. Group nodes of a summarized graph carry their delivery report ids for expand_group_elements,
+# group nodes and their edges their (city, fish, period) for the tooltip lookup (graph_element_details).
+
+CYTOSCAPE_SHAPES = {"dot": "ellipse", "star": "star", "square": "rectangle"}
+# Style class per (color, shape) of graph_elements nodes and per edge color
+CYTOSCAPE_NODE_CLASSES = {
+    ("black", "dot"): "delivery", ("black", "square"): "group", ("darkred", "dot"): "city",
+    ("green", "dot"): "fish", ("blue", "star"): "harbor", ("cyan", "dot"): "ping",
+}
+CYTOSCAPE_EDGE_CLASSES = {"orange": "delivery-city", "gray": "delivery-fish", "purple": "harbor", "yellow": "ping"}
+
+CYTOSCAPE_STYLESHEET = (
+    [{"selector": "node", "style": {"label": "data(id)", "width": 30, "height": 30, "font-size": "10px"}},
+     {"selector": "node.group", "style": {"label": "data(label)"}},
+     {"selector": "edge", "style": {"target-arrow-shape": "triangle", "curve-style": "straight", "width": "data(width)"}}]
+    + [{"selector": f"node.{node_class}", "style": {"background-color": color, "shape": CYTOSCAPE_SHAPES[shape]}}
+       for (color, shape), node_class in CYTOSCAPE_NODE_CLASSES.items()]
+    + [{"selector": f"edge.{edge_class}", "style": {"line-color": color, "target-arrow-color": color}}
+       for color, edge_class in CYTOSCAPE_EDGE_CLASSES.items()]
+)
+
+def cytoscape_node(n_id, node_class, x, y, **data):
+    return {"data": {"id": n_id, **data}, "position": {"x": x, "y": y}, "classes": node_class}
+
+def cytoscape_edge(source, target, edge_class, width, **data):
+    return {"data": {"id": f"{source}->{target}", "source": source, "target": target, "width": width, **data}, "classes": edge_class}
+
+def create_cytoscape_elements(fish_delivery_data, layout_key=None, summarize=None):
+    nodes, edges, groups = graph_elements(fish_delivery_data, layout_key, summarize)
+    group_data = {}
+    if groups is not None:
+        for group_id, city, fish, period, ids in zip(groups["group"].tolist(), groups["city"].tolist(), groups["fish"].tolist(),
+                                                     groups["period"].tolist(), groups["members"].tolist()):
+            group_data[group_id] = {"label": nodes[group_id]["label"], "city": city, "fish": fish, "members": ids,
+                                    "group": [city, fish, period]}
+
+    # Edge value -> line width 1 to 10 px
+    values = [edge["value"] for edge in edges.values()]
+    low, high = min(values, default=0), max(values, default=0)
+    width = lambda value: round(1 + 9 * (value - low) / (high - low), 1) if high > low else 3
+    return ([cytoscape_node(n_id, CYTOSCAPE_NODE_CLASSES.get((node["color"], node["shape"]), "delivery"), node["x"], node["y"], **group_data.get(n_id, {}))
+             for n_id, node in nodes.items()]
+            + [cytoscape_edge(source, target, CYTOSCAPE_EDGE_CLASSES.get(edge["color"], ""), width(edge["value"]),
+                              **({"group": group_data[source]["group"]} if source in group_data else {}))
+               for (source, target), edge in edges.items()])
+
+# Delivery reports of a tapped group node (tapNode of the cytoscape component) placed in a circle around it
+def expand_group_elements(tap_node):
+    group = tap_node["data"]
+    center = tap_node["position"]
+    members = group["members"]
+    radius = 40 + 8 * len(members)
+    elements = []
+    for i, delivery_id in enumerate(members):
+        angle = 2 * math.pi * i / len(members)
+        elements.append(cytoscape_node(delivery_id, "delivery", round(center["x"] + radius * math.cos(angle), 1),
+                                       round(center["y"] + radius * math.sin(angle), 1)))
+    for delivery_id in members:
+        elements.append(cytoscape_edge(delivery_id, group["city"], "delivery-city", 3))
+        elements.append(cytoscape_edge(delivery_id, group["fish"], "delivery-fish", 3))
+    return elements
+
+# Elements of the graph after expanding a tapped group node: the group and its two edges replaced by its delivery reports
+def expanded_elements(elements, tap_node):
+    group = tap_node["data"]
+    removed = {group["id"], f"{group['id']}->{group['city']}", f"{group['id']}->{group['fish']}"}
+    present = {element["data"]["id"] for element in elements}
+    return ([element for element in elements if element["data"]["id"] not in removed]
+            + [element for element in expand_group_elements(tap_node) if element["data"]["id"] not in present])
+
+# Records of the fish deliveries dataset shown in the network graph for the filters of filter-store
+def filter_fish_deliveries(fish_delivery_data, filter_data):
+    selected_cities = filter_data.get('cities', []) if filter_data else []
+    selected_vessels = filter_data.get('vessels', []) if filter_data else []
+    selected_fish_types = filter_data.get('species', []) if filter_data else []
+    return [
+        record for record in fish_delivery_data
+        if (not selected_cities or record.get("city_of_arrival") in selected_cities)
+        and (not selected_vessels or any(vessel in selected_vessels for vessel in record.get("harbor_vessels", []))
+            or any(vessel in selected_vessels for vessel in record.get("ping_vessels", [])))
+        and (not selected_fish_types or record.get("fish_name") in selected_fish_types)
+    ]
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: Looked up in a GraphDetails index built once per (dataset key, filters) instead of filtering the
+# whole dataset on every hover; groups are keyed by their (city, fish, period) instead of parsing the group id
+# @Description: Tooltip of the node or edge under the mouse (mouseover data of network-graph: id, and source / target
+# for edges; group nodes and their edges also carry the group's city, fish and period), from the records of the drawn
+# graph that mention it: the delivery report, city, fish, group or vessel. The id itself when no record mentions it.
+
+VESSEL_KINDS = (("harbor_vessels", "Harbor"), ("ping_vessels", "Ping"))
+
+class GraphDetails:
+    def __init__(self, fish_delivery_data):
+        deliveries = delivery_frame(fish_delivery_data)
+        self.deliveries = {}  # delivery -> (date, city, fish, qty) of its first record
+        self.delivery_edges = {}  # (delivery, city or fish) -> tooltip, from the first record linking them
+        for delivery, date, city, fish, qty in zip(deliveries["delivery"].tolist(), deliveries["date"].tolist(),
+                                                   deliveries["city"].tolist(), deliveries["fish"].tolist(), deliveries["qty"].tolist()):
+            self.deliveries.setdefault(delivery, (date, city, fish, qty))
+            self.delivery_edges.setdefault((delivery, city), f"Delivery: {delivery}\nArrival: {date}\nCity: {city}")
+            self.delivery_edges.setdefault((delivery, fish), f"Delivery: {delivery}\nArrival: {date}\nFish: {fish}\nQty: {qty} tons")
+        self.cities = set(deliveries["city"].tolist())
+        self.fish = set(deliveries["fish"].tolist())
+
+        # (city, fish, period) -> (deliveries, qty) for the weekly and the whole-range groups of delivery_groups
+        unique = deliveries.drop_duplicates(["delivery", "city", "fish"])
+        periods = pd.concat([unique.assign(period=delivery_weeks(unique).to_numpy()), unique.assign(period="all dates")])
+        groups = periods.groupby(["city", "fish", "period"], sort=False).agg(deliveries=("delivery", "size"), qty=("qty", "sum"))
+        self.groups = dict(zip(groups.index.tolist(), zip(groups["deliveries"].tolist(), groups["qty"].tolist())))
+
+        # Per vessel kind: vessel -> (deliveries, qty) and (fish, vessel) -> (deliveries, qty)
+        self.vessels = []
+        for column, kind in VESSEL_KINDS:
+            vessel_edges, vessels = aggregate_vessels(deliveries, column)
+            self.vessels.append((
+                kind,
+                dict(zip(vessels["vessel"].tolist(), zip(vessels["deliveries"].tolist(), vessels["qty"].tolist()))),
+                dict(zip(zip(vessel_edges["fish"].tolist(), vessel_edges["vessel"].tolist()),
+                         zip(vessel_edges["deliveries"].tolist(), vessel_edges["qty"].tolist()))),
+            ))
+
+    def node(self, data):
+        n_id = data["id"]
+        if n_id in self.deliveries:
+            date, city, fish, qty = self.deliveries[n_id]
+            return f"Cargo: {n_id}\nArrival: {date}\nCity: {city}\nFish Type: {fish}\nFish qty: {qty}"
+        if n_id in self.cities:
+            return f"City:{n_id}"
+        if n_id in self.fish:
+            return f"Fish Type: {n_id}"
+        group = group_of(data)
+        if group in self.groups:
+            count, qty = self.groups[group]
+            return (f"Deliveries: {count}\nPeriod: {group[2]}\nCity: {group[0]}\nFish Type: {group[1]}"
+                    f"\nFish qty: {round(qty, 3)}\nClick to expand")
+        for kind, vessels, _ in self.vessels:
+            if n_id in vessels:
+                count, qty = vessels[n_id]
+                return f"{kind} Vessel: {n_id}\nDeliveries: {count}\nQty: {round(qty, 3)} tons"
+        return None
+
+    def edge(self, data):
+        source, target = data["source"], data["target"]
+        if source in self.deliveries:
+            return self.delivery_edges.get((source, target))
+        group = group_of(data)
+        if group in self.groups:
+            count, qty = self.groups[group]
+            if group[0] == target:
+                return f"Deliveries: {count}\nPeriod: {group[2]}\nCity: {target}"
+            return f"Deliveries: {count}\nPeriod: {group[2]}\nFish: {target}\nQty: {round(qty, 3)} tons"
+        for kind, _, vessel_edges in self.vessels:
+            if (source, target) in vessel_edges:
+                count, qty = vessel_edges[(source, target)]
+                return f"Fish: {source}\n{kind}: {target}\nDeliveries: {count}\nQty: {round(qty, 3)} tons"
+        return None
+
+# (city, fish, period) of a group node or group edge, None for other elements
+def group_of(data):
+    group = data.get("group")
+    return tuple(group) if group else None
+
+# Index of details_key (graph_key of the dataset key and filters) from the cache, built from load_deliveries() on a miss
+def graph_details(details_key, load_deliveries):
+    found, details = _graph_details.get(details_key)
+    if not found:
+        details = GraphDetails(load_deliveries())
+        _graph_details.put(details_key, details)
+    return details
+
+def graph_element_details(details, data):
+    details_text = details.edge(data) if "source" in data else details.node(data)
+    return details_text or data["id"]
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: The browser keeps only a state key, the [id, digest] list it stands for is kept in _graph_states
+# @Description: Incremental update of the network-graph elements. state is the key of the [id, digest] list of the
+# elements the browser has, in order. The update is a dash Patch: changed elements replaced in place, missing ones
+# deleted, new ones appended; the full list is sent when the state is unknown (none yet, evicted, or stored by another
+# worker) or the patch would not be smaller. Returns the value for the elements property and the new state key.
+
+def element_digest(element):
+    return zlib.crc32(json.dumps(element, sort_keys=True).encode("utf-8"))
+
+# State key of an [id, digest] list: a hash of the list, so equal element lists share one entry
+def remember_state(keys):
+    state = hashlib.blake2b(json.dumps(keys).encode("utf-8"), digest_size=16).hexdigest()
+    _graph_states.put(state, keys)
+    return state
+
+def element_patch(state, elements):
+    keys = [[element["data"]["id"], element_digest(element)] for element in elements]
+    found, old_keys = _graph_states.get(state) if state else (False, None)
+    if not found:
+        return elements, remember_state(keys)
+    wanted = {e_id: i for i, (e_id, _) in enumerate(keys)}
+    changed = [(i, wanted[e_id]) for i, (e_id, digest) in enumerate(old_keys) if e_id in wanted and keys[wanted[e_id]][1] != digest]
+    removed = [i for i, (e_id, _) in enumerate(old_keys) if e_id not in wanted]
+    present = {e_id for e_id, _ in old_keys}
+    added = [i for i, (e_id, _) in enumerate(keys) if e_id not in present]
+    if len(changed) + len(removed) + len(added) >= len(elements):
+        return elements, remember_state(keys)
+
+    patch = Patch()
+    new_keys = [list(key) for key in old_keys]
+    # Replace before deleting, the indices are those of the browser's list
+    for i, j in changed:
+        patch[i] = elements[j]
+        new_keys[i] = keys[j]
+    for i in reversed(removed):
+        del patch[i]
+        del new_keys[i]
+    if added:
+        patch.extend([elements[i] for i in added])
+        new_keys.extend(keys[i] for i in added)
+    return patch, remember_state(new_keys)
+
+# Patch replacing a tapped group node (and its edges) by its delivery reports, and the new state key;
+# None when the state is unknown here (the caller sends expanded_elements of the rebuilt graph instead)
+def group_expansion_patch(state, tap_node):
+    found, old_keys = _graph_states.get(state) if state else (False, None)
+    if not found:
+        return None
+    group_id = tap_node["data"]["id"]
+    group_edges = {f"{group_id}->{tap_node['data']['city']}", f"{group_id}->{tap_node['data']['fish']}"}
+    elements = expand_group_elements(tap_node)
+    present = {e_id for e_id, _ in old_keys}
+    elements = [element for element in elements if element["data"]["id"] not in present]
+    patch = Patch()
+    new_keys = [list(key) for key in old_keys]
+    for i in reversed(range(len(old_keys))):
+        if old_keys[i][0] == group_id or old_keys[i][0] in group_edges:
+            del patch[i]
+            del new_keys[i]
+    patch.extend(elements)
+    new_keys.extend([element["data"]["id"], element_digest(element)] for element in elements)
+    return patch, remember_state(new_keys)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Seeded spring layout of the Network-link graph in pixels. Every node starts at a point derived from
+# its id, so the same graph always gets the same positions. A node keeps the position of its first layout (until the
+# caches are cleared), so nodes do not move when the filters change and the cytoscape updates stay small.
+
+def start_position(n_id):
+    h = zlib.crc32(str(n_id).encode("utf-8"))
+    return ((h & 0xFFFF) / 0xFFFF * 2 - 1, (h >> 16) / 0xFFFF * 2 - 1)
+
+def graph_layout(node_ids, edge_pairs):
+    if not node_ids:
+        return {}
+    # Nodes placed by an earlier layout keep their position, only the other nodes are laid out around them
+    known = {}
+    for n_id in node_ids:
+        found, position = _position_memory.get(n_id)
+        if found:
+            known[n_id] = position
+    if len(known) == len(node_ids):
+        return known
+    G = nx.Graph()
+    G.add_nodes_from(node_ids)
+    G.add_edges_from(edge_pairs)
+    scale = config.graph_layout_spacing * len(node_ids) ** 0.5
+    if not known:
+        positions = nx.spring_layout(
+            G,
+            pos={n_id: start_position(n_id) for n_id in node_ids},
+            iterations=config.graph_layout_iterations,
+            seed=config.graph_layout_seed,
+            scale=scale,
         )
-        
-        # Edge between DeliveryReport and Commodity (Fish)
-        net.add_edge(
-            delivery_id, fish, 
-            title=f"Delivery: {delivery_id}\nArrival: {date_of_arrival}\nFish: {fish}\nQty: {qty_tons} tons",
-            value=3,  # edge thickness
-            color="gray"
+    else:
+        # New nodes start next to their placed neighbours (in pixels, fixed layouts are not rescaled)
+        start = dict(known)
+        for n_id in node_ids:
+            if n_id not in known:
+                x, y = start_position(n_id)
+                neighbours = [known[other] for other in G.neighbors(n_id) if other in known]
+                if neighbours:
+                    cx = sum(position[0] for position in neighbours) / len(neighbours)
+                    cy = sum(position[1] for position in neighbours) / len(neighbours)
+                    start[n_id] = (cx + x * config.graph_layout_spacing, cy + y * config.graph_layout_spacing)
+                else:
+                    start[n_id] = (x * scale, y * scale)
+        positions = nx.spring_layout(
+            G,
+            pos=start,
+            fixed=list(known),
+            k=config.graph_layout_spacing,
+            iterations=config.graph_layout_iterations,
+            seed=config.graph_layout_seed,
         )
-        
-        # For each harbor vessel, add a node and an edge from fish to harbor vessel
-        for hv in harbor_vessels:
-            # Ensure hv is a valid string (or int)
-            hv = str(hv) if hv is not None else "Unknown"
-            net.add_node(hv, label=hv, shape = 'star', size=30, color="blue", title=f"Harbor Vessel: {hv}\nExit: {date_of_arrival}\nCity: {city_of_arrival}\nFish: {fish}\nQty: {qty_tons}")
-            net.add_edge(
-                fish, hv,
-                title=f"Delivery: {delivery_id}\nArrival: {date_of_arrival}\nCity: {city_of_arrival}\nQty: {qty_tons} tons\nHarbor: {hv}\nFish: {fish}",
-                value=(qty_tons + 3),
-                color="purple"
-            )
+    positions = {n_id: (round(float(x), 1), round(float(y), 1)) for n_id, (x, y) in positions.items()}
+    for n_id in node_ids:
+        if n_id not in known:
+            _position_memory.put(n_id, positions[n_id])
+    return positions
+
+# Layout (and tooltip) key of the network graph: dataset key (date range + data version), filters and graph type
+def graph_key(store_data, filter_data, selected_graph):
+    filter_data = filter_data or {}
+    return (
+        tuple(sorted(store_data.items())) if store_data else None,
+        normalize_arg(filter_data.get('cities')), normalize_arg(filter_data.get('vessels')), normalize_arg(filter_data.get('species')),
+        selected_graph,
+    )
 
-            # For each ping vessel, add a node and an edge from fish to ping vessel
-            for pv in ping_vessels:
-                pv = str(pv) if pv is not None else "Unknown"
-                net.add_node(pv, label=pv, size=30, color="cyan", title=f"Ping Vessel: {pv}\nDate: {date_of_arrival}\nCity: {city_of_arrival}\nFish: {fish}\nQty: {qty_tons}")
-                net.add_edge(
-                    fish, pv,
-                    title=f"Delivery: {delivery_id}\nArrival: {date_of_arrival}\nCity: {city_of_arrival}\nQty: {qty_tons} tons\nPing: {pv}\nFish: {fish}",
-                    value=qty_tons,
-                    color="yellow"
-                )
-
-    # Generate and return the HTML content
-    return net.generate_html()
+# Layout of layout_key from the cache; computed again when the key is new or its graph has other nodes
+def cached_layout(layout_key, node_ids, edge_pairs):
+    if layout_key is None:
+        return graph_layout(node_ids, edge_pairs)
+    found, positions = _layout_cache.get(layout_key)
+    if not found or len(positions) != len(node_ids) or any(n_id not in positions for n_id in node_ids):
+        positions = graph_layout(node_ids, edge_pairs)
+        _layout_cache.put(layout_key, positions)
+    return positions
 
 # def create_interactive_graph(fish_delivery_data):
 #     df = preprocess_data_for_clustering(fish_delivery_data)
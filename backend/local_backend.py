@@ -0,0 +1,386 @@
+import os
+import numpy as np
+import pandas as pd
+import config
+from backend.data_backend import (DataBackend, VESSEL_LABELS, LOCATION_LABELS, CITY_LABEL, POINT_LABEL,
+    REGION_LABEL, FISH_LABEL, DELIVERY_REPORT_LABEL, TRANSACTION_TYPE, HARBOR_REPORT_TYPE, TRANSPONDER_PING_TYPE)
+from backend.normalize import normalize_qty_tons
+from backend.attribution import AttributionIndex
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: In-memory graph snapshot backend.
+# Loads the nodes.csv/relationships.csv (or the --typed per-label files) written by convert_json_to_csv.py into indexed tables
+# and answers the same questions as the Cypher queries in neo4j_backend.py without a database.
+
+# ***************************************************************************************
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Typed headers (qty_tons:float, ...) of convert_json_to_csv.py --typed are read without the type suffix
+# @Description: Read a neo4j-admin import CSV the way the import sees it (every property a string, empty cell = no property)
+
+def read_import_csv(path):
+    df = pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""])
+    df.columns = [column if column.startswith(":") else column.split(":")[0] for column in df.columns]
+    return df.astype(object).where(df.notna(), None)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Import files of one kind in data_dir: the single file (nodes.csv) or, when it does not exist,
+# the per-label / per-type files of convert_json_to_csv.py --typed (nodes_<label>.csv)
+
+def import_files(data_dir, file_name):
+    path = os.path.join(data_dir, file_name)
+    if os.path.exists(path) or not os.path.isdir(data_dir):
+        return [path]
+    prefix = os.path.splitext(file_name)[0] + "_"
+    split = sorted(os.path.join(data_dir, name) for name in os.listdir(data_dir) if name.startswith(prefix) and name.endswith(".csv"))
+    return split or [path]
+
+def read_import_files(paths):
+    if len(paths) == 1:
+        return read_import_csv(paths[0])
+    df = pd.concat([read_import_csv(path) for path in paths], ignore_index=True)
+    # Columns missing from some of the files are NaN after the concat
+    return df.astype(object).where(df.notna(), None)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Slice a frame sorted on a string date/time column to [start, end) with binary search
+
+def slice_sorted(df, column, start, end):
+    values = df[column].to_numpy()
+    lo = np.searchsorted(values, start, side="left") if start else 0
+    hi = np.searchsorted(values, end, side="left") if end else len(values)
+    return df.iloc[lo:hi]
+
+# Sort column of the event tables used for range slicing
+RANGE_COLUMNS = {"delivery_reports": "date", "deliveries": "date", "pings": "time", "location_pings": "time"}
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: The (city, day) dict indexes are replaced by AttributionIndex (backend/attribution.py)
+# @Description: HarborReports from a vessel to a city and TransponderPings from a city to a vessel,
+# the events of the delivery attribution in get_fish_deliveries
+
+def vessel_harbor_reports(harbor):
+    return harbor[harbor["start_label"].isin(VESSEL_LABELS) & (harbor["end_label"] == CITY_LABEL)]
+
+def city_pings(pings):
+    return pings[(pings["start_label"] == CITY_LABEL) & pings["end_label"].isin(VESSEL_LABELS)]
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Backend answering dataserver queries from the in-memory graph snapshot
+
+class LocalGraphBackend(DataBackend):
+    name = "local"
+
+    def __init__(self, data_dir=None, nodes_file="nodes.csv", relationships_file="relationships.csv"):
+        data_dir = data_dir or config.local_data_dir
+        node_paths = import_files(data_dir, nodes_file)
+        relationship_paths = import_files(data_dir, relationships_file)
+        paths = node_paths + relationship_paths
+        nodes = read_import_files(node_paths)
+        relationships = read_import_files(relationship_paths)
+        # Size and modification time of the loaded files identify the snapshot
+        self.data_version = "local-" + "-".join(f"{os.stat(path).st_size}.{os.stat(path).st_mtime_ns}" for path in paths)
+        self._build_tables(nodes, relationships)
+
+    def _build_nodes(self, nodes):
+        # Node tables per label (neo4j-admin splits multiple labels on ';')
+        nodes["labels"] = nodes[":LABEL"].fillna("").str.split(";")
+        nodes["label"] = nodes["labels"].str[0]
+        self.nodes = nodes.set_index(":ID", drop=False)
+        self.nodes_by_label = {label: df for label, df in nodes.groupby("label", sort=False)}
+        self.label_of = self.nodes["label"]
+        self.labels_of = self.nodes["labels"]
+        self.name_of = self.nodes["Name"] if "Name" in self.nodes.columns else pd.Series(None, index=self.nodes.index, dtype=object)
+
+    def _build_tables(self, nodes, relationships):
+        self._build_nodes(nodes)
+
+        relationships = relationships.copy()
+        relationships["start_label"] = relationships[":START_ID"].map(self.label_of)
+        relationships["end_label"] = relationships[":END_ID"].map(self.label_of)
+        rels_by_type = {rel_type: df for rel_type, df in relationships.groupby(":TYPE", sort=False)}
+        self.rels_by_type = rels_by_type
+        empty = relationships.iloc[0:0]
+
+        # DeliveryReports sorted by date for range slicing
+        reports = self.nodes_by_label.get(DELIVERY_REPORT_LABEL, nodes.iloc[0:0])
+        reports = reports[reports["date"].notna()] if "date" in reports.columns else reports.iloc[0:0]
+        self.delivery_reports = reports.sort_values("date", kind="stable")
+
+        # First City / Fish reached through an Event.Transaction per DeliveryReport
+        transactions = rels_by_type.get(TRANSACTION_TYPE, empty)
+        transactions = transactions[transactions["start_label"] == DELIVERY_REPORT_LABEL]
+        cities = transactions[transactions["end_label"] == CITY_LABEL].drop_duplicates(":START_ID")
+        fish = transactions[transactions["end_label"] == FISH_LABEL].drop_duplicates(":START_ID")
+        deliveries = self.delivery_reports[
+            self.delivery_reports[":ID"].isin(cities[":START_ID"]) | self.delivery_reports[":ID"].isin(fish[":START_ID"])
+        ].copy()
+        deliveries["city_of_arrival"] = deliveries[":ID"].map(cities.set_index(":START_ID")[":END_ID"])
+        deliveries["fish_name"] = deliveries[":ID"].map(fish.set_index(":START_ID")[":END_ID"])
+        self.deliveries = deliveries.astype(object).where(deliveries.notna(), None)
+
+        # TransponderPings sorted by time for range slicing
+        pings = rels_by_type.get(TRANSPONDER_PING_TYPE, empty)
+        pings = pings[pings["time"].notna()] if "time" in pings.columns else pings
+        self.pings = pings.sort_values("time", kind="stable")
+        self.location_pings = self.pings[
+            self.pings["start_label"].isin(LOCATION_LABELS) & self.pings["end_label"].isin(VESSEL_LABELS)
+        ]
+
+        harbor = rels_by_type.get(HARBOR_REPORT_TYPE, empty)
+        self.harbor_reports = vessel_harbor_reports(harbor)
+        self.attribution = AttributionIndex(self.harbor_reports, city_pings(self.pings))
+
+        self._build_rollups()
+
+    # Rows of an event table (RANGE_COLUMNS, harbor_reports without bounds only) in [start, end),
+    # sliced from the sorted in-memory tables; the snapshot backend reads them from day partitions instead
+    def _range(self, table, start_date, end_date):
+        df = getattr(self, table)
+        if not start_date and not end_date:
+            return df
+        return slice_sorted(df, RANGE_COLUMNS[table], start_date, end_date)
+
+    # Attribution index covering the deliveries in [start, end)
+    def _attribution(self, start_date, end_date):
+        return self.attribution
+
+    # Daily rollups, the same tables backend/ETL_data/daily_rollups.py materializes in Neo4j
+    def _build_rollups(self):
+        node_id = self.nodes["id"]
+        reports = self.delivery_reports
+        reports = pd.DataFrame({
+            "date": reports["date"].str[:10],
+            "qty_tons": normalize_qty_tons(reports["qty_tons"] if "qty_tons" in reports.columns else [None] * len(reports)).to_numpy(),
+        })
+        pings = pd.DataFrame({
+            "date": self.location_pings["time"].str[:10],
+            "vessel": self.location_pings[":END_ID"],
+            "location": self.location_pings[":START_ID"].map(node_id),
+            "is_city": self.location_pings["start_label"] == CITY_LABEL,
+        })
+        deliveries = pd.DataFrame({
+            "date": self.deliveries["date"].str[:10],
+            "city": self.deliveries["city_of_arrival"].map(node_id),
+            "fish": self.deliveries["fish_name"].map(node_id),
+            "qty_tons": normalize_qty_tons(self.deliveries["qty_tons"] if "qty_tons" in self.deliveries.columns else [None] * len(self.deliveries)).to_numpy(),
+        })
+
+        def delivered(df, keys):
+            return df.dropna(subset=keys).groupby(keys).agg(qty_tons=("qty_tons", "sum"), report_count=("qty_tons", "size"))
+
+        def vessels(df, keys):
+            return df.groupby(keys)["vessel"].nunique().rename("num_vessels")
+
+        def rollup(parts, keys):
+            df = pd.concat(parts, axis=1).reset_index() if parts else pd.DataFrame(columns=keys)
+            counts = [column for column in ("report_count", "num_vessels") if column in df.columns]
+            df = df.fillna({"qty_tons": 0.0, **{column: 0 for column in counts}}).astype({column: int for column in counts})
+            return df.sort_values(keys, kind="stable").reset_index(drop=True)
+
+        self.daily_rollups = rollup([delivered(reports, ["date"]), vessels(pings, ["date"])], ["date"])
+        self.daily_city_rollups = rollup(
+            [delivered(deliveries, ["date", "city"]), vessels(pings[pings["is_city"]].rename(columns={"location": "city"}), ["date", "city"])],
+            ["date", "city"])
+        self.daily_species_rollups = rollup([delivered(deliveries, ["date", "fish"])], ["date", "fish"])
+
+    # Dropdown getters: label scan plus property filters, same semantics as WHERE n.prop = value
+    def _filter_ids(self, labels, filters, column="id"):
+        frames = [self.nodes_by_label[label] for label in labels if label in self.nodes_by_label]
+        if not frames:
+            return []
+        df = pd.concat(frames) if len(frames) > 1 else frames[0]
+        for prop, value in filters.items():
+            if not value:
+                continue
+            if prop not in df.columns:
+                return []  # Property missing on every node, the comparison is null
+            if isinstance(value, list):
+                df = df[df[prop].isin(value)]
+            else:
+                df = df[df[prop] == value]
+        values = df[column].tolist() if column in df.columns else [None] * len(df)
+        return values
+
+    def get_vessels(self, company=None, city=None, port=None, region=None, species=None):
+        ids = self._filter_ids(VESSEL_LABELS, {"company": company, "city": city, "port": port, "region": region, "species": species})
+        return sorted(ids)
+
+    def get_cities(self, company=None, vessel=None, port=None, region=None, species=None):
+        ids = self._filter_ids([CITY_LABEL], {"company": company, "vessel": vessel, "port": port, "region": region, "species": species})
+        return sorted(ids)
+
+    def get_city_mapping(self):
+        cities = self.nodes_by_label.get(CITY_LABEL)
+        if cities is None:
+            return {}
+        return dict(zip(cities["Name"], cities["id"]))
+
+    def get_points(self, company=None, city=None, vessel=None, region=None, species=None):
+        ids = self._filter_ids([POINT_LABEL], {"company": company, "city": city, "vessel": vessel, "region": region, "species": species})
+        return sorted(ids)
+
+    def get_species(self, company=None, city=None, port=None, region=None, vessel=None):
+        ids = self._filter_ids([FISH_LABEL], {"company": company, "city": city, "port": port, "region": region, "vessel": vessel})
+        return sorted(ids)
+
+    def get_regions(self, company=None, city=None, port=None, vessel=None, species=None):
+        ids = self._filter_ids([REGION_LABEL], {"company": company, "city": city, "port": port, "vessel": vessel, "species": species})
+        return sorted(ids)
+
+    def get_companies(self, vessel=None, city=None, port=None, region=None, species=None):
+        companies = set(self._filter_ids(
+            VESSEL_LABELS, {"id": vessel, "city": city, "port": port, "region": region, "species": species}, column="company"
+        ))
+        # ORDER BY puts null last
+        return sorted(c for c in companies if c is not None) + ([None] if None in companies else [])
+
+    def get_fish_distribution_data(self):
+        regions = self.nodes_by_label.get(REGION_LABEL)
+        if regions is None:
+            return []
+        data = []
+        for location, kind, species in zip(regions["id"], regions.get("kind", [None] * len(regions)),
+                                           regions.get("fish_species_present", [None] * len(regions))):
+            fish_list = None
+            if species is not None:
+                fish_list = [f.replace("'", "").strip() for f in species.replace("[", "").replace("]", "").split(",")]
+            data.append({"location": location, "type": kind, "fish_species_present": fish_list})
+        return data
+
+    def get_fish_deliveries(self, start_date, end_date):
+        deliveries = self._range("deliveries", start_date, end_date)
+        harbor_vessels, ping_vessels = self._attribution(start_date, end_date).attribute(deliveries["city_of_arrival"], deliveries["date"])
+        data = []
+        rows = deliveries[["id", "date", "city_of_arrival", "fish_name", "qty_tons"]].itertuples(index=False)
+        for (name, date, city, fish, qty), harbor, pings in zip(rows, harbor_vessels, ping_vessels):
+            data.append({
+                "deliveryreport_name": name,
+                "date_of_arrival": date,
+                "city_of_arrival": city,
+                "fish_name": fish,
+                "qty_tons": qty,
+                "harbor_vessels": harbor,
+                "ping_vessels": pings,
+            })
+        return data
+
+    def fetch_delivery_qty_data(self, start_date, end_date):
+        # One row per day with reports, same as the day-bucketed Cypher aggregation
+        rollups = slice_sorted(self.daily_rollups, "date", start_date, end_date)
+        rollups = rollups[rollups["report_count"] > 0]
+        return [{"date": date, "qty_tons": qty} for date, qty in zip(rollups["date"], rollups["qty_tons"])]
+
+    def fetch_vessel_cargo_data(self, start_date, end_date):
+        # d.date >= null is null in Cypher, so a missing bound matches nothing
+        if not start_date or not end_date:
+            return pd.DataFrame(), pd.DataFrame()
+        reports = self._range("delivery_reports", start_date, end_date)
+        pings = self._range("pings", start_date, end_date)
+        deliveries = pd.DataFrame({"delivery_date": reports["date"].tolist(), "qty_tons": reports["qty_tons"].tolist()}) if len(reports) else pd.DataFrame()
+        exits = pd.DataFrame({"exit_date": pings["time"].tolist(), "vessel_id": pings["target"].tolist()}) if len(pings) else pd.DataFrame()
+        return deliveries, exits
+
+    def get_transport_movements(self, start_date, end_date):
+        pings = self._range("location_pings", start_date, end_date)
+        if pings.empty:
+            return pd.DataFrame()
+        return self._transport_rows(pings)
+
+    def iter_transport_movements(self, start_date, end_date, batch_size):
+        pings = self._range("location_pings", start_date, end_date)
+        for i in range(0, len(pings), batch_size):
+            yield self._transport_rows(pings.iloc[i:i + batch_size])
+
+    def _transport_rows(self, pings):
+        return pd.DataFrame({
+            "source_location": pings[":START_ID"].map(self.nodes["id"]).tolist(),
+            "source_location_name": pings[":START_ID"].map(self.name_of).tolist(),
+            "vessel_id": pings[":END_ID"].map(self.nodes["id"]).tolist(),
+            "vessel_name": pings[":END_ID"].map(self.name_of).tolist(),
+            "vessel_type": pings[":END_ID"].map(self.labels_of).tolist(),
+            "start_time": pings["time"].tolist(),
+            "dwell": pings["dwell"].tolist() if "dwell" in pings.columns else None,
+        })
+
+    def get_vessel_counts(self, start_date, end_date):
+        # One row per day with pings, same as the day-bucketed Cypher aggregation
+        rollups = slice_sorted(self.daily_rollups, "date", start_date, end_date)
+        rollups = rollups[rollups["num_vessels"] > 0]
+        if rollups.empty:
+            return pd.DataFrame()
+        return pd.DataFrame({"date": rollups["date"].tolist(), "num_vessels": rollups["num_vessels"].tolist()})
+
+    def get_daily_rollups(self, start_date, end_date):
+        return slice_sorted(self.daily_rollups, "date", start_date, end_date).reset_index(drop=True)
+
+    def get_daily_city_rollups(self, start_date, end_date):
+        return slice_sorted(self.daily_city_rollups, "date", start_date, end_date).reset_index(drop=True)
+
+    def get_daily_species_rollups(self, start_date, end_date):
+        return slice_sorted(self.daily_species_rollups, "date", start_date, end_date).reset_index(drop=True)
+
+    def get_rollup_coverage(self):
+        # Rollups are computed from the loaded files (or exported with the snapshot), always of the current version
+        dates = self.daily_rollups["date"]
+        if dates.empty:
+            return None
+        return {"version": self.get_data_version(), "first_day": dates.min(), "last_day": dates.max()}
+
+    def get_vessel_facet_pairs(self):
+        pairs = set()
+        for label in VESSEL_LABELS:
+            vessels = self.nodes_by_label.get(label)
+            if vessels is not None and "company" in vessels.columns:
+                pairs.update(("companies", vessel, company) for vessel, company in zip(vessels["id"], vessels["company"]) if company is not None)
+        node_id = self.nodes["id"]
+        harbor = self._range("harbor_reports", None, None)
+        pairs.update(("cities", vessel, city) for vessel, city in zip(harbor[":START_ID"].map(node_id), harbor[":END_ID"].map(node_id)))
+        pings = self._range("location_pings", None, None)
+        facet_of = {CITY_LABEL: "cities", POINT_LABEL: "ports", REGION_LABEL: "regions"}
+        pairs.update(zip(pings["start_label"].map(facet_of), pings[":END_ID"].map(node_id), pings[":START_ID"].map(node_id)))
+        return list(pairs)
+
+    def get_vessel_species_pairs(self):
+        # One attribution per distinct (city, day, fish) instead of per delivery
+        deliveries = self._range("deliveries", None, None)
+        keys = pd.DataFrame({
+            "city": deliveries["city_of_arrival"].to_numpy(),
+            "date": deliveries["date"].str[:10].to_numpy(),
+            "fish": deliveries["fish_name"].to_numpy(),
+        })
+        keys = keys[keys["fish"].notna()].drop_duplicates()
+        harbor_vessels, ping_vessels = self._attribution(None, None).attribute(keys["city"], keys["date"])
+        return list({(vessel, fish) for fish, harbor, pings in zip(keys["fish"], harbor_vessels, ping_vessels)
+                     for vessel in harbor + pings if vessel is not None})
+
+    def get_data_version(self):
+        return self.data_version
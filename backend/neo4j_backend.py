@@ -0,0 +1,837 @@
+import threading
+import time
+from datetime import date, datetime
+from neo4j import GraphDatabase
+import pandas as pd
+import config
+from backend.data_backend import (DataBackend, VESSEL_LABELS, CITY_LABEL, POINT_LABEL, REGION_LABEL, FISH_LABEL, note_fetch_error,
+    DAILY_ROLLUP_LABEL, DAILY_CITY_ROLLUP_LABEL, DAILY_SPECIES_ROLLUP_LABEL, ROLLUP_COVERAGE_LABEL)
+from backend.query_builder import build_node_query, record_query
+from backend.temporal_index import TemporalEdgeIndex
+from backend.attribution import AttributionIndex
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2024-11-08
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Moved from dataserver.py into the Neo4j implementation of DataBackend
+# @Description: Connection to Neo4j database and data fetching
+
+# Neo4j connection details
+uri = "bolt://localhost:7687"
+username = "neo4j"
+password = "asdf1234"
+
+# get_fish_deliveries on the native day keys added by backend/ETL_data/bootstrap_schema.py:
+# the city is found through its id constraint and harbor reports / pings are matched on indexed day properties
+FISH_DELIVERIES_DAY_KEY_QUERY = """
+                MATCH
+                (cargo:`Entity.Document.DeliveryReport`)-[:`Event.Transaction`]->(targetEntity)
+                WHERE
+                {date_range} AND
+                (targetEntity:`Entity.Commodity.Fish` OR targetEntity:`Entity.Location.City`)
+                WITH
+                cargo,
+                cargo.id AS deliveryreport_name,
+                COLLECT(CASE WHEN targetEntity:`Entity.Location.City` THEN targetEntity.id ELSE null END)[0] AS city_of_arrival,
+                COLLECT(CASE WHEN targetEntity:`Entity.Commodity.Fish` THEN targetEntity.id ELSE null END)[0] AS fish_name,
+                toString(cargo.date) AS date_of_arrival,
+                cargo.qty_tons AS qty_tons
+                OPTIONAL MATCH
+                (vessel)-[harbor:`Event.HarborReport`]->(city:`Entity.Location.City` {id: city_of_arrival})
+                WHERE
+                (vessel:`Entity.Vessel.FishingVessel` OR vessel:`Entity.Vessel.CargoVessel`) AND
+                harbor.target = city_of_arrival AND
+                harbor.day IN [cargo.day, cargo.day + duration('P1D')]
+                WITH
+                cargo, deliveryreport_name, date_of_arrival, city_of_arrival, fish_name, qty_tons,
+                COLLECT(harbor.source) AS harbor_vessels
+                OPTIONAL MATCH
+                    (city:`Entity.Location.City` {id: city_of_arrival})-[ping:`Event.TransportEvent.TransponderPing`]->(vessel)
+                WHERE
+                    (vessel:`Entity.Vessel.FishingVessel` OR vessel:`Entity.Vessel.CargoVessel`) AND
+                    ping.source = city_of_arrival AND
+                    ping.day = cargo.day
+                WITH
+                cargo, deliveryreport_name, date_of_arrival, city_of_arrival, fish_name, qty_tons, harbor_vessels,
+                COLLECT(ping.target) AS ping_vessels
+                RETURN
+                deliveryreport_name, date_of_arrival, city_of_arrival, fish_name, qty_tons,
+                harbor_vessels, ping_vessels
+"""
+
+# get_fish_deliveries with the attribution engine: deliveries with their city and fish only, the harbor reports
+# and pings of each delivery are joined in Python (AttributionIndex built from the two queries below)
+FISH_DELIVERIES_QUERY = """
+                MATCH
+                (cargo:`Entity.Document.DeliveryReport`)-[:`Event.Transaction`]->(targetEntity)
+                WHERE
+                {date_range} AND
+                (targetEntity:`Entity.Commodity.Fish` OR targetEntity:`Entity.Location.City`)
+                WITH
+                cargo,
+                COLLECT(CASE WHEN targetEntity:`Entity.Location.City` THEN targetEntity.id ELSE null END)[0] AS city_of_arrival,
+                COLLECT(CASE WHEN targetEntity:`Entity.Commodity.Fish` THEN targetEntity.id ELSE null END)[0] AS fish_name
+                RETURN
+                cargo.id AS deliveryreport_name, toString(cargo.date) AS date_of_arrival, city_of_arrival, fish_name,
+                cargo.qty_tons AS qty_tons
+"""
+
+ATTRIBUTION_HARBOR_QUERY = """
+        MATCH (vessel)-[harbor:`Event.HarborReport`]->(city:`Entity.Location.City`)
+        WHERE vessel:`Entity.Vessel.FishingVessel` OR vessel:`Entity.Vessel.CargoVessel`
+        RETURN harbor.source AS source, harbor.target AS target, toString(harbor.date) AS date
+"""
+
+ATTRIBUTION_PING_QUERY = """
+        MATCH (city:`Entity.Location.City`)-[ping:`Event.TransportEvent.TransponderPing`]->(vessel)
+        WHERE vessel:`Entity.Vessel.FishingVessel` OR vessel:`Entity.Vessel.CargoVessel`
+        RETURN ping.source AS source, ping.target AS target, toString(ping.time) AS time
+"""
+
+# TransponderPing rows between locations and vessels, used by get_transport_movements and iter_transport_movements
+TRANSPORT_MOVEMENTS_QUERY = """
+        MATCH (start)-[r:`Event.TransportEvent.TransponderPing`]->(end)
+        WHERE
+            {date_range}
+            AND (start:`Entity.Location.City` OR
+            start:`Entity.Location.Point` OR
+            start:`Entity.Location.Region`) AND
+            (end:`Entity.Vessel.FishingVessel` OR end:`Entity.Vessel.CargoVessel`)
+        RETURN
+            start.id AS source_location,
+            start.Name AS source_location_name,
+            end.id AS vessel_id,
+            end.Name AS vessel_name,
+            labels(end) AS vessel_type,
+            toString(r.time) AS start_time,
+            r.dwell AS dwell
+"""
+
+# Distinct (city, day, fish) of the delivery reports, attributed to vessels by get_vessel_species_pairs
+VESSEL_SPECIES_KEYS_QUERY = """
+        MATCH (d:`Entity.Document.DeliveryReport`)-[:`Event.Transaction`]->(f:`Entity.Commodity.Fish`)
+        MATCH (d)-[:`Event.Transaction`]->(c:`Entity.Location.City`)
+        RETURN DISTINCT c.id AS city, left(toString(d.date), 10) AS date, f.id AS fish
+"""
+
+# Distinct (vessel, fish) with the attribution in Cypher (harbor reports of the delivery day or the day after,
+# city pings of the delivery day), evaluated once per distinct (city, day, fish)
+VESSEL_SPECIES_QUERY = """
+        MATCH (d:`Entity.Document.DeliveryReport`)-[:`Event.Transaction`]->(f:`Entity.Commodity.Fish`)
+        MATCH (d)-[:`Event.Transaction`]->(c:`Entity.Location.City`)
+        WITH DISTINCT c, f.id AS fish, date(left(toString(d.date), 10)) AS day
+        CALL {
+            WITH c, day
+            MATCH (vessel)-[harbor:`Event.HarborReport`]->(c)
+            WHERE (vessel:`Entity.Vessel.FishingVessel` OR vessel:`Entity.Vessel.CargoVessel`) AND
+                date(left(toString(harbor.date), 10)) IN [day, day + duration('P1D')]
+            RETURN harbor.source AS vessel
+            UNION
+            WITH c, day
+            MATCH (c)-[ping:`Event.TransportEvent.TransponderPing`]->(vessel)
+            WHERE (vessel:`Entity.Vessel.FishingVessel` OR vessel:`Entity.Vessel.CargoVessel`) AND
+                date(left(toString(ping.time), 10)) = day
+            RETURN ping.target AS vessel
+        }
+        RETURN DISTINCT vessel, fish
+"""
+
+# Upper bound of the transport movement rows (all pings), read from the count store to size the temporal edge index
+TRANSPORT_PING_COUNT_QUERY = """
+        MATCH ()-[r:`Event.TransportEvent.TransponderPing`]->()
+        RETURN count(r) AS count
+"""
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Put the date range predicate of property into the {date_range} placeholder of query.
+# Only the bounds that are set are written out, so an open range gives another query text instead of
+# `(x >= $start_date OR $start_date IS NULL)`, which the planner cannot answer with a range index seek.
+
+def range_query(query, prop, start_date, end_date):
+    bounds = []
+    if start_date:
+        bounds.append(f"{prop} >= $start_date")
+    if end_date:
+        bounds.append(f"{prop} < $end_date")
+    return query.replace("{date_range}", " AND ".join(bounds) if bounds else "true")
+
+class Neo4jBackend(DataBackend):
+    name = "neo4j"
+
+    def __init__(self, uri=uri, username=username, password=password):
+        self.driver = GraphDatabase.driver(uri, auth=(username, password))
+        self._day_keys = None  # Set by has_day_keys()
+        self._typed_dates = None  # Set by has_typed_dates()
+        self._transport_index = None  # Set by transport_index()
+        self._transport_index_lock = threading.Lock()
+        self._transport_index_failed_at = None  # time.monotonic() of the last failed build
+        self._attribution_index = None  # Set by attribution_index()
+        self._attribution_index_lock = threading.Lock()
+        self._version = None
+
+    def close(self):
+        self.driver.close()
+
+    def _run(self, session, query, **params):
+        # Every query goes through here so executions can be counted per query text (distinct vs repeated texts)
+        record_query(query)
+        return session.run(query, **params)
+
+    def has_day_keys(self):
+        # True once backend/ETL_data/bootstrap_schema.py has added the native day keys (checked again on a new data version)
+        if self._day_keys is None:
+            with self.driver.session() as session:
+                try:
+                    record = self._run(session, "MATCH (m:`Schema.Bootstrap`) RETURN max(m.version) AS version").single()
+                    self._day_keys = bool(record and record["version"])
+                except Exception as e:
+                    print("Error checking schema bootstrap:", e)
+                    return False
+        return self._day_keys
+
+    def has_typed_dates(self):
+        # True when date / time are stored as native temporal values (convert_json_to_csv.py --typed import)
+        if self._typed_dates is None:
+            with self.driver.session() as session:
+                try:
+                    record = self._run(session, """
+                    MATCH (d:`Entity.Document.DeliveryReport`) WHERE d.date IS NOT NULL
+                    RETURN d.date AS date LIMIT 1
+                    """).single()
+                    self._typed_dates = bool(record) and not isinstance(record["date"], str)
+                except Exception as e:
+                    print("Error checking date property type:", e)
+                    return False
+        return self._typed_dates
+
+    def transport_index(self):
+        # Temporal edge index of the transport movement pings (opt-in, TEMPORAL_INDEX=1), built from one streamed pass
+        # on first use and again after a data version change; None (Cypher per range) when disabled or the build fails.
+        # The arrays are sized from the relationship count store and filled batch by batch.
+        # A failed build is not retried for temporal_index_retry_seconds or until the data version changes,
+        # each attempt is a full scan of the pings
+        if not config.temporal_index_enabled:
+            return None
+        with self._transport_index_lock:
+            if self._transport_index is None:
+                if (self._transport_index_failed_at is not None
+                        and time.monotonic() - self._transport_index_failed_at < config.temporal_index_retry_seconds):
+                    return None
+                try:
+                    with self.driver.session() as session:
+                        record = self._run(session, TRANSPORT_PING_COUNT_QUERY).single()
+                    batches = self._query_transport_movements(None, None, config.transport_stream_batch_size)
+                    self._transport_index = TemporalEdgeIndex.from_batches(batches, record["count"] if record else 0)
+                except Exception as e:
+                    print("Error building temporal edge index:", e)
+                    self._transport_index_failed_at = time.monotonic()
+                    return None
+            return self._transport_index
+
+    def attribution_index(self):
+        # Harbor report and city ping index of the delivery attribution, built on first use and again after
+        # a data version change; None (OPTIONAL MATCH query) when disabled or the build fails
+        if not config.attribution_engine_enabled:
+            return None
+        with self._attribution_index_lock:
+            if self._attribution_index is None:
+                try:
+                    with self.driver.session(fetch_size=config.transport_stream_batch_size) as session:
+                        harbor = pd.DataFrame(self._run(session, ATTRIBUTION_HARBOR_QUERY).data(), columns=["source", "target", "date"])
+                        pings = pd.DataFrame(self._run(session, ATTRIBUTION_PING_QUERY).data(), columns=["source", "target", "time"])
+                    self._attribution_index = AttributionIndex(harbor, pings)
+                except Exception as e:
+                    print("Error building attribution index:", e)
+                    return None
+            return self._attribution_index
+
+    def _range_params(self, start_date, end_date, kind):
+        # $start_date / $end_date as strings, or as date (kind "date") / localdatetime (kind "time") parameters
+        # for a typed import, so the range comparisons of range_query stay index seeks on either storage
+        if not self.has_typed_dates():
+            return {"start_date": start_date, "end_date": end_date}
+        convert = (lambda value: date.fromisoformat(value[:10])) if kind == "date" else datetime.fromisoformat
+        return {"start_date": convert(start_date) if start_date else None, "end_date": convert(end_date) if end_date else None}
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2024-11-18
+# @Last Modified by:   Asta Omarsdottir
+# @Last Modified time: 2024-01-05
+# @Description: get vessels for dropdown filter
+# 2024-01-05 Each dropdown dynamically updates based on selected values in other dropdowns.
+# 2026-10-18 Filters are passed as $params, one constant query text per getter (query_builder.py).
+# 2026-10-18 A failed query is flagged with note_fetch_error(), its empty list is not cached.
+
+    def get_vessels(self, company=None, city=None, port=None, region=None, species=None):
+        query, params = build_node_query(VESSEL_LABELS, {"company": company, "city": city, "port": port, "region": region, "species": species})
+        with self.driver.session() as session:
+            try:
+                result = self._run(session, query, **params)
+                ids = [record["id"] for record in result]  # extract id:n
+                return ids
+            except Exception as e:
+                print("Error fetching vessels:", e)
+                note_fetch_error()
+                return []  # Return empty list in case of error
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2024-11-18
+# @Last Modified by:   Asta Omarsdottir
+# @Last Modified time: 2024-01-05
+# @Description: get cities for dropdown filter
+# 2024-01-05 Each dropdown dynamically updates based on selected values in other dropdowns.
+# 2026-10-18 Filters are passed as $params, one constant query text per getter (query_builder.py).
+# 2026-10-18 A failed query is flagged with note_fetch_error(), its empty list is not cached.
+
+    def get_cities(self, company=None, vessel=None, port=None, region=None, species=None):
+        query, params = build_node_query([CITY_LABEL], {"company": company, "vessel": vessel, "port": port, "region": region, "species": species})
+        with self.driver.session() as session:
+            try:
+                result = self._run(session, query, **params)
+                ids = [record["id"] for record in result]  # Extract id:n
+                return ids
+            except Exception as e:
+                print("Error fetching cities:", e)
+                note_fetch_error()
+                return []  # Return empty list in case of error
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2024-11-24
+# @Last Modified by:
+# @Last Modified time:
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: A failed query is flagged with note_fetch_error(), its empty mapping is not cached
+# @Description: create mapping between {name: id} for geojson and nodes json
+
+    def get_city_mapping(self):
+        query = """
+        MATCH (n:`Entity.Location.City`)
+        RETURN n.id AS id, n.Name AS name
+        """
+        with self.driver.session() as session:
+            try:
+                result = self._run(session, query)
+                mapping = {record["name"]: record["id"] for record in result}
+                return mapping
+            except Exception as e:
+                print("Error fetching city mapping:", e)
+                note_fetch_error()
+                return {}  # Return empty dict on error
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2024-11-24
+# @Last Modified by:   Asta Omarsdottir
+# @Last Modified time: 2024-01-05
+# @Description: get ports for dropdown filter
+# 2024-01-05 Each dropdown dynamically updates based on selected values in other dropdowns.
+# 2026-10-18 Filters are passed as $params, one constant query text per getter (query_builder.py).
+# 2026-10-18 A failed query is flagged with note_fetch_error(), its empty list is not cached.
+
+    def get_points(self, company=None, city=None, vessel=None, region=None, species=None):
+        query, params = build_node_query([POINT_LABEL], {"company": company, "city": city, "vessel": vessel, "region": region, "species": species})
+        with self.driver.session() as session:
+            try:
+                result = self._run(session, query, **params)
+                ids = [record["id"] for record in result]  # Extract id:n
+                return ids
+            except Exception as e:
+                print("Error fetching ports:", e)
+                note_fetch_error()
+                return []  # Return empty list in case of error
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2024-11-24
+# @Last Modified by:   Asta Omarsdottir
+# @Last Modified time: 2024-01-05
+# @Description: get species for dropdown filter
+# 2024-01-05 Each dropdown dynamically updates based on selected values in other dropdowns.
+# 2026-10-18 Filters are passed as $params, one constant query text per getter (query_builder.py).
+# 2026-10-18 A failed query is flagged with note_fetch_error(), its empty list is not cached.
+
+    def get_species(self, company=None, city=None, port=None, region=None, vessel=None):
+        query, params = build_node_query([FISH_LABEL], {"company": company, "city": city, "port": port, "region": region, "vessel": vessel})
+        with self.driver.session() as session:
+            try:
+                result = self._run(session, query, **params)
+                ids = [record["id"] for record in result]  # Extract id:n
+                return ids
+            except Exception as e:
+                print("Error fetching species:", e)
+                note_fetch_error()
+                return []  # Return empty list in case of error
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2024-11-24
+# @Last Modified by:   Asta Omarsdottir
+# @Last Modified time: 2024-01-05
+# @Description: get regions for dropdown filter
+# 2024-01-05 Each dropdown dynamically updates based on selected values in other dropdowns.
+# 2026-10-18 Filters are passed as $params, one constant query text per getter (query_builder.py).
+# 2026-10-18 A failed query is flagged with note_fetch_error(), its empty list is not cached.
+
+    def get_regions(self, company=None, city=None, port=None, vessel=None, species=None):
+        query, params = build_node_query([REGION_LABEL], {"company": company, "city": city, "port": port, "vessel": vessel, "species": species})
+        with self.driver.session() as session:
+            try:
+                result = self._run(session, query, **params)
+                ids = [record["id"] for record in result]  # Extract ID:n
+                return ids
+            except Exception as e:
+                print("Error fetching regions:", e)
+                note_fetch_error()
+                return []  # Return empty list in case of error
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2024-12-19
+# @Last Modified by:   Asta Omarsdottir
+# @Last Modified time: 2024-01-05
+# @Description: get companies for dropdown filter
+# 2024-01-05 Each dropdown dynamically updates based on selected values in other dropdowns.
+# 2026-10-18 Filters are passed as $params, one constant query text per getter (query_builder.py).
+# 2026-10-18 A failed query is flagged with note_fetch_error(), its empty list is not cached.
+
+    def get_companies(self, vessel=None, city=None, port=None, region=None, species=None):
+        query, params = build_node_query(
+            VESSEL_LABELS, {"id": vessel, "city": city, "port": port, "region": region, "species": species},
+            return_clause="DISTINCT n.company AS company", order_by="company"
+        )
+        with self.driver.session() as session:
+            try:
+                result = self._run(session, query, **params)
+                ids = [record["company"] for record in result]  # Extract company as id:n
+                return ids
+            except Exception as e:
+                print("Error fetching regions:", e)
+                note_fetch_error()
+                return []  # Return empty list in case of error
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2025-03-04
+# @Last Modified by:   undefined
+# @Last Modified time: 2025-03-04
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: A failed query is flagged with note_fetch_error(), its empty list is not cached
+# @Description: Fetches the data for the treemap visualization
+
+    def get_fish_distribution_data(self):
+        with self.driver.session() as session:
+            try:
+                query = """
+                MATCH (l:`Entity.Location.Region`)
+                WITH l,
+                    [f IN split(replace(replace(l.fish_species_present, "[", ""), "]", ""), ",") | trim(replace(f, "'", ""))] AS fish_list
+                RETURN l.id AS location, l.kind AS type, fish_list AS fish_species_present
+                """
+                result = self._run(session, query)
+                data = [record.data() for record in result]
+
+                # Ensure fish_species_present is always a list
+                for location in data:
+                    if isinstance(location["fish_species_present"], str):
+                        location["fish_species_present"] = [
+                            fish.strip().replace("'", "")
+                            for fish in location["fish_species_present"].strip("[]").split(",")
+                        ]
+
+                return data
+            except Exception as e:
+                print("Error fetching fish distribution data:", e)
+                note_fetch_error()
+                return []
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2025-01-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2025-01-18
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: A failed query is flagged with note_fetch_error() so the segment cache does not keep its empty result
+# @Last Modified: Uses the day keys of bootstrap_schema.py when present (FISH_DELIVERIES_DAY_KEY_QUERY)
+# @Last Modified: Works on a typed import too: range parameters from _range_params, dates and times returned as strings
+# @Last Modified: Attribution engine (attribution_index) replaces the OPTIONAL MATCH chain when enabled
+# @Last Modified: Date range written with range_query (only the bounds that are set) so it stays an index seek
+# @Description: Fetch fish deliveries from the database for Network-Link graph (pyvis)
+
+    def get_fish_deliveries(self, start_date, end_date):
+        attribution = self.attribution_index()
+        day_keys = attribution is None and self.has_day_keys()
+        with self.driver.session() as session:
+            try:
+                if attribution is not None:
+                    data = self._run(session, range_query(FISH_DELIVERIES_QUERY, "cargo.date", start_date, end_date), **self._range_params(start_date, end_date, "date")).data()
+                    harbor_vessels, ping_vessels = attribution.attribute(
+                        [row["city_of_arrival"] for row in data], [row["date_of_arrival"] for row in data])
+                    for row, harbor, pings in zip(data, harbor_vessels, ping_vessels):
+                        row["harbor_vessels"] = harbor
+                        row["ping_vessels"] = pings
+                    return data
+
+                query = """
+                MATCH
+                (cargo:`Entity.Document.DeliveryReport`)-[:`Event.Transaction`]->(targetEntity)
+                WHERE
+                {date_range} AND
+                (targetEntity:`Entity.Commodity.Fish` OR targetEntity:`Entity.Location.City`)
+                WITH
+                cargo,
+                cargo.id AS deliveryreport_name,
+                COLLECT(CASE WHEN targetEntity:`Entity.Location.City` THEN targetEntity.id ELSE null END)[0] AS city_of_arrival,
+                COLLECT(CASE WHEN targetEntity:`Entity.Commodity.Fish` THEN targetEntity.id ELSE null END)[0] AS fish_name,
+                toString(cargo.date) AS date_of_arrival,
+                cargo.qty_tons AS qty_tons
+                OPTIONAL MATCH
+                (vessel)-[harbor:`Event.HarborReport`]->(city:`Entity.Location.City`)
+                WHERE
+                (vessel:`Entity.Vessel.FishingVessel` OR vessel:`Entity.Vessel.CargoVessel`) AND
+                harbor.target = city_of_arrival AND
+                (date(cargo.date) = date(harbor.date) OR date(cargo.date) + duration('P1D') = date(harbor.date))
+                WITH
+                cargo, deliveryreport_name, date_of_arrival, city_of_arrival, fish_name, qty_tons,
+                COLLECT(harbor.source) AS harbor_vessels
+                OPTIONAL MATCH
+                    (city:`Entity.Location.City`)-[ping:`Event.TransportEvent.TransponderPing`]->(vessel)
+                WHERE
+                    (vessel:`Entity.Vessel.FishingVessel` OR vessel:`Entity.Vessel.CargoVessel`) AND
+                    ping.source = city_of_arrival AND
+                    (date(cargo.date) = date(left(toString(ping.time), 10)))
+                WITH
+                cargo, deliveryreport_name, date_of_arrival, city_of_arrival, fish_name, qty_tons, harbor_vessels,
+                COLLECT(ping.target) AS ping_vessels
+                RETURN
+                deliveryreport_name, date_of_arrival, city_of_arrival, fish_name, qty_tons,
+                harbor_vessels, ping_vessels
+
+            """
+                if day_keys:
+                    # Index seeks on the day keys instead of date() per candidate row
+                    query = FISH_DELIVERIES_DAY_KEY_QUERY
+                result = self._run(session, range_query(query, "cargo.date", start_date, end_date), **self._range_params(start_date, end_date, "date"))
+                data = [record.data() for record in result]
+                return data
+            except Exception as e:
+                print("Error fetching delivery data:", e)
+                note_fetch_error()
+                return []  # Return empty list in case of error
+
+# @Author: Nupur Mittal
+# @Email: nupurmittal5@gmail.com
+# @Date: 2024-11-08
+# @Last Modified by:   Asta Omarsdottir
+# @Last Modified time: 2025-03-01
+# @Last Modified: Added dates
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: A failed query is flagged with note_fetch_error() so the segment cache does not keep its empty result
+# @Last Modified: One row per day: qty_tons normalized and summed in Cypher (comma decimals, invalid/negative as 0)
+# @Last Modified: Works on a typed import too: range parameters from _range_params, dates and times returned as strings
+# @Last Modified: Date range written with range_query (only the bounds that are set) so it stays an index seek
+# @Description: Get data from DeliveryReport to analyse fish quantity and seasonal trends in temporal and seasonal graph
+
+    def fetch_delivery_qty_data(self, start_date, end_date):
+        with self.driver.session() as session:
+            try:
+                query = """
+                MATCH (d:`Entity.Document.DeliveryReport`)
+                WHERE {date_range}
+                WITH left(toString(d.date), 10) AS date, toFloat(replace(toString(d.qty_tons), ',', '.')) AS qty
+                RETURN date, sum(CASE WHEN qty IS NULL OR qty < 0 THEN 0.0 ELSE qty END) AS qty_tons
+                ORDER BY date
+                """
+                result = self._run(session, range_query(query, "d.date", start_date, end_date), **self._range_params(start_date, end_date, "date"))
+                data = [record.data() for record in result]
+
+                return data
+            except Exception as e:
+                print("Error fetching delivery qty data:", e)
+                note_fetch_error()
+                return []  # Return empty list in case of error
+
+# @Author: Nupur Mittal
+# @Email: nupurmittal5@gmail.com
+# @Date: 2024-11-08
+# @Last Modified by:   Asta Omarsdottir
+# @Last Modified time: 2024-11-13
+# @Last Modified: Moved from matching vessel cargo.py with some changes
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Works on a typed import too: range parameters from _range_params, dates and times returned as strings
+# @Last Modified: A failed query is flagged with note_fetch_error(), its empty frames are not cached
+# @Description: Get data from DeliveryReport and TransponderPing to analyse vessel, cargo data in for cluster-plot graph
+
+    def fetch_vessel_cargo_data(self, start_date, end_date):
+        with self.driver.session() as session:
+            try:
+                delivery_result = self._run(session, """
+                MATCH (d:`Entity.Document.DeliveryReport`)
+                WHERE d.date >= $start_date AND d.date < $end_date
+                RETURN toString(d.date) AS delivery_date, d.qty_tons AS qty_tons
+                """, **self._range_params(start_date, end_date, "date"))
+                deliveries = pd.DataFrame(delivery_result.data())
+
+                exit_result = self._run(session, """
+                MATCH p=()-[e:`Event.TransportEvent.TransponderPing`]->()
+                WHERE e.time >= $start_date AND e.time < $end_date
+                RETURN toString(e.time) AS exit_date, e.target AS vessel_id
+                """, **self._range_params(start_date, end_date, "time"))
+                exits = pd.DataFrame(exit_result.data())
+
+                return deliveries, exits
+            except Exception as e:
+                print("Error fetching vessel cargo data:", e)
+                note_fetch_error()
+                return pd.DataFrame(), pd.DataFrame()  # Return empty frames in case of error
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2024-12-10
+# @Last Modified by:   undefined
+# @Last Modified time: 2024-12-19
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: A failed query is flagged with note_fetch_error() so the segment cache does not keep its empty result
+# @Last Modified: Query text moved to TRANSPORT_MOVEMENTS_QUERY, shared with iter_transport_movements
+# @Last Modified: Works on a typed import too: range parameters from _range_params, dates and times returned as strings
+# @Last Modified: Answered from the temporal edge index (transport_index) when enabled
+# @Last Modified: Date range written with range_query (only the bounds that are set) so it stays an index seek
+# @Description: Fetch data for heatmap visualizing dwell time in locations over time
+
+    def get_transport_movements(self, start_date, end_date):
+        index = self.transport_index()
+        if index is not None:
+            return index.transport_movements(start_date, end_date)
+        with self.driver.session() as session:
+            try:
+                result = self._run(session, range_query(TRANSPORT_MOVEMENTS_QUERY, "r.time", start_date, end_date), **self._range_params(start_date, end_date, "time"))
+                transport_events = [record.data() for record in result]
+                df = pd.DataFrame(transport_events) if transport_events else pd.DataFrame()
+                return df
+            except Exception as e:
+                # Handle errors gracefully and return an empty DataFrame
+                print("Error fetching transport data:", e)
+                note_fetch_error()
+                return pd.DataFrame()
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: Date range written with range_query (only the bounds that are set) so it stays an index seek
+# @Last Modified: Always the batched query, the temporal edge index is not built (or sliced) for streaming
+# @Description: Stream the transport movement rows in DataFrames of at most batch_size rows.
+# The session fetch_size makes the driver pull records from the server batch by batch,
+# so only one batch is held in memory however wide the date range is.
+
+    def iter_transport_movements(self, start_date, end_date, batch_size):
+        return self._query_transport_movements(start_date, end_date, batch_size)
+
+    def _query_transport_movements(self, start_date, end_date, batch_size):
+        with self.driver.session(fetch_size=batch_size) as session:
+            result = self._run(session, range_query(TRANSPORT_MOVEMENTS_QUERY, "r.time", start_date, end_date), **self._range_params(start_date, end_date, "time"))
+            batch = []
+            for record in result:
+                batch.append(record.data())
+                if len(batch) >= batch_size:
+                    yield pd.DataFrame(batch)
+                    batch = []
+            if batch:
+                yield pd.DataFrame(batch)
+
+# @Author: Asta Omarsdottir
+# @Email: asta.omarsdottir@gmail.com
+# @Date: 2025-03-01
+# @Last Modified by:   undefined
+# @Last Modified time: 2025-03-01
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: A failed query is flagged with note_fetch_error() so the segment cache does not keep its empty result
+# @Last Modified: One row per day: distinct vessels counted per day bucket in Cypher instead of per ping timestamp
+# @Last Modified: Works on a typed import too: range parameters from _range_params, dates and times returned as strings
+# @Last Modified: Answered from the temporal edge index (transport_index) when enabled
+# @Last Modified: Date range written with range_query (only the bounds that are set) so it stays an index seek
+# @Description: Fetch vessel data for temporal and seasonal graph
+
+    def get_vessel_counts(self, start_date, end_date):
+        query = """
+        MATCH (start)-[r:`Event.TransportEvent.TransponderPing`]->(end)
+        WHERE
+            {date_range}
+            AND (start:`Entity.Location.City` OR
+            start:`Entity.Location.Point` OR
+            start:`Entity.Location.Region`) AND
+            (end:`Entity.Vessel.FishingVessel` OR end:`Entity.Vessel.CargoVessel`)
+        WITH left(toString(r.time), 10) AS date, end
+        RETURN
+            date,
+            COUNT(DISTINCT end) AS num_vessels
+        ORDER BY date
+        """
+        index = self.transport_index()
+        if index is not None:
+            return index.vessel_counts(start_date, end_date)
+        with self.driver.session() as session:
+            try:
+                result = self._run(session, range_query(query, "r.time", start_date, end_date), **self._range_params(start_date, end_date, "time"))
+                vessel_counts = [record.data() for record in result]
+                df = pd.DataFrame(vessel_counts) if vessel_counts else pd.DataFrame()
+                return df
+            except Exception as e:
+                print("Error fetching vessel count data:", e)
+                note_fetch_error()
+                return pd.DataFrame()
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: Date range written with range_query (only the bounds that are set) so it stays an index seek
+# @Last Modified: get_rollup_coverage, the data version of the last refresh (dataset_store.py only uses current rollups)
+# @Description: Read the daily rollup nodes materialized by backend/ETL_data/daily_rollups.py
+
+    def _get_rollups(self, label, columns, start_date, end_date):
+        query = f"""
+        MATCH (r:`{label}`)
+        WHERE {{date_range}}
+        RETURN {", ".join(f"r.{column} AS {column}" for column in columns)}
+        ORDER BY date
+        """
+        with self.driver.session() as session:
+            try:
+                result = self._run(session, range_query(query, "r.date", start_date, end_date), start_date=start_date, end_date=end_date)
+                rollups = [record.data() for record in result]
+                return pd.DataFrame(rollups) if rollups else pd.DataFrame()
+            except Exception as e:
+                print("Error fetching daily rollups:", e)
+                note_fetch_error()
+                return pd.DataFrame()
+
+    def get_daily_rollups(self, start_date, end_date):
+        return self._get_rollups(DAILY_ROLLUP_LABEL, ["date", "qty_tons", "report_count", "num_vessels"], start_date, end_date)
+
+    def get_daily_city_rollups(self, start_date, end_date):
+        return self._get_rollups(DAILY_CITY_ROLLUP_LABEL, ["date", "city", "qty_tons", "report_count", "num_vessels"], start_date, end_date)
+
+    def get_daily_species_rollups(self, start_date, end_date):
+        return self._get_rollups(DAILY_SPECIES_ROLLUP_LABEL, ["date", "fish", "qty_tons", "report_count"], start_date, end_date)
+
+    def get_rollup_coverage(self):
+        # Written by daily_rollups.py at the end of every refresh
+        with self.driver.session() as session:
+            try:
+                record = self._run(session, f"""
+                MATCH (c:`{ROLLUP_COVERAGE_LABEL}` {{name: 'daily'}})
+                RETURN c.version AS version, c.first_day AS first_day, c.last_day AS last_day
+                """).single()
+                return record.data() if record and record["version"] else None
+            except Exception as e:
+                print("Error fetching rollup coverage:", e)
+                note_fetch_error()
+                return None
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Vessel links for the dropdown facet index: company, cities visited (harbor reports and pings)
+# and points/regions pinged. A failed query is flagged with note_fetch_error() so the facet index is not cached.
+
+    def get_vessel_facet_pairs(self):
+        query = """
+        MATCH (v)
+        WHERE (v:`Entity.Vessel.CargoVessel` OR v:`Entity.Vessel.FishingVessel`) AND v.company IS NOT NULL
+        RETURN 'companies' AS facet, v.id AS vessel, v.company AS value
+        UNION
+        MATCH (v)-[:`Event.HarborReport`]->(c:`Entity.Location.City`)
+        WHERE (v:`Entity.Vessel.CargoVessel` OR v:`Entity.Vessel.FishingVessel`)
+        RETURN 'cities' AS facet, v.id AS vessel, c.id AS value
+        UNION
+        MATCH (l)-[:`Event.TransportEvent.TransponderPing`]->(v)
+        WHERE (v:`Entity.Vessel.CargoVessel` OR v:`Entity.Vessel.FishingVessel`) AND
+            (l:`Entity.Location.City` OR l:`Entity.Location.Point` OR l:`Entity.Location.Region`)
+        RETURN CASE
+            WHEN l:`Entity.Location.City` THEN 'cities'
+            WHEN l:`Entity.Location.Point` THEN 'ports'
+            ELSE 'regions' END AS facet,
+            v.id AS vessel, l.id AS value
+        """
+        with self.driver.session() as session:
+            try:
+                result = self._run(session, query)
+                return [(record["facet"], record["vessel"], record["value"]) for record in result]
+            except Exception as e:
+                print("Error fetching vessel facets:", e)
+                note_fetch_error()
+                return []
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Vessel <-> species links for the dropdown facet index, without fetching the deliveries: the distinct
+# (city, day, fish) of the delivery reports are attributed with the attribution engine, or joined to the harbor
+# reports and city pings in Cypher when it is disabled. A failed query is flagged with note_fetch_error().
+
+    def get_vessel_species_pairs(self):
+        attribution = self.attribution_index()
+        with self.driver.session() as session:
+            try:
+                if attribution is None:
+                    return [(record["vessel"], record["fish"]) for record in self._run(session, VESSEL_SPECIES_QUERY)]
+                keys = self._run(session, VESSEL_SPECIES_KEYS_QUERY).data()
+                harbor_vessels, ping_vessels = attribution.attribute([key["city"] for key in keys], [key["date"] for key in keys])
+                return list({(vessel, key["fish"]) for key, harbor, pings in zip(keys, harbor_vessels, ping_vessels)
+                             for vessel in harbor + pings if vessel is not None})
+            except Exception as e:
+                print("Error fetching vessel species:", e)
+                note_fetch_error()
+                return []
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Data version from the node and relationship counts (answered from the count store, no scan).
+# "neo4j-unknown" after a failed query is flagged with note_fetch_error() and not cached.
+
+    def get_data_version(self):
+        with self.driver.session() as session:
+            try:
+                nodes = self._run(session, "MATCH (n) RETURN count(n) AS count").single()["count"]
+                relationships = self._run(session, "MATCH ()-[r]->() RETURN count(r) AS count").single()["count"]
+                version = f"neo4j-{nodes}-{relationships}"
+            except Exception as e:
+                print("Error fetching data version:", e)
+                note_fetch_error()
+                return "neo4j-unknown"
+        if version != self._version:
+            # Re-imported or bootstrapped data: check the day keys and property types again, rebuild the index
+            self._version = version
+            self._day_keys = None
+            self._typed_dates = None
+            with self._transport_index_lock:
+                self._transport_index = None
+                self._transport_index_failed_at = None
+            with self._attribution_index_lock:
+                self._attribution_index = None
+        return version
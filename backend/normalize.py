@@ -0,0 +1,90 @@
+import threading
+from collections import Counter
+import pandas as pd
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Column-wise normalization of qty_tons and dates shared by the processing functions.
+# Values are parsed on whole arrays; rejected values are counted per field (get_rejected_counts)
+# and summarized in one line per call instead of a warning per row.
+
+# ***************************************************************************************
+
+_rejected = Counter()
+_rejected_lock = threading.Lock()
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Rejected value counts per (field, reason), e.g. ("qty_tons", "negative")
+
+def record_rejected(field, counts):
+    counts = {reason: int(count) for reason, count in counts.items() if count}
+    if not counts:
+        return
+    with _rejected_lock:
+        for reason, count in counts.items():
+            _rejected[(field, reason)] += count
+    print(f"Warning: {field}: " + ", ".join(f"{count} {reason}" for reason, count in counts.items()) + " values normalized")
+
+def get_rejected_counts():
+    with _rejected_lock:
+        return {f"{field}.{reason}": count for (field, reason), count in _rejected.items()}
+
+def reset_rejected_counts():
+    with _rejected_lock:
+        _rejected.clear()
+
+def _as_series(values):
+    return values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: qty_tons as float: comma decimals ("12,5") are parsed, missing and unparsable values become 0
+# and negative weights are clamped to 0. Returns a float Series (index kept when a Series is passed).
+# Numbers from a typed import (qty_tons:float) skip the string parsing.
+
+def normalize_qty_tons(values, field="qty_tons"):
+    series = _as_series(values)
+    if pd.api.types.is_numeric_dtype(series.infer_objects()):
+        numbers = series.astype(float)
+        missing = numbers.isna()
+        negative = numbers < 0
+        record_rejected(field, {"missing": missing.sum(), "negative": negative.sum()})
+        return numbers.where(~(missing | negative), 0.0)
+    missing = series.isna()
+    text = series.astype(str).str.strip().str.replace(",", ".", regex=False)
+    numbers = pd.to_numeric(text.where(~missing), errors="coerce")
+    invalid = numbers.isna() & ~missing
+    negative = numbers < 0
+    record_rejected(field, {"missing": missing.sum(), "invalid": invalid.sum(), "negative": negative.sum()})
+    return numbers.where(~(missing | invalid | negative), 0.0).astype(float)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Dates parsed to datetime64 (format=None accepts mixed formats), unparsable values become NaT.
+# canonical_dates gives 'YYYY-MM-DD' strings instead and keeps missing values as they are.
+
+def normalize_dates(values, format=None, field="date"):
+    series = _as_series(values)
+    missing = series.isna() | (series.astype(str) == "")
+    parsed = pd.to_datetime(series.where(~missing), format=format or "mixed", errors="coerce")
+    record_rejected(field, {"invalid": (parsed.isna() & ~missing).sum()})
+    return parsed
+
+def canonical_dates(values, format="%Y-%m-%d", field="date"):
+    series = _as_series(values)
+    parsed = normalize_dates(series, format=format, field=field)
+    missing = series.isna() | (series.astype(str) == "")
+    return parsed.dt.strftime("%Y-%m-%d").astype(object).where(parsed.notna(), None).where(~missing, series)
@@ -0,0 +1,89 @@
+import threading
+from collections import Counter
+from functools import lru_cache
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Parameterized Cypher builder for the dropdown queries and a counter of executions per query text.
+# Every filter combination of a getter maps to the same query text, filter values travel as $params,
+# so Neo4j plans each getter once and serves the rest from its query plan cache.
+
+# ***************************************************************************************
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Constant query text for a label scan with optional property filters.
+# Each filter becomes ($prop IS NULL OR n.prop IN $prop), so unused filters are switched off by a null parameter.
+
+@lru_cache(maxsize=None)
+def node_query_text(labels, filter_props, return_clause="n.id AS id", order_by="id"):
+    label_clause = " OR ".join(f"n:`{label}`" for label in labels)
+    conditions = "".join(f"\n    AND (${prop} IS NULL OR n.{prop} IN ${prop})" for prop in filter_props)
+    return f"""
+    MATCH (n)
+    WHERE ({label_clause}){conditions}
+    RETURN {return_clause}
+    ORDER BY {order_by}
+    """
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: A filter value as a list parameter (None when the filter is not set)
+
+def as_list_param(value):
+    if value is None or value == "" or value == []:
+        return None
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Build (query, params) for a dropdown getter, filters is {property: value}
+
+def build_node_query(labels, filters, return_clause="n.id AS id", order_by="id"):
+    query = node_query_text(tuple(labels), tuple(filters), return_clause, order_by)
+    params = {prop: as_list_param(value) for prop, value in filters.items()}
+    return query, params
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Count executions per query text, client side: how many distinct texts the backend sends and how
+# many executions repeat one of them. A repeated text can be served from the Neo4j plan cache, but whether it was
+# (or was evicted and replanned) is only visible in the server's own query metrics.
+
+_query_counts = Counter()
+_query_counts_lock = threading.Lock()
+
+def record_query(query):
+    with _query_counts_lock:
+        _query_counts[query] += 1
+
+def get_query_text_stats():
+    with _query_counts_lock:
+        executions = sum(_query_counts.values())
+        distinct = len(_query_counts)
+    repeated = executions - distinct
+    return {
+        "executions": executions,
+        "distinct_texts": distinct,
+        "repeated_executions": repeated,
+        "repeat_ratio": repeated / executions if executions else 0.0,
+    }
+
+def reset_query_text_stats():
+    with _query_counts_lock:
+        _query_counts.clear()
@@ -0,0 +1,140 @@
+import bisect
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import pandas as pd
+import config
+from backend.data_backend import note_fetch_error, reset_fetch_error, fetch_error_noted
+from backend.cache import register_cache
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Day segment cache for the date range queries in backend/dataserver.py.
+# Fetched rows are kept per day; a new range only queries its missing days (merged into
+# contiguous sub-intervals), so widening or sliding the date-picker window costs only the delta.
+
+# ***************************************************************************************
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Days 'YYYY-MM-DD' in [start_date, end_date) and the missing days grouped into [start, end) intervals
+
+def days_in_range(start_date, end_date):
+    day = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+    days = []
+    while day < end:
+        days.append(day.strftime('%Y-%m-%d'))
+        day += timedelta(days=1)
+    return days
+
+def missing_intervals(days, covered):
+    intervals = []
+    for day in days:
+        if day in covered:
+            continue
+        next_day = (datetime.strptime(day, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+        if intervals and intervals[-1][1] == day:
+            intervals[-1][1] = next_day
+        else:
+            intervals.append([day, next_day])
+    return [tuple(interval) for interval in intervals]
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Segment cache of one query. date_field is the (string) property the query filters on;
+# a row belongs to the day d with d <= value < d + 1, the same string comparison the query uses.
+# Results are DataFrames (frame=True) or lists of dicts, as returned by the backend.
+# Days of a failed query are not kept, and the failure stays flagged (note_fetch_error) for the caller's result cache.
+
+class SegmentCache:
+    def __init__(self, name, date_field, frame, max_days=None):
+        self.name = name
+        self.date_field = date_field
+        self.frame = frame
+        self.max_days = max_days or config.segment_cache_max_days
+        self.segments = OrderedDict()  # day -> rows of that day
+        self.version = None
+        self.lock = threading.Lock()
+        self.fetched_days = 0
+        self.reused_days = 0
+        # Cleared by invalidate_caches() and reported by get_cache_stats() with the result caches
+        register_cache("segments." + name, self)
+
+    # Split the rows of a fetched interval into its days
+    def split(self, rows, days):
+        if self.frame:
+            if rows.empty:
+                return {day: rows for day in days}
+            positions = [bisect.bisect_right(days, value) - 1 for value in rows[self.date_field].astype(str)]
+            grouped = rows.groupby(positions, sort=False)
+            return {day: grouped.get_group(i) if i in grouped.groups else rows.iloc[0:0] for i, day in enumerate(days)}
+        parts = {day: [] for day in days}
+        for row in rows:
+            parts[days[bisect.bisect_right(days, str(row.get(self.date_field))) - 1]].append(row)
+        return parts
+
+    def combine(self, parts):
+        if self.frame:
+            parts = [part for part in parts if not part.empty]
+            return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+        return [row for part in parts for row in part]
+
+    def fetch(self, query, start_date, end_date, version=None):
+        # Open ranges are not split into days
+        if not start_date or not end_date:
+            return query(start_date, end_date)
+
+        with self.lock:
+            if version != self.version:
+                self.segments.clear()
+                self.version = version
+
+            days = days_in_range(start_date, end_date)
+            intervals = missing_intervals(days, self.segments)
+            self.reused_days += len(days) - sum(len(days_in_range(start, end)) for start, end in intervals)
+            fetched = {}
+            # Any failed interval stays flagged for the caller (the result cache does not keep it)
+            failed = fetch_error_noted()
+            for start, end in intervals:
+                reset_fetch_error()
+                rows = query(start, end)
+                interval_days = days_in_range(start, end)
+                fetched.update(self.split(rows, interval_days))
+                # A failed query returns an empty fallback, it is used for this call but not kept
+                if fetch_error_noted():
+                    failed = True
+                    continue
+                self.fetched_days += len(interval_days)
+                for day in interval_days:
+                    self.segments[day] = fetched[day]
+
+            parts = []
+            for day in days:
+                if day in fetched:
+                    parts.append(fetched[day])
+                else:
+                    parts.append(self.segments[day])
+                    self.segments.move_to_end(day)
+            while len(self.segments) > self.max_days:
+                self.segments.popitem(last=False)
+            if failed:
+                note_fetch_error()
+            return self.combine(parts)
+
+    def clear(self):
+        with self.lock:
+            self.segments.clear()
+
+    def stats(self):
+        with self.lock:
+            return {"days": len(self.segments), "fetched_days": self.fetched_days, "reused_days": self.reused_days}
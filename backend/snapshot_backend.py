@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+import config
+from backend.data_backend import VESSEL_LABELS, LOCATION_LABELS
+from backend.event_snapshot import EventSnapshot
+from backend.attribution import AttributionIndex
+from backend.local_backend import LocalGraphBackend, vessel_harbor_reports, city_pings
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Backend on the columnar event snapshot written by backend/ETL_data/export_snapshot.py.
+# Only the node table and the daily rollups are loaded at start; event rows are memory-mapped from the day
+# partitions of each requested range, the query logic is the one of LocalGraphBackend.
+
+# ***************************************************************************************
+
+def _days_after(day, days):
+    return (datetime.strptime(day[:10], "%Y-%m-%d") + timedelta(days=days)).strftime("%Y-%m-%d")
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: LocalGraphBackend reading its event tables from the snapshot partitions
+
+class SnapshotBackend(LocalGraphBackend):
+    name = "snapshot"
+
+    def __init__(self, snapshot_dir=None):
+        self.snapshot = EventSnapshot(snapshot_dir or config.snapshot_dir)
+        self.data_version = "snapshot-" + self.snapshot.version
+        self._build_nodes(self.snapshot.read_frame("nodes"))
+        self.daily_rollups = self.snapshot.read_frame("daily_rollups")
+        self.daily_city_rollups = self.snapshot.read_frame("daily_city_rollups")
+        self.daily_species_rollups = self.snapshot.read_frame("daily_species_rollups")
+
+    def _range(self, table, start_date, end_date):
+        if table in ("delivery_reports", "deliveries"):
+            df = self.snapshot.read_frame("delivery_reports", start_date, end_date)
+            if table == "deliveries":
+                df = df[df["city_of_arrival"].notna() | df["fish_name"].notna()]
+        elif table in ("pings", "location_pings"):
+            df = self.snapshot.read_frame("transponder_pings", start_date, end_date)
+            if table == "location_pings":
+                df = df[df["start_label"].isin(LOCATION_LABELS) & df["end_label"].isin(VESSEL_LABELS)]
+        else:
+            df = vessel_harbor_reports(self.snapshot.read_frame("harbor_reports", start_date, end_date))
+        return df
+
+    def _attribution(self, start_date, end_date):
+        # Events of the whole days the attribution windows reach around the deliveries
+        harbor_window, ping_window = config.attribution_harbor_window_days, config.attribution_ping_window_days
+        harbor = self._range("harbor_reports", *self._window_range(start_date, end_date, harbor_window))
+        pings = city_pings(self._range("pings", *self._window_range(start_date, end_date, ping_window)))
+        return AttributionIndex(harbor, pings, harbor_window, ping_window)
+
+    def _window_range(self, start_date, end_date, window):
+        start = _days_after(start_date, min(window[0], 0)) if start_date else None
+        end = _days_after(end_date, max(window[1], 0) + 1) if end_date else None
+        return start, end
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: In-process temporal index of one relationship type (TransponderPings between locations and vessels).
+# Edges are kept in arrays sorted by timestamp (int64 nanoseconds) with source / target as int32 codes into node
+# tables and dwell as float, so a date window is found with two binary searches and sliced as views: O(log n + k).
+
+# ***************************************************************************************
+
+DAY_NS = 86400 * 10**9
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Node codes of one endpoint column, shared across batches: a code per node id plus the first
+# name (and vessel type) seen for it, as names and labels are node properties, equal on every edge.
+
+class _NodeCodes:
+    def __init__(self, *properties):
+        self.codes = {}
+        self.properties = [[] for _ in properties]
+
+    def encode(self, ids, *values):
+        # Factorize the batch, then map its distinct ids onto the shared codes
+        local, uniques = pd.factorize(ids.astype(object), use_na_sentinel=False)
+        first = np.unique(local, return_index=True)[1]
+        mapping = np.empty(len(uniques), dtype=np.int32)
+        for position, node in enumerate(uniques):
+            key = None if pd.isna(node) else node
+            if key not in self.codes:
+                self.codes[key] = len(self.codes)
+                for table, column in zip(self.properties, values):
+                    table.append(column.iat[first[position]])
+            mapping[position] = self.codes[key]
+        return mapping[local]
+
+    # Node ids and property tables as object arrays indexed by code
+    def tables(self):
+        arrays = []
+        for values in [list(self.codes)] + self.properties:
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+            arrays.append(array)
+        return arrays
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: Built batch by batch into preallocated arrays (from_batches) instead of from one concatenated frame
+# @Description: Index built from transport movement rows (the columns of get_transport_movements).
+# Rows whose time does not parse are left out, a date range never matches them.
+
+class TemporalEdgeIndex:
+    def __init__(self, df):
+        self._build([df] if not df.empty else [], len(df))
+
+    # Index of an iterable of row batches; capacity is the expected row count (the arrays grow past it),
+    # so the build holds the arrays and one batch, not every batch plus their concatenation
+    @classmethod
+    def from_batches(cls, batches, capacity=0):
+        index = cls.__new__(cls)
+        index._build(batches, capacity)
+        return index
+
+    def _build(self, batches, capacity):
+        times = np.empty(capacity, dtype=np.int64)
+        time_text = np.empty(capacity, dtype=object)
+        dwell = np.empty(capacity, dtype=float)
+        source_codes = np.empty(capacity, dtype=np.int32)
+        target_codes = np.empty(capacity, dtype=np.int32)
+        sources = _NodeCodes("source_location_name")
+        targets = _NodeCodes("vessel_name", "vessel_type")
+        size = 0
+        for df in batches:
+            batch_times = pd.to_datetime(df["start_time"], format="ISO8601", errors="coerce").to_numpy(dtype="datetime64[ns]").view(np.int64)
+            valid = batch_times != np.iinfo(np.int64).min  # NaT
+            rows = df[valid]
+            end = size + len(rows)
+            if end > len(times):
+                grown = max(end, 2 * len(times))
+                times, time_text, dwell, source_codes, target_codes = (
+                    np.resize(array, grown) for array in (times, time_text, dwell, source_codes, target_codes))
+            times[size:end] = batch_times[valid]
+            time_text[size:end] = rows["start_time"].astype(str).to_numpy(dtype=object)
+            dwell[size:end] = pd.to_numeric(rows["dwell"], errors="coerce").to_numpy(dtype=float)
+            source_codes[size:end] = sources.encode(rows["source_location"], rows["source_location_name"])
+            target_codes[size:end] = targets.encode(rows["vessel_id"], rows["vessel_name"], rows["vessel_type"])
+            size = end
+
+        # Sorted copies of the filled part, the preallocated arrays are released with this frame
+        order = np.argsort(times[:size], kind="stable")
+        self.times = times[:size][order]
+        self.time_text = time_text[:size][order]
+        self.dwell = dwell[:size][order]
+        self.source_codes = source_codes[:size][order]
+        self.target_codes = target_codes[:size][order]
+        self.sources, self.source_names = sources.tables()
+        self.targets, self.target_names, self.target_types = targets.tables()
+
+    def __len__(self):
+        return len(self.times)
+
+    # Positions [lo, hi) of the edges with start <= time < end (bounds as 'YYYY-MM-DD[ HH:MM:SS]', None = open)
+    def bounds(self, start_date, end_date):
+        lo = np.searchsorted(self.times, np.datetime64(pd.Timestamp(start_date), "ns").view(np.int64), side="left") if start_date else 0
+        hi = np.searchsorted(self.times, np.datetime64(pd.Timestamp(end_date), "ns").view(np.int64), side="left") if end_date else len(self.times)
+        return lo, max(lo, hi)
+
+    # Rows [lo, hi) in the layout of get_transport_movements (time as stored, dwell as float)
+    def frame(self, lo, hi):
+        sources = self.source_codes[lo:hi]
+        targets = self.target_codes[lo:hi]
+        return pd.DataFrame({
+            "source_location": self.sources[sources],
+            "source_location_name": self.source_names[sources],
+            "vessel_id": self.targets[targets],
+            "vessel_name": self.target_names[targets],
+            "vessel_type": self.target_types[targets],
+            "start_time": self.time_text[lo:hi],
+            "dwell": self.dwell[lo:hi],
+        })
+
+    def transport_movements(self, start_date, end_date):
+        lo, hi = self.bounds(start_date, end_date)
+        return self.frame(lo, hi) if hi > lo else pd.DataFrame()
+
+    # Distinct vessels per day in the window, one row per day with edges
+    def vessel_counts(self, start_date, end_date):
+        lo, hi = self.bounds(start_date, end_date)
+        if hi == lo:
+            return pd.DataFrame()
+        days = self.times[lo:hi] // DAY_NS
+        pairs = np.unique(days * len(self.targets) + self.target_codes[lo:hi])
+        day, num_vessels = np.unique(pairs // len(self.targets), return_counts=True)
+        dates = np.datetime_as_string((day * DAY_NS).astype("datetime64[ns]"), unit="D").astype(object)
+        return pd.DataFrame({"date": dates, "num_vessels": num_vessels})
@@ -5,8 +5,68 @@
 # @Last Modified time: 2025-01-15
 # @Description: configuration settings of the application
 
+import os
+import tempfile
+
 
 # Default Dates for Startup
 default_start_date = "2035-01-01"  # Default start date until updated
 default_end_date = "2035-02-28" # Default end date until updated
-min_date_allowed = "2035-01-01" # for the VAST challenge
\ No newline at end of file
+min_date_allowed = "2035-01-01" # for the VAST challenge
+
+# Data backend: "neo4j" queries the live database, "local" loads nodes.csv/relationships.csv into memory,
+# "snapshot" memory-maps the day-partitioned event snapshot
+data_backend = os.environ.get("DATA_BACKEND", "neo4j")
+# Folder holding the CSV files written by backend/ETL_data/convert_json_to_csv.py
+local_data_dir = os.environ.get("LOCAL_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend", "ETL_data"))
+# Folder holding the event snapshot written by backend/ETL_data/export_snapshot.py
+snapshot_dir = os.environ.get("SNAPSHOT_DIR", os.path.join(local_data_dir, "snapshot"))
+
+# Concurrent fetching in load_and_process_data
+query_max_workers = 6  # Bounded thread pool shared by all callbacks
+query_timeout_seconds = 30  # Per-query timeout, a slower query is dropped and its dataset left empty
+
+# Result cache for dataserver read functions (backend/cache.py)
+dimension_cache_ttl_seconds = 3600  # Dropdown lists, city mapping and fish distribution
+dimension_cache_size = 512
+range_cache_ttl_seconds = 600  # Date range queries
+range_cache_size = 8
+
+# Processed datasets kept server-side per (date range, data version) (backend/dataset_store.py)
+dataset_store_size = 8
+
+# Disk cache of the processed datasets shared by all worker processes (backend/disk_cache.py)
+disk_cache_enabled = os.environ.get("DISK_CACHE", "1") != "0"
+disk_cache_dir = os.environ.get("DISK_CACHE_DIR", os.path.join(tempfile.gettempdir(), "illegal_fishing_cache"))
+disk_cache_max_bytes = 512 * 1024 * 1024  # Least recently used entries are removed above this size
+disk_cache_lock_timeout_seconds = 300  # A compute lock older than this was left behind by a crashed worker
+
+# Day segment cache of the date range queries (backend/segment_cache.py)
+segment_cache_max_days = 400  # Days kept per query, least recently used days are dropped first
+
+# Streaming transport movements for wide date ranges (stream_transport_movements in backend/dataserver.py)
+transport_stream_min_days = 62  # Ranges spanning more days are streamed and aggregated per (date, location, vessel)
+transport_stream_batch_size = 20000  # Pings per batch (Neo4j fetch size)
+
+# In-process temporal index of the transport movement pings in the Neo4j backend (backend/temporal_index.py),
+# built once per data version; date ranges are then binary searches instead of relationship scans.
+# Opt-in: it holds every ping in memory, streamed wide ranges (iter_transport_movements) always query Neo4j
+temporal_index_enabled = os.environ.get("TEMPORAL_INDEX", "0") == "1"
+temporal_index_retry_seconds = 600  # After a failed build, ranges use Cypher until this passes or the data version changes
+
+# Delivery attribution in get_fish_deliveries (backend/attribution.py): day offsets [first, last] around the delivery day
+# The Neo4j backend builds the index once per data version instead of running the OPTIONAL MATCH query per range
+attribution_engine_enabled = os.environ.get("ATTRIBUTION_ENGINE", "1") != "0"
+attribution_harbor_window_days = (0, 1)  # Harbor reports of the delivery day or the day after
+attribution_ping_window_days = (0, 0)  # City pings of the delivery day
+
+# Network-link graph (backend/graph_utils.py): layout computed on the server and drawn with physics off,
+# delivery reports summarized into groups above the node budget
+graph_layout_seed = 42  # Seed of the NetworkX spring layout, the same graph always gets the same positions
+graph_layout_iterations = 50
+graph_layout_spacing = 60  # Pixels per node, the layout is scaled by spacing * sqrt(number of nodes)
+graph_layout_cache_size = 32  # Layouts kept per (date range, data version, filters)
+graph_position_memory_size = 50000  # Node positions remembered across layouts, so nodes stay in place between filters
+graph_state_cache_size = 256  # [id, digest] lists of drawn graphs kept for patching them, the browser only holds the key
+graph_node_budget = 500  # Above this many nodes delivery reports are drawn as (city, fish, week) groups
+graph_group_expand_limit = 200  # Delivery reports shown when a group node is expanded
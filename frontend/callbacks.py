@@ -2,15 +2,13 @@ from dash.dependencies import Input, Output, State, ALL
 from dash import dcc
 from dash import no_update
 from dash import ctx
-from backend.dataserver import ( get_geo_data, get_companies, get_vessels, get_cities, get_points, get_species, 
-    get_regions, fetch_delivery_qty_data, 
-    get_transport_movements, process_transport_movements, get_fish_deliveries, 
-    process_fish_deliveries, get_vessel_counts, prepare_temporal_dataframe, detect_anomalies, detect_fish_delivery_anomalies,
-    get_fish_distribution_data, fetch_vessel_cargo_data, preprocess_vessel_cargo_data) #, apply_kmeans_clustering
-from backend.graph_utils import ( create_empty_heatmap, create_interactive_graph, create_heatmap, create_treemap, create_empty_treemap)
+from backend.dataserver import ( get_geo_data, detect_fish_delivery_anomalies) #, apply_kmeans_clustering
+from backend.facet_index import get_dropdown_options
+from backend.dataset_store import get_dataset, load_processed_datasets
+from backend.graph_utils import ( create_empty_heatmap, create_cytoscape_elements, element_patch, group_expansion_patch,
+    expanded_elements, filter_fish_deliveries, graph_details, graph_element_details, graph_key, create_heatmap, create_treemap, create_empty_treemap)
 import plotly.express as px
 import plotly.graph_objects as go
-import json
 from shapely.geometry import Point, MultiPoint
 from shapely.geometry import Polygon, MultiPolygon
 from shapely.geometry.polygon import orient
@@ -35,6 +33,9 @@ def register_callbacks(app):
 # @Date: 2024-12-08
 # @Last Modified by:   undefined
 # @Last Modified time: 2024-12-08
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Options come from the facet index (backend/facet_index.py) so every dropdown cascades on all others
 # @Description: Callback function to dynamically populate dropdown menus based on user selections.
     
     @app.callback(
@@ -53,31 +54,12 @@ def register_callbacks(app):
         for key, value in filters.items():
             filter_store[key] = value
 
-        # Fetch updated data for each dropdown based on the current filter state
+        # Values in each dropdown that co-occur with the selections in all other dropdowns
+        options = get_dropdown_options(filters)
         dropdown_data = {
-            'companies': [
-                {'label': str(company), 'value': str(company)}
-                for company in get_companies(vessel=filters['vessels'])
-                if company is not None
-            ] if filters['vessels'] else [
-                {'label': str(company), 'value': str(company)}
-                for company in get_companies()
-                if company is not None
-            ],
-            'cities': [{'label': city, 'value': city} for city in get_cities()],
-            'ports': [{'label': port, 'value': port} for port in get_points()],
-            'regions': [{'label': region, 'value': region} for region in get_regions()],
-            'vessels': [
-                {'label': str(vessel), 'value': str(vessel)}
-                for vessel in get_vessels(company=filters['companies'])
-                if vessel is not None
-            ] if filters['companies'] else [
-                {'label': str(vessel), 'value': str(vessel)}
-                for vessel in get_vessels()
-                if vessel is not None
-            ],
-            'species': [{'label': species, 'value': species} for species in get_species()]
-        } 
+            key: [{'label': str(value), 'value': str(value)} for value in options[key] if value is not None]
+            for key in filter_mapping
+        }
         # Return selected values
         result = [dropdown_data.get(filter_key, []) for filter_key in filter_mapping]
         return result
@@ -107,6 +89,9 @@ def register_callbacks(app):
 # @Date: 2025-03-16
 # @Last Modified by:   undefined
 # @Last Modified time: 2025-03-16
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Reads its dataset from the server-side dataset store instead of parsing the JSON store
 # @Description: Handles callback to update the processed data store based on user cargo filter selections
  
     @app.callback(
@@ -119,16 +104,13 @@ def register_callbacks(app):
             # If no data is present, return an empty list of options
             return [], None
 
-        # Load and parse the processed data (if it's stored as a JSON string)
-        processed_data = json.loads(processed_data)
-        
-        # Extract matched_data and ensure 'cluster' is present
-        matched_data = processed_data.get('matched_data', [])
-        if not matched_data:
+        # Read matched_data from the server-side dataset store and ensure 'cluster' is present
+        matched_data = get_dataset(processed_data, 'matched_data')
+        if matched_data.empty or 'cluster' not in matched_data.columns:
             return [], None
 
         # Create unique clusters for the dropdown
-        clusters = sorted(set(item.get('cluster') for item in matched_data if 'cluster' in item))
+        clusters = sorted(int(cluster) for cluster in matched_data['cluster'].dropna().unique())
         if not clusters:
             # Handle case where no clusters are available
             return [], None
@@ -148,6 +130,9 @@ def register_callbacks(app):
 # @Last Modified by:   Asta Omarsdottir
 # @Last Modified time: 2024-12-19
 # @Last Modified time: 2025-03-01
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Reads its dataset from the server-side dataset store instead of parsing the JSON store
 # @Description: Handles callback with users filter selections for heatmap visualizing dwell time in locations over time
       
     @app.callback(
@@ -161,20 +146,11 @@ def register_callbacks(app):
         if not store_data:
             return {}  # Return an empty figure if no data
         
-        # Convert JSON string back into a dictionary
-        store_data_dict = json.loads(store_data)
-    
-        # Get transport movement data
-        transport_data = store_data_dict.get("transport_movements", [])
+        # Get transport movement data from the server-side dataset store
+        transport_df = get_dataset(store_data, "transport_movements")
         
-        if not transport_data:
+        if transport_df.empty:
             return create_empty_heatmap()  # Handle the case when no data is available
-
-        # Convert list of dictionaries to DataFrame
-        if transport_data:
-            transport_df = pd.DataFrame(transport_data)
-        else:
-            transport_df = pd.DataFrame()
             
          # Apply filters
         if filter_data:
@@ -449,6 +425,10 @@ def register_callbacks(app):
 # @Last Modified by:   Asta Omarsdottir
 # @Last Modified time: 2025-03-01
 # @Last Modified: Added transport movements to this graph
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Reads its dataset from the server-side dataset store instead of parsing the JSON store
+# @Last Modified: temporal_data has one row per day (daily rollups)
 # @Description: Generates and updates four different graphs based on time series analysis.
  
     @app.callback(
@@ -463,19 +443,13 @@ def register_callbacks(app):
         if not store_data:
             return go.Figure(), go.Figure(), go.Figure(), go.Figure()
 
-        # Convert JSON string to Python dictionary
-        if isinstance(store_data, str):  
-            store_data = json.loads(store_data)
-
-        temporal_data = store_data.get("temporal_data", [])
+        # Get temporal data from the server-side dataset store
+        temporal_df = get_dataset(store_data, "temporal_data")
         
         # Ensure temporal data exists
-        if not temporal_data:
+        if temporal_df.empty:
             return go.Figure(), go.Figure(), go.Figure(), go.Figure()
 
-        # Convert temporal data into DataFrame
-        temporal_df = pd.DataFrame(temporal_data)
-
         # Ensure the 'date' column is datetime
         temporal_df["date"] = pd.to_datetime(temporal_df["date"])
 
@@ -503,8 +477,8 @@ def register_callbacks(app):
             ))
             fig_time_series.update_layout(title="Time Serie Component",font=dict(size=8,variant="small-caps"), margin=dict(t=40, b=20, l=40, r=10),)
 
-        # Perform Time Series Decomposition
-        if len(temporal_df) >= 30:
+        # Perform Time Series Decomposition (seasonal_decompose needs two full 30 day cycles)
+        if len(temporal_df) >= 60:
             # Ensure there are no missing values in 'qty_tons' and 'num_vessels' columns
             temporal_df['qty_tons']= temporal_df['qty_tons'].fillna(0)
             temporal_df['num_vessels'] = temporal_df['num_vessels'].fillna(0)
@@ -572,6 +546,9 @@ def register_callbacks(app):
 # @Last Modified by:   Asta Omarsdottir 
 # @Last Modified time: 2024-11-13
 # @Last Modified: Moved from matching vessel cargo.py with some changes
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Reads its dataset from the server-side dataset store instead of parsing the JSON store
 # @Description: Handles users cluster selection and generates and updates the cluster graph based on filter selections. 
     
     @app.callback(
@@ -594,22 +571,15 @@ def register_callbacks(app):
         if not isinstance(selected_clusters, list):
             selected_clusters = [selected_clusters]
             
-        # Check if store_data is a string and parse it
-        if isinstance(store_data, str):
-            store_data = json.loads(store_data)  # Convert JSON string to dictionary    
-            
-        # Extract matched_data and use it in your layout
-        matched_data = store_data.get("matched_data", [])
+        # Extract matched_data from the server-side dataset store
+        matched_data = get_dataset(store_data, "matched_data")
         
-        if not matched_data:
+        if matched_data.empty:
             # Return a placeholder figure if matched_data is empty
             return px.scatter(
                 title="No matched data found",
                 labels={'x': 'Exit Date', 'y': 'Quantity (Tons)'}
             )
-        
-        # Convert matched_data to a pandas DataFrame
-        matched_data = pd.DataFrame(matched_data)
     
         # Ensure 'cluster' column exists
         if 'cluster' not in matched_data.columns:
@@ -644,6 +614,9 @@ def register_callbacks(app):
 # @Last Modified time: 2025-03-02
 # @Modified: Added filter data to the function and updated the function to handle the filter data
 # @Modified: Added store_data as an input to the function
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Reads its dataset from the server-side dataset store instead of parsing the JSON store
 # @Description: Handles user filter selections and create/updates graph to analyse fish quantity and seasonal trends 
     
     @app.callback(
@@ -658,25 +631,16 @@ def register_callbacks(app):
                 labels={'qty_tons': 'Quantity (Tons)', 'date_of_arrival': 'Date'}
             )
             
-        if isinstance(store_data, str):
-            try:
-                store_data = json.loads(store_data)
-            except json.JSONDecodeError:
-                print("Error: Failed to decode JSON data!")
-                return px.scatter(
-                    title="Error: Invalid Data",
-                    labels={'qty_tons': 'Quantity (Tons)', 'date_of_arrival': 'Date'}
-                )  
-            
-        # Check if 'fish_deliveries' exists in store_data
-        if "fish_deliveries" not in store_data or not store_data["fish_deliveries"]:
+        # Get fish deliveries from the server-side dataset store
+        fish_deliveries = get_dataset(store_data, "fish_deliveries")
+        if fish_deliveries.empty:
             return px.scatter(
                 title="No fish deliveries available",
                 labels={'qty_tons': 'Quantity (Tons)', 'date_of_arrival': 'Date'}
             )
             
         # Apply anomaly detection function
-        fish_df = detect_fish_delivery_anomalies(store_data)
+        fish_df = detect_fish_delivery_anomalies({"fish_deliveries": fish_deliveries})
         if fish_df.empty:
             return px.scatter(
             title="No fish deliveries available",
@@ -732,6 +696,9 @@ def register_callbacks(app):
 # @Date: 2024-12-26
 # @Last Modified by:   undefined
 # @Last Modified time: 2024-12-26
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Reads its dataset from the server-side dataset store instead of parsing the JSON store
 # @Description: Handles callback for Treemap showing fish quantity by city, fish or vessel
    
     @app.callback(
@@ -743,18 +710,12 @@ def register_callbacks(app):
         if not store_data:
             return {}  # Return an empty figure if no data
 
-        # Convert JSON string back into a dictionary
-        store_data_dict = json.loads(store_data)
-        
-        # Get treemap data
-        treemap_data = store_data_dict.get("fish_deliveries", [])
+        # Get treemap data from the server-side dataset store
+        treemap_df = get_dataset(store_data, "fish_deliveries")
 
-        if not treemap_data:
+        if treemap_df.empty:
             return create_empty_treemap()  # Handle the case when no data is available
 
-        # Convert list of dictionaries to DataFrame
-        treemap_df = pd.DataFrame(treemap_data) if treemap_data else pd.DataFrame()
-
         # Ensure 'harbor_vessels' and 'ping_vessels' are lists, avoiding NaN issues
         treemap_df["harbor_vessels"] = treemap_df["harbor_vessels"].apply(lambda x: x if isinstance(x, list) else [])
         treemap_df["ping_vessels"] = treemap_df["ping_vessels"].apply(lambda x: x if isinstance(x, list) else [])
@@ -812,6 +773,10 @@ def register_callbacks(app):
 # @Date: 2025-01-16
 # @Last Modified by:   undefined
 # @Last Modified time: 2025-01-16
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: The six independent fetches run concurrently with per-query timeouts (backend/fanout.py)
+# @Last Modified: Processed datasets stay server-side, processed-data-store only holds their key (backend/dataset_store.py)
 # @Description: Load and process data dynamically when date range changes
     
     # Callback to load and process data dynamically
@@ -821,118 +786,69 @@ def register_callbacks(app):
     )
     def load_and_process_data(calendar_data):
         if not calendar_data:
-            return json.dumps({})
+            return {}
 
         # Extract dates from the calendar store
         start_date = calendar_data.get("start_datetime")
         end_date = calendar_data.get("end_datetime")
         
-        # Fetch and process transport movement data for heatmap
-        raw_transport_data = get_transport_movements(start_date, end_date)
-        processed_transport_data = process_transport_movements(raw_transport_data) 
-    
-        # Fetch and process fish delivery data for Network-Link graph (pyvis)
-        raw_fish_data = get_fish_deliveries(start_date, end_date)
-        processed_fish_data = process_fish_deliveries(raw_fish_data)
-        
-        # Fetch and process delivery qty data for temporal and seasonal graph
-        delivery_qty_data = fetch_delivery_qty_data(start_date, end_date)
-        
-        # Fetch and process vessel data for temporal and seasonal graph  
-        vessel_count_data = get_vessel_counts(start_date, end_date)
-        
-        # Prepare temporal data (combined delivery_qty_data and vessel_count_data)
-        temporal_df = prepare_temporal_dataframe(delivery_qty_data, vessel_count_data)
-        
-        # Detect anomalies in temporal data (combined fish deliveries and vessel counts)
-        temporal_df = detect_anomalies(temporal_df)
-        
-        # Convert datetime columns to string to make them JSON serializable
-        if 'date' in temporal_df.columns:
-            temporal_df['date'] = temporal_df['date'].astype(str)
-            
-        # Fetch and process fish distribution data for treemap
-        fish_distribution_data = get_fish_distribution_data()
-        
-        # Fetch and process data for cluster-plot
-        deliveries, exits = fetch_vessel_cargo_data(start_date, end_date)
-        matched_data = preprocess_vessel_cargo_data(deliveries, exits)
-        
-        # Convert matched_data to a DataFrame if necessary and handle empty cases
-        if isinstance(matched_data, list):
-            if matched_data: 
-                matched_data = pd.DataFrame(matched_data)
-            else:
-                matched_data = pd.DataFrame()
-
-        # Store all datasets in a dictionary
-        processed_data = {
-            "transport_movements": processed_transport_data.to_dict("records") if isinstance(processed_transport_data, pd.DataFrame) else [],
-            "fish_deliveries": processed_fish_data,
-            "temporal_data": temporal_df.to_dict("records") if isinstance(temporal_df, pd.DataFrame) else [],
-            "fish_distribution": fish_distribution_data,
-            "matched_data": matched_data.to_dict("records") if not matched_data.empty else []
-        }
-        return json.dumps(processed_data)
+        # Datasets are computed and kept server-side (backend/dataset_store.py),
+        # the store only receives the key {start_datetime, end_datetime, version}
+        return load_processed_datasets(start_date, end_date)
     
 # @Author: Asta Omarsdottir
 # @Email: asta.omarsdottir@gmail.com
 # @Date: 2025-03-01
 # @Last Modified by:   undefined
 # @Last Modified time: 2025-03-01
-# @Description: Callback to update the pyvis graph based on selected filters and graph type
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Reads its dataset from the server-side dataset store instead of parsing the JSON store
+# @Last Modified: Node positions cached per (dataset key, filters), see cached_layout
+# @Last Modified: "Clustered Data" draws the summarized graph (delivery reports grouped per city, fish and week)
+# @Last Modified: Draws into the cytoscape network-graph; only added, removed and changed elements are sent (Patch)
+# @Last Modified: Layout key from graph_key
+# @Last Modified: network-graph-state holds only the key of the drawn elements' digests, kept server-side
+# @Description: Callback to update the network graph based on selected filters and graph type
 
     @app.callback(
-        Output('pyvis-graph', 'srcDoc'),
+        [
+            Output('network-graph', 'elements'),
+            Output('network-graph-state', 'data')
+        ],
         [
             Input('filter-store', 'data'),
             Input('calendar-store', 'data'),
             Input('graph-type', 'value'),
             Input('processed-data-store', 'data')
-        ]
+        ],
+        State('network-graph-state', 'data')
     )
-    def update_interactive_graph(filter_data, calendar_data, selected_graph, store_data):
+    def update_interactive_graph(filter_data, calendar_data, selected_graph, store_data, graph_state):
         if not selected_graph:
             print("graph_type not selected, returning empty graph.")
-            return "<h3 style='color:white;'>Waiting for selecting graph type...</h3>"
+            return [], None
         
-        # Ensure store_data is parsed as a dictionary
-        if isinstance(store_data, str):
-            try:
-                store_data = json.loads(store_data)
-            except json.JSONDecodeError:
-                print("Error: Failed to decode JSON data!")
-                return "<h3 style='color:white;'>Error: Invalid Data</h3>"
-            
         # Extract start and end datetime safely
         start_datetime = datetime.strptime(calendar_data.get('start_datetime', '2035-01-01 00:00:00'), '%Y-%m-%d %H:%M:%S')
         end_datetime = datetime.strptime(calendar_data.get('end_datetime', '2035-02-28 23:59:59'), '%Y-%m-%d %H:%M:%S')
 
-        # Extract fish delivery data
-        fish_delivery_data = store_data.get("fish_deliveries", [])
+        # Extract fish delivery data from the server-side dataset store
+        fish_delivery_data = get_dataset(store_data, "fish_deliveries").to_dict("records")
         
         if not fish_delivery_data:
             print("No fish deliveries found in processed data!")
-            return ""
-
-        # Extract filter options
-        selected_cities = filter_data.get('cities', []) if filter_data else []
-        selected_vessels = filter_data.get('vessels', []) if filter_data else []
-        selected_fish_types = filter_data.get('species', []) if filter_data else []
+            return [], None
 
         # Ensure both are date objects
         start_date = start_datetime.date()
         end_date = end_datetime.date()
 
-        filtered_data = [
-            record for record in fish_delivery_data
-            if (not selected_cities or record.get("city_of_arrival") in selected_cities)
-            and (not selected_vessels or any(vessel in selected_vessels for vessel in record.get("harbor_vessels", [])) 
-                or any(vessel in selected_vessels for vessel in record.get("ping_vessels", [])))
-            and (not selected_fish_types or record.get("fish_name") in selected_fish_types)
-        ]
+        # Filter options applied by filter_fish_deliveries (shared with the group expansion and tooltip callbacks)
+        filtered_data = filter_fish_deliveries(fish_delivery_data, filter_data)
         
-        # To do: Implement the selected graph type
+        # "clustered" always draws delivery reports as (city, fish, week) groups,
+        # "raw" only when the graph has more nodes than config.graph_node_budget
         #Apply clustering if "clustered" is selected
         # if selected_graph == "clustered":
         #     clustered_data = apply_kmeans_clustering(filtered_data)  # Apply clustering
@@ -940,7 +856,73 @@ def register_callbacks(app):
         #     graph_html = create_interactive_graph(clustered_data)
         # else:        
             # Generate the filtered graph
-        graph_html = create_interactive_graph(filtered_data)
+        # Same dataset (date range + data version) and filters -> same node positions
+        layout_key = graph_key(store_data, filter_data, selected_graph)
+        elements = create_cytoscape_elements(filtered_data, layout_key=layout_key, summarize=True if selected_graph == "clustered" else None)
 
-        return graph_html
+        return element_patch(graph_state, elements)
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: A state key this worker does not know sends the rebuilt graph with the group expanded
+# @Description: Clicking a group node of the summarized network graph replaces it by its delivery reports
+
+    @app.callback(
+        [
+            Output('network-graph', 'elements', allow_duplicate=True),
+            Output('network-graph-state', 'data', allow_duplicate=True)
+        ],
+        Input('network-graph', 'tapNode'),
+        [
+            State('network-graph-state', 'data'),
+            State('filter-store', 'data'),
+            State('graph-type', 'value'),
+            State('processed-data-store', 'data')
+        ],
+        prevent_initial_call=True
+    )
+    def expand_graph_group(tap_node, graph_state, filter_data, selected_graph, store_data):
+        if not tap_node or "members" not in tap_node.get("data", {}):
+            return no_update, no_update
+        update = group_expansion_patch(graph_state, tap_node)
+        if update is not None:
+            return update
+        fish_delivery_data = filter_fish_deliveries(get_dataset(store_data, "fish_deliveries").to_dict("records"), filter_data)
+        elements = create_cytoscape_elements(fish_delivery_data, layout_key=graph_key(store_data, filter_data, selected_graph),
+                                             summarize=True if selected_graph == "clustered" else None)
+        return element_patch(None, expanded_elements(elements, tap_node))
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Last Modified: Built from the dataset store records of the element, so any worker can answer
+# @Last Modified: Looked up in the tooltip index of the dataset key and filters (graph_details), built once
+# @Description: Show the details of the node or edge under the mouse below the network graph,
+# built on the server from the records of the current dataset and filters
+
+    @app.callback(
+        Output('network-graph-info', 'children'),
+        [
+            Input('network-graph', 'mouseoverNodeData'),
+            Input('network-graph', 'mouseoverEdgeData')
+        ],
+        [
+            State('filter-store', 'data'),
+            State('processed-data-store', 'data')
+        ],
+        prevent_initial_call=True
+    )
+    def show_graph_element_info(node_data, edge_data, filter_data, store_data):
+        data = node_data if "network-graph.mouseoverNodeData" in ctx.triggered_prop_ids else edge_data
+        if not data:
+            return ""
+        # The tooltip index of the drawn dataset and filters, built on the first hover and then looked up
+        details = graph_details(graph_key(store_data, filter_data, None), lambda: filter_fish_deliveries(
+            get_dataset(store_data, "fish_deliveries").to_dict("records"), filter_data))
+        return graph_element_details(details, data)
     
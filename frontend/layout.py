@@ -1,4 +1,6 @@
 from dash import html, dcc
+import dash_cytoscape as cyto
+from backend.graph_utils import CYTOSCAPE_STYLESHEET
 from config import default_start_date, default_end_date, min_date_allowed
 
 # @Author: Asta Omarsdottir
@@ -6,6 +8,11 @@ from config import default_start_date, default_end_date, min_date_allowed
 # @Date: 2024-12-01
 # @Last Modified by:   Asta Omarsdottir
 # @Last Modified time: 2025-01-08
+# @Last Modified by:   Group 3
+# @Last Modified time: 2026-10-18
+# @Last Modified: Network-link graph drawn with dash_cytoscape (network-graph) instead of the pyvis iframe
+# @Last Modified: network-graph stylesheet from backend/graph_utils.py (elements only carry a class)
+# @Last Modified: network-graph-state holds the key of the drawn elements' digests (None until the first draw)
 # @Description: Creates and handles frontend layout
 
 # Layouten
@@ -61,11 +68,19 @@ def create_layout():
                                 clearable=False,
                                 style={"width": "50%"}
                             ),
-                            html.Iframe(
-                                id='pyvis-graph',
-                                srcDoc="",  # This will be dynamically updated via callback
-                                style={'width': '95%', 'height': '80%', 'border': 'none'}
-                            )
+                            # Graph elements sent as data and updated with partial (Patch) updates, see update_interactive_graph
+                            cyto.Cytoscape(
+                                id='network-graph',
+                                elements=[],
+                                layout={"name": "preset"},  # Positions computed on the server (backend/graph_utils.py)
+                                autoRefreshLayout=False,
+                                stylesheet=CYTOSCAPE_STYLESHEET,  # Colors and shapes per element class
+                                style={'width': '95%', 'height': '75%'}
+                            ),
+                            # Details of the node or edge under the mouse, fetched from the server on hover
+                            html.Pre(id='network-graph-info', style={"fontSize": "10px", "margin": "0", "minHeight": "5%"}),
+                            # [id, digest] of the elements the browser has, for the incremental updates
+                            dcc.Store(id='network-graph-state', data=None)
                         ]
                     ),
                     html.Div(
@@ -0,0 +1,59 @@
+import os
+import sys
+import pandas as pd
+import pytest
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Shared pytest fixtures. The repository root is put on sys.path so the tests import
+# backend.* and config the way app.py does; no Neo4j server is needed.
+
+# ***************************************************************************************
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: A small graph in the neo4j-admin import format of convert_json_to_csv.py (nodes.csv, relationships.csv).
+# Three DeliveryReports: r1 (City of A, Cod, "1,5" tons on 01-02), r2 (City of B, Cod, a negative weight on 01-03)
+# and r3 (City of A, no fish, an unparsable weight on 01-03); harbor reports and pings around them.
+
+NODES = [
+    {":ID": "City of A", ":LABEL": "Entity.Location.City", "id": "City of A", "Name": "A"},
+    {":ID": "City of B", ":LABEL": "Entity.Location.City", "id": "City of B", "Name": "B"},
+    {":ID": "Point1", ":LABEL": "Entity.Location.Point", "id": "Point1", "Name": "Point1"},
+    {":ID": "Cod", ":LABEL": "Entity.Commodity.Fish", "id": "Cod", "name": "Cod"},
+    {":ID": "v1", ":LABEL": "Entity.Vessel.FishingVessel", "id": "v1", "Name": "V1", "company": "Co1"},
+    {":ID": "v2", ":LABEL": "Entity.Vessel.CargoVessel", "id": "v2", "Name": "V2"},
+    {":ID": "r1", ":LABEL": "Entity.Document.DeliveryReport", "id": "r1", "date": "2035-01-02", "qty_tons": "1,5"},
+    {":ID": "r2", ":LABEL": "Entity.Document.DeliveryReport", "id": "r2", "date": "2035-01-03", "qty_tons": "-2"},
+    {":ID": "r3", ":LABEL": "Entity.Document.DeliveryReport", "id": "r3", "date": "2035-01-03", "qty_tons": "abc"},
+]
+
+RELATIONSHIPS = [
+    ("r1", "City of A", "Event.Transaction", {"date": "2035-01-02"}),
+    ("r1", "Cod", "Event.Transaction", {"date": "2035-01-02"}),
+    ("r2", "City of B", "Event.Transaction", {"date": "2035-01-03"}),
+    ("r2", "Cod", "Event.Transaction", {"date": "2035-01-03"}),
+    ("r3", "City of A", "Event.Transaction", {"date": "2035-01-03"}),
+    # v1 reports to A the day after r1 (inside the harbor window), v2 to B two days after r2 (outside)
+    ("v1", "City of A", "Event.HarborReport", {"date": "2035-01-03"}),
+    ("v2", "City of B", "Event.HarborReport", {"date": "2035-01-05"}),
+    ("City of A", "v2", "Event.TransportEvent.TransponderPing", {"time": "2035-01-02T08:00:00", "dwell": "10"}),
+    ("Point1", "v1", "Event.TransportEvent.TransponderPing", {"time": "2035-01-03T09:00:00", "dwell": "5"}),
+    ("City of B", "v1", "Event.TransportEvent.TransponderPing", {"time": "2035-01-03T10:00:00", "dwell": "2.5"}),
+]
+
+@pytest.fixture
+def import_dir(tmp_path):
+    pd.DataFrame(NODES).to_csv(tmp_path / "nodes.csv", index=False)
+    rows = [{":START_ID": start, ":END_ID": end, ":TYPE": rel_type, "source": start, "target": end, **props}
+            for start, end, rel_type, props in RELATIONSHIPS]
+    pd.DataFrame(rows).to_csv(tmp_path / "relationships.csv", index=False)
+    return tmp_path
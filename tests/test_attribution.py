@@ -0,0 +1,41 @@
+import pandas as pd
+from backend.attribution import AttributionIndex
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Day windows of AttributionIndex.attribute: harbor reports of the delivery day or the day after,
+# pings of the delivery day, vessels in event order
+
+# ***************************************************************************************
+
+HARBOR = pd.DataFrame({
+    "source": ["v1", "v2", "v3", "v4"],
+    "target": ["A", "A", "A", "B"],
+    "date": ["2035-01-02", "2035-01-03", "2035-01-04", "2035-01-02"],
+})
+PINGS = pd.DataFrame({
+    "source": ["A", "A", "B"],
+    "target": ["v5", "v6", "v7"],
+    "time": ["2035-01-02T23:59:59", "2035-01-03T00:00:00", "2035-01-02T12:00:00"],
+})
+
+def test_default_windows():
+    index = AttributionIndex(HARBOR, PINGS)
+    harbor, pings = index.attribute(["A", "B"], ["2035-01-02", "2035-01-02"])
+    assert harbor == [["v1", "v2"], ["v4"]]
+    assert pings == [["v5"], ["v7"]]
+
+def test_custom_windows():
+    index = AttributionIndex(HARBOR, PINGS, harbor_window=(-1, 0), ping_window=(0, 1))
+    harbor, pings = index.attribute(["A"], ["2035-01-03"])
+    assert harbor == [["v1", "v2"]]
+    assert pings == [["v6"]]
+
+def test_unknown_city_and_bad_date():
+    index = AttributionIndex(HARBOR, PINGS)
+    harbor, pings = index.attribute(["C", "A", None], ["2035-01-02", "not a date", "2035-01-02"])
+    assert harbor == [[], [], []]
+    assert pings == [[], [], []]
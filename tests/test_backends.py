@@ -0,0 +1,91 @@
+import os
+import pandas as pd
+import pytest
+import config
+from backend.data_backend import normalize_date_range
+from backend.local_backend import LocalGraphBackend
+from backend.snapshot_backend import SnapshotBackend
+from backend.backend_parity import canonical, compare_backends, parity_cases
+from backend.ETL_data.export_snapshot import export_snapshot
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: The local backend on the import fixture of conftest.py, and parity of the backends on the
+# queries of backend/backend_parity.py: the snapshot exported from the fixture always, the live Neo4j database
+# against the import files in config.local_data_dir when it is reachable.
+
+# ***************************************************************************************
+
+@pytest.fixture
+def local_backend(import_dir):
+    return LocalGraphBackend(str(import_dir))
+
+@pytest.fixture
+def snapshot_backend(local_backend, tmp_path):
+    export_snapshot(local_backend, str(tmp_path / "snapshot"))
+    return SnapshotBackend(str(tmp_path / "snapshot"))
+
+def frame_records(df):
+    return df.reset_index(drop=True).to_dict("records")
+
+def test_normalize_date_range():
+    assert normalize_date_range("2035-01-02 00:00:00", "2035-01-31 23:59:59") == ("2035-01-02", "2035-02-01")
+    assert normalize_date_range("2035-12-31", "2035-12-31") == ("2035-12-31", "2036-01-01")
+    assert normalize_date_range(None, "2035-01-02") == (None, "2035-01-03")
+    assert normalize_date_range("2035-01-02", None) == ("2035-01-02", None)
+
+def test_fish_deliveries_attribution(local_backend):
+    deliveries = {row["deliveryreport_name"]: row for row in local_backend.get_fish_deliveries(None, None)}
+    assert set(deliveries) == {"r1", "r2", "r3"}
+    assert deliveries["r1"]["city_of_arrival"] == "City of A" and deliveries["r1"]["fish_name"] == "Cod"
+    assert deliveries["r1"]["harbor_vessels"] == ["v1"] and deliveries["r1"]["ping_vessels"] == ["v2"]
+    assert deliveries["r2"]["harbor_vessels"] == [] and deliveries["r2"]["ping_vessels"] == ["v1"]
+    assert deliveries["r3"]["fish_name"] is None and deliveries["r3"]["harbor_vessels"] == ["v1"]
+
+def test_daily_series(local_backend):
+    # Invalid and negative weights count as 0 tons, the Point ping counts as a vessel on 01-03
+    assert local_backend.fetch_delivery_qty_data(None, None) == [
+        {"date": "2035-01-02", "qty_tons": 1.5}, {"date": "2035-01-03", "qty_tons": 0.0}]
+    assert frame_records(local_backend.get_vessel_counts(None, None)) == [
+        {"date": "2035-01-02", "num_vessels": 1}, {"date": "2035-01-03", "num_vessels": 1}]
+    assert local_backend.fetch_delivery_qty_data(*normalize_date_range("2035-01-03", "2035-01-03")) == [
+        {"date": "2035-01-03", "qty_tons": 0.0}]
+
+def test_ranges_are_end_exclusive(local_backend):
+    movements = local_backend.get_transport_movements("2035-01-02", "2035-01-03")
+    assert movements["vessel_id"].tolist() == ["v2"]
+    assert local_backend.get_fish_deliveries("2035-01-04", "2035-01-05") == []
+
+def test_dropdowns_and_facets(local_backend):
+    assert local_backend.get_vessels() == ["v1", "v2"]
+    assert local_backend.get_vessels(company="Co1") == ["v1"]
+    assert local_backend.get_cities() == ["City of A", "City of B"]
+    assert sorted(local_backend.get_vessel_species_pairs()) == [("v1", "Cod"), ("v2", "Cod")]
+
+@pytest.mark.parametrize("start_date, end_date", [(None, None), ("2035-01-02", "2035-01-02"), ("2035-01-03", "2035-01-10")])
+def test_snapshot_matches_local(local_backend, snapshot_backend, start_date, end_date):
+    for name, method, kwargs in parity_cases(start_date, end_date):
+        expected = canonical(getattr(local_backend, method)(**kwargs))
+        assert canonical(getattr(snapshot_backend, method)(**kwargs)) == expected, name
+
+def test_snapshot_transport_movements_in_order(local_backend, snapshot_backend):
+    pd.testing.assert_frame_equal(snapshot_backend.get_transport_movements(None, None).reset_index(drop=True),
+                                  local_backend.get_transport_movements(None, None).reset_index(drop=True))
+
+# Runs when the configured Neo4j database answers and the import files it was loaded from are in local_data_dir
+def test_neo4j_matches_local():
+    if not os.path.exists(os.path.join(config.local_data_dir, "nodes.csv")):
+        pytest.skip(f"no import files in {config.local_data_dir}")
+    from backend.neo4j_backend import Neo4jBackend
+    neo4j_backend = Neo4jBackend()
+    try:
+        try:
+            neo4j_backend.driver.verify_connectivity()
+        except Exception as e:
+            pytest.skip(f"Neo4j not reachable: {e}")
+        assert compare_backends("2035-01-01", "2035-12-31", neo4j_backend, LocalGraphBackend()) == []
+    finally:
+        neo4j_backend.close()
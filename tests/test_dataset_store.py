@@ -0,0 +1,56 @@
+import pandas as pd
+import pytest
+from backend import dataset_store
+from backend.data_backend import note_fetch_error
+from backend.fanout import run_concurrently
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Backend failures are caught inside the backends (note_fetch_error and an empty result), they still
+# have to mark the dataset partial so it is not kept in the dataset store
+
+# ***************************************************************************************
+
+def failing_fetch(*args):
+    note_fetch_error()
+    return []
+
+# The fetches of compute_processed_datasets on small fixed data, get_fish_deliveries failing like a backend does
+@pytest.fixture
+def failing_deliveries(monkeypatch):
+    monkeypatch.setattr(dataset_store, "transport_movements_for_range", lambda start, end: pd.DataFrame())
+    monkeypatch.setattr(dataset_store, "get_fish_deliveries", failing_fetch)
+    monkeypatch.setattr(dataset_store, "temporal_inputs_for_range", lambda start, end: ([], pd.DataFrame()))
+    monkeypatch.setattr(dataset_store, "get_fish_distribution_data", lambda: [])
+    monkeypatch.setattr(dataset_store, "fetch_vessel_cargo_data", lambda start, end: (pd.DataFrame(), pd.DataFrame()))
+
+def test_noted_fetch_error_yields_default():
+    results, failed = run_concurrently({"ok": (lambda: [1], []), "failing": (failing_fetch, ["default"])})
+    assert results == {"ok": [1], "failing": ["default"]}
+    assert failed == ["failing"]
+    # The flag does not leak into the next task on the same pool thread
+    assert run_concurrently({"ok": (lambda: [2], [])}) == ({"ok": [2]}, [])
+
+def test_noted_fetch_error_makes_datasets_partial(failing_deliveries):
+    datasets = dataset_store.compute_processed_datasets("2035-01-01 00:00:00", "2035-01-31 23:59:59")
+    assert datasets["partial"] == ["fish_deliveries"]
+
+def test_partial_datasets_are_not_stored(failing_deliveries, monkeypatch):
+    monkeypatch.setattr(dataset_store.config, "disk_cache_enabled", False)
+    store_key = {"start_datetime": "2035-01-01 00:00:00", "end_datetime": "2035-01-31 23:59:59", "version": "test-partial"}
+    assert dataset_store.get_processed_datasets(store_key)["partial"] == ["fish_deliveries"]
+    assert dataset_store._key_tuple(store_key) not in dataset_store._store
+
+def test_partial_datasets_are_not_written_to_disk(failing_deliveries, monkeypatch, tmp_path):
+    monkeypatch.setattr(dataset_store.config, "disk_cache_enabled", True)
+    monkeypatch.setattr(dataset_store.config, "disk_cache_dir", str(tmp_path))
+    store_key = {"start_datetime": "2035-01-01 00:00:00", "end_datetime": "2035-01-31 23:59:59", "version": "test-disk"}
+    assert dataset_store.load_or_compute_datasets(store_key)["partial"] == ["fish_deliveries"]
+    assert dataset_store.load_datasets(store_key) is None
+    # Once the fetch succeeds the datasets are written and read back by the next load
+    monkeypatch.setattr(dataset_store, "get_fish_deliveries", lambda start, end: [])
+    assert dataset_store.load_or_compute_datasets(store_key)["partial"] == []
+    assert dataset_store.load_datasets(store_key) is not None
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+from dash import Patch
+from backend.graph_utils import GraphDetails, create_cytoscape_elements, element_patch, graph_element_details, heatmap_matrix
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Incremental network-graph updates (element_patch), hover tooltips (GraphDetails) and the dwell heatmap matrix
+
+# ***************************************************************************************
+
+def node(node_id, size=10):
+    return {"data": {"id": node_id, "size": size}}
+
+def operations(patch):
+    return [(op["operation"], op["location"]) for op in patch.to_plotly_json()["operations"]]
+
+def test_element_patch_unknown_state_sends_full_list():
+    elements = [node("a"), node("b")]
+    value, state = element_patch(None, elements)
+    assert value == elements and state
+    value, _ = element_patch("not-a-known-state", elements)
+    assert value == elements
+
+def test_element_patch_changes_removes_and_appends():
+    _, state = element_patch(None, [node(name) for name in "abcdef"])
+    elements = [node("a"), node("b", size=20), node("d"), node("e"), node("f"), node("g")]
+    patch, new_state = element_patch(state, elements)
+    assert isinstance(patch, Patch)
+    assert operations(patch) == [("Assign", [1]), ("Delete", [2]), ("Extend", [])]
+    # The browser now has a, b, d, e, f, g: sending the same list again changes nothing
+    patch, _ = element_patch(new_state, elements)
+    assert operations(patch) == []
+
+def test_element_patch_full_list_when_not_smaller():
+    _, state = element_patch(None, [node("a"), node("b")])
+    elements = [node("c"), node("d")]
+    value, _ = element_patch(state, elements)
+    assert value == elements
+
+# City and fish names containing the " | " of the group labels
+DELIVERIES = [
+    {"delivery_report_name": "d1", "date_of_arrival": "2035-01-02", "city_of_arrival": "A | B", "fish_name": "C",
+     "quantity_tons": 1.25, "harbor_vessels": ["v1"], "ping_vessels": []},
+    {"delivery_report_name": "d2", "date_of_arrival": "2035-01-03", "city_of_arrival": "A", "fish_name": "B | C",
+     "quantity_tons": 2.0, "harbor_vessels": ["v1"], "ping_vessels": ["v2"]},
+]
+
+def test_graph_details_of_raw_graph():
+    details = GraphDetails(DELIVERIES)
+    assert graph_element_details(details, {"id": "d1"}) == "Cargo: d1\nArrival: 2035-01-02\nCity: A | B\nFish Type: C\nFish qty: 1.25"
+    assert graph_element_details(details, {"id": "d2->B | C", "source": "d2", "target": "B | C"}) == (
+        "Delivery: d2\nArrival: 2035-01-03\nFish: B | C\nQty: 2.0 tons")
+    assert graph_element_details(details, {"id": "v1"}) == "Harbor Vessel: v1\nDeliveries: 2\nQty: 3.25 tons"
+    assert graph_element_details(details, {"id": "C->v1", "source": "C", "target": "v1"}) == (
+        "Fish: C\nHarbor: v1\nDeliveries: 1\nQty: 1.25 tons")
+    assert graph_element_details(details, {"id": "nothing"}) == "nothing"
+
+def test_graph_details_of_groups_with_separator_in_names():
+    details = GraphDetails(DELIVERIES)
+    elements = create_cytoscape_elements(DELIVERIES, summarize=True)
+    groups = [element["data"] for element in elements if element.get("classes") == "group"]
+    assert sorted(tuple(group["group"]) for group in groups) == [
+        ("A", "B | C", "week of 2035-01-01"), ("A | B", "C", "week of 2035-01-01")]
+    for group in groups:
+        city, fish, period = group["group"]
+        assert graph_element_details(details, group).startswith(f"Deliveries: 1\nPeriod: {period}\nCity: {city}\nFish Type: {fish}\n")
+    edges = [element["data"] for element in elements if element["data"].get("group") and "source" in element["data"]]
+    assert len(edges) == 4
+    for edge in edges:
+        assert graph_element_details(details, edge).startswith("Deliveries: 1\n")
+
+def test_heatmap_matrix():
+    data = pd.DataFrame({
+        "date": ["2035-01-01T08:00:00", "2035-01-03", "2035-01-01", "bad", "2035-01-03"],
+        "location_id": ["B", "A", "B", "A", "A"],
+        "dwell": [1.0, 2.0, "3", 100.0, None],
+    })
+    z, dates, locations = heatmap_matrix(data)
+    assert dates == ["2035-01-01", "2035-01-02", "2035-01-03"]
+    assert locations == ["A", "B"]
+    np.testing.assert_array_equal(z, [[0.0, 0.0, 2.0], [4.0, 0.0, 0.0]])
+
+def test_heatmap_matrix_without_valid_dates():
+    z, dates, locations = heatmap_matrix(pd.DataFrame({"date": ["bad"], "location_id": ["A"], "dwell": [1.0]}))
+    assert z.shape == (0, 0) and dates == [] and locations == []
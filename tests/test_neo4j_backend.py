@@ -0,0 +1,74 @@
+import pytest
+import config
+from backend.neo4j_backend import Neo4jBackend, TRANSPORT_PING_COUNT_QUERY
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Neo4jBackend logic that needs no server, on a driver answering the count queries and failing the
+# temporal index build
+
+# ***************************************************************************************
+
+class FakeResult:
+    def __init__(self, count):
+        self.count = count
+
+    def single(self):
+        return {"count": self.count}
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query, **params):
+        self.driver.queries.append(query)
+        if query == TRANSPORT_PING_COUNT_QUERY:
+            raise RuntimeError("connection lost")
+        return FakeResult(self.driver.count)
+
+class FakeDriver:
+    def __init__(self):
+        self.queries = []
+        self.count = 1
+
+    def session(self, **kwargs):
+        return FakeSession(self)
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(config, "temporal_index_enabled", True)
+    backend = Neo4jBackend()
+    backend.driver.close()
+    backend.driver = FakeDriver()
+    return backend
+
+def test_failed_index_build_is_not_retried(backend, monkeypatch):
+    builds = lambda: backend.driver.queries.count(TRANSPORT_PING_COUNT_QUERY)
+    assert backend.transport_index() is None
+    assert backend.transport_index() is None
+    assert builds() == 1
+    # Retried once the backoff has passed
+    monkeypatch.setattr(config, "temporal_index_retry_seconds", 0)
+    assert backend.transport_index() is None
+    assert builds() == 2
+
+def test_failed_index_build_is_retried_on_new_version(backend):
+    builds = lambda: backend.driver.queries.count(TRANSPORT_PING_COUNT_QUERY)
+    backend.get_data_version()
+    assert backend.transport_index() is None
+    backend.driver.count = 2
+    backend.get_data_version()
+    assert backend.transport_index() is None
+    assert builds() == 2
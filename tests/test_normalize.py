@@ -0,0 +1,24 @@
+import math
+import pandas as pd
+from backend.normalize import normalize_qty_tons, get_rejected_counts, reset_rejected_counts
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: qty_tons normalization of string (untyped import) and numeric (typed import) values
+
+# ***************************************************************************************
+
+def test_qty_tons_strings():
+    reset_rejected_counts()
+    values = normalize_qty_tons(["1,5", "2.5", None, "abc", "-1", " 3 "])
+    assert values.tolist() == [1.5, 2.5, 0.0, 0.0, 0.0, 3.0]
+    assert get_rejected_counts() == {"qty_tons.missing": 1, "qty_tons.invalid": 1, "qty_tons.negative": 1}
+
+def test_qty_tons_numbers_keep_index():
+    reset_rejected_counts()
+    values = normalize_qty_tons(pd.Series([4.0, -2.0, math.nan], index=["a", "b", "c"]), field="cargo")
+    assert values.to_dict() == {"a": 4.0, "b": 0.0, "c": 0.0}
+    assert get_rejected_counts() == {"cargo.missing": 1, "cargo.negative": 1}
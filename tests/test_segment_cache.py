@@ -0,0 +1,65 @@
+import pandas as pd
+from backend.data_backend import note_fetch_error, reset_fetch_error, fetch_error_noted
+from backend.segment_cache import SegmentCache, days_in_range, missing_intervals
+
+# @Author: Group 3
+# @Email:
+# @Date: 2026-10-18
+# @Last Modified by:   undefined
+# @Last Modified time: 2026-10-18
+# @Description: Day splitting of SegmentCache and the intervals it queries for a range
+
+# ***************************************************************************************
+
+ROWS = [
+    {"date": "2035-01-01", "n": 1},
+    {"date": "2035-01-02T10:00:00", "n": 2},
+    {"date": "2035-01-02T23:59:59", "n": 3},
+    {"date": "2035-01-04", "n": 4},
+]
+
+# Query over ROWS recording the [start, end) intervals it was asked for
+def recording_query(calls):
+    def query(start_date, end_date):
+        calls.append((start_date, end_date))
+        return [row for row in ROWS if start_date <= row["date"] < end_date]
+    return query
+
+def test_days_and_missing_intervals():
+    days = days_in_range("2035-01-30", "2035-02-03")
+    assert days == ["2035-01-30", "2035-01-31", "2035-02-01", "2035-02-02"]
+    assert missing_intervals(days, {"2035-01-31"}) == [("2035-01-30", "2035-01-31"), ("2035-02-01", "2035-02-03")]
+
+def test_split_rows_and_frames():
+    days = ["2035-01-01", "2035-01-02", "2035-01-03", "2035-01-04"]
+    parts = SegmentCache("test_split_rows", "date", frame=False).split(ROWS, days)
+    assert [[row["n"] for row in parts[day]] for day in days] == [[1], [2, 3], [], [4]]
+    frames = SegmentCache("test_split_frames", "date", frame=True).split(pd.DataFrame(ROWS), days)
+    assert [frames[day]["n"].tolist() for day in days] == [[1], [2, 3], [], [4]]
+
+def test_fetch_queries_only_missing_days():
+    calls = []
+    cache = SegmentCache("test_fetch", "date", frame=False)
+    query = recording_query(calls)
+    assert [row["n"] for row in cache.fetch(query, "2035-01-01", "2035-01-03", "v1")] == [1, 2, 3]
+    assert [row["n"] for row in cache.fetch(query, "2035-01-02", "2035-01-05", "v1")] == [2, 3, 4]
+    assert calls == [("2035-01-01", "2035-01-03"), ("2035-01-03", "2035-01-05")]
+    # A new data version drops the kept days
+    cache.fetch(query, "2035-01-02", "2035-01-03", "v2")
+    assert calls[-1] == ("2035-01-02", "2035-01-03")
+
+def test_failed_fetch_is_not_kept():
+    calls = []
+    cache = SegmentCache("test_failed", "date", frame=False)
+
+    def failing(start_date, end_date):
+        calls.append((start_date, end_date))
+        note_fetch_error()
+        return []
+
+    reset_fetch_error()
+    assert cache.fetch(failing, "2035-01-01", "2035-01-03") == []
+    assert fetch_error_noted()
+    reset_fetch_error()
+    assert [row["n"] for row in cache.fetch(recording_query(calls), "2035-01-01", "2035-01-03")] == [1, 2, 3]
+    assert calls == [("2035-01-01", "2035-01-03"), ("2035-01-01", "2035-01-03")]